@@ -24,16 +24,23 @@ from __future__ import annotations
 PLUGIN_VERSION_TIMESTAMP = "2026-01-20 01:45"
 
 import traceback
+import bisect
+import gzip
 import json
+import mimetypes
 import os
 import platform
+import queue
 import re
+import shutil
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Platform detection
 IS_WINDOWS = platform.system() == "Windows"
@@ -83,7 +90,7 @@ USE_TKINTER = False
 # Try tkinter first (preferred for consistency across Windows/Mac)
 try:
     import tkinter as tk  # type: ignore
-    from tkinter import ttk, messagebox, scrolledtext  # type: ignore
+    from tkinter import ttk, messagebox, scrolledtext, filedialog  # type: ignore
     USE_TKINTER = True
     QtCore = None  # type: ignore
     QtGui = None  # type: ignore
@@ -134,10 +141,26 @@ except ImportError:
                     QtGui = None  # type: ignore
                     QtWidgets = None  # type: ignore
 
+import contextlib
+import http.client
+import io
 import urllib.request
 import urllib.error
 import urllib.parse
 
+# Optional faster JSON decoder for API payloads; Resolve's bundled Python usually won't have it
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data: Any) -> Any:
+    """json.loads that uses orjson when installed (accepts str or UTF-8 bytes)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
 
 # Platform-specific default paths
 if IS_WINDOWS:
@@ -156,18 +179,34 @@ else:
 
 LOG_PATH_DEFAULT = os.path.join(UTILITY_DIR_DEFAULT, "concepto_resolve_sync_gui.log")
 
+# How often queued GUI log lines are flushed to the log widget
+LOG_FLUSH_INTERVAL_MS = 100
+
+
+# One line-buffered append handle shared by all threads, instead of mkdir + open + close per message
+_log_file_lock = threading.Lock()
+_log_file: Optional[Any] = None
+_log_file_path: Optional[str] = None
+
 
 def _log_to_file(msg: str) -> None:
+    global _log_file, _log_file_path
     # Also print to Resolve console/stdout (helps when GUI log is missed)
     try:
         print(msg.rstrip(), flush=True)
     except Exception:
         pass
     try:
-        p = Path(os.environ.get("CONCEPTO_RESOLVE_LOG", LOG_PATH_DEFAULT))
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with open(p, "a", encoding="utf-8") as f:
-            f.write(msg.rstrip() + "\n")
+        path = os.environ.get("CONCEPTO_RESOLVE_LOG", LOG_PATH_DEFAULT)
+        with _log_file_lock:
+            if _log_file is None or _log_file_path != path:
+                if _log_file is not None:
+                    _log_file.close()
+                    _log_file = None
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                _log_file = open(path, "a", encoding="utf-8", buffering=1)
+                _log_file_path = path
+            _log_file.write(msg.rstrip() + "\n")
     except Exception:
         # last resort: ignore
         pass
@@ -190,10 +229,34 @@ if not USE_PYSIDE:
     QtWidgets = _DummyQtWidgets()
 
 
+# Image extensions we treat as "still" main assets (placed on video tracks like clips)
+_IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+_IMAGE_EXT_SET = frozenset(_IMAGE_EXTS)
+
+# Take ids like SC01T06, optionally wrapped as "[SC01T06]" in subtitle text; compiled once because
+# they run per timeline item / subtitle in the sync workers.
+_TAKE_RE = re.compile(r"(SC\d{2}T\d{2})")
+_TAKE_RE_I = re.compile(r"(SC\d{2}T\d{2})", re.IGNORECASE)
+_TAKE_PARTS_RE = re.compile(r"SC(\d{2})T(\d{2})", re.IGNORECASE)
+# The strip patterns capture the take id too, so one sub() both finds and removes tags (_split_take_tag).
+# Whitespace before the id is bounded: an unbounded leading \s* is retried from every position of a
+# long whitespace run (quadratic); everything after the id only runs once a tag has matched.
+_TAKE_SUB_RE = re.compile(r"\[?\s{0,8}(SC\d{2}T\d{2})\s*\]?\s*", re.IGNORECASE)
+_TAKE_TAG_STRIP_RE = re.compile(r"\[?\s{0,8}(SC\d{2}T\d{2})\s*\]?\s*-?\s*", re.IGNORECASE)
+
+_SLUG_BAD_CHARS_RE = re.compile(r"[<>:\"/\\|?*\x00-\x1f]")
+_SLUG_SPACES_RE = re.compile(r"\s+")
+
+# Resolve timecodes "HH:MM:SS:FF" (";" before the frames on drop-frame timelines)
+_TC_RE = re.compile(r"(\d+):(\d+):(\d+)([:;])(\d+)")
+
+
+@lru_cache(maxsize=4096)
 def _safe_slug(s: str) -> str:
+    # Cached: the same take/track/clip names are slugged over and over while matching clips
     s = s.strip()
-    s = re.sub(r"[<>:\"/\\|?*\x00-\x1f]", "_", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _SLUG_BAD_CHARS_RE.sub("_", s)
+    s = _SLUG_SPACES_RE.sub(" ", s).strip()
     return s[:120] if len(s) > 120 else s
 
 
@@ -234,6 +297,14 @@ def _method(obj: Any, name: str):
     return fn if fn is not None and callable(fn) else None
 
 
+def _name(obj: Any, default: str = "") -> str:
+    """obj.GetName(), or `default` for objects without one (no per-call lambda/getattr default)."""
+    try:
+        return obj.GetName()
+    except AttributeError:
+        return default
+
+
 def _seconds_to_timecode(seconds: float, fps: float) -> str:
     if fps <= 0:
         fps = 24.0
@@ -251,6 +322,22 @@ def _seconds_to_frames(seconds: float, fps: float) -> int:
     return int(round(seconds * fps))
 
 
+# Marker note linking a timeline clip back to its Concepto shot. Same text json.dumps() of the dict
+# would give, but only the per-take values are encoded.
+_MARKER_NOTE_TEMPLATE = '{{"concepto": true, "episodeId": {}, "segmentId": {}, "shotId": {}, "take": {}, "clipId": {}}}'
+_json_value = json.JSONEncoder().encode
+
+
+def _marker_note(episode_id: Any, segment_id: Any, shot_id: Any, take: str, clip_id: str) -> str:
+    return _MARKER_NOTE_TEMPLATE.format(
+        _json_value(episode_id), _json_value(segment_id), _json_value(shot_id), _json_value(take), _json_value(clip_id)
+    )
+
+
+# Concurrent asset downloads; the transfers are network-bound so a small pool is plenty.
+_DOWNLOAD_WORKERS = 8
+
+
 @dataclass
 class PluginConfig:
     api_endpoint: str = "http://localhost:3000/api/external"
@@ -258,6 +345,7 @@ class PluginConfig:
     show_id: str = ""
     episode_id: str = ""
     download_root: str = DOWNLOAD_ROOT_DEFAULT
+    max_parallel_downloads: int = _DOWNLOAD_WORKERS
 
     @staticmethod
     def path() -> Path:
@@ -283,6 +371,7 @@ class PluginConfig:
                     show_id=data.get("show_id", ""),
                     episode_id=data.get("episode_id", ""),
                     download_root=data.get("download_root", DOWNLOAD_ROOT_DEFAULT),
+                    max_parallel_downloads=int(data.get("max_parallel_downloads") or _DOWNLOAD_WORKERS),
                 )
             except Exception:
                 pass
@@ -299,6 +388,7 @@ class PluginConfig:
                     "show_id": self.show_id,
                     "episode_id": self.episode_id,
                     "download_root": self.download_root,
+                    "max_parallel_downloads": self.max_parallel_downloads,
                 },
                 indent=2,
             ),
@@ -306,6 +396,14 @@ class PluginConfig:
         )
 
 
+def _read_response_body(resp: Any) -> bytes:
+    """Read a urllib response body, transparently gunzipping it if the server compressed it."""
+    raw = resp.read()
+    if (resp.headers.get("Content-Encoding") or "").lower() == "gzip":
+        raw = gzip.decompress(raw)
+    return raw
+
+
 class ConceptoClient:
     def __init__(self, endpoint: str, api_key: str):
         self.endpoint = endpoint.rstrip("/")
@@ -315,6 +413,8 @@ class ConceptoClient:
         headers = {
             "X-API-Key": self.api_key,
             "Accept": "application/json",
+            # Episode payloads (full avScript + avPreviewData) compress very well
+            "Accept-Encoding": "gzip",
         }
         data = None
         if body is not None:
@@ -324,14 +424,17 @@ class ConceptoClient:
         req = urllib.request.Request(url, data=data, headers=headers, method=method.upper())
         try:
             with urllib.request.urlopen(req, timeout=30) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
-                return json.loads(raw)
+                # _json_loads takes the UTF-8 bytes directly (no intermediate str copy)
+                return _json_loads(_read_response_body(resp))
         except urllib.error.HTTPError as e:
-            raw = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
+            raw = _read_response_body(e).decode("utf-8", errors="replace") if hasattr(e, "read") else ""
             try:
-                return json.loads(raw) if raw else {"success": False, "error": f"HTTP {e.code}"}
+                payload = _json_loads(raw) if raw else {"success": False, "error": f"HTTP {e.code}"}
             except Exception:
-                return {"success": False, "error": f"HTTP {e.code}", "details": raw[:300]}
+                payload = {"success": False, "error": f"HTTP {e.code}", "details": raw[:300]}
+            if isinstance(payload, dict):
+                payload.setdefault("httpStatus", e.code)
+            return payload
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -352,6 +455,19 @@ class ConceptoClient:
         if not payload.get("success"):
             raise RuntimeError(payload.get("error", "Failed to update shot"))
 
+    def update_shots_bulk(self, episode_id: str, updates: Dict[str, Dict[str, Any]]) -> Optional[List[str]]:
+        """
+        Apply {shotId: {field: value}} for one episode in a single request.
+        Returns the shot IDs the server could not find in the episode ([] if all were updated), or None
+        when the server has no bulk endpoint (404/405) so callers can fall back to update_shot().
+        """
+        payload = self._request_json("POST", f"{self.endpoint}/episodes/{episode_id}/shots", {"updates": updates})
+        if payload.get("success"):
+            return list((payload.get("data") or {}).get("missing") or [])
+        if payload.get("httpStatus") in (404, 405) and payload.get("code") != "NOT_FOUND":
+            return None
+        raise RuntimeError(payload.get("error", "Failed to update shots"))
+
     def update_video_clip_start_times(self, episode_id: str, video_clip_start_times: Dict[str, float]) -> None:
         payload = self._request_json(
             "PUT",
@@ -361,51 +477,57 @@ class ConceptoClient:
         if not payload.get("success"):
             raise RuntimeError(payload.get("error", "Failed to update av-preview"))
 
-    def upload_audio_clip(self, episode_id: str, audio_file_path: str) -> str:
-        """Upload audio file and return URL"""
-        import mimetypes
+    def upload_audio_clip(self, episode_id: str, audio_file_path: str, filename: Optional[str] = None) -> str:
+        """Upload audio file and return URL (`filename` overrides the name sent with the file)"""
         url = f"{self.endpoint}/episodes/{episode_id}/audio-clips"
         
-        # Read file
-        with open(audio_file_path, "rb") as f:
-            file_data = f.read()
+        filename = filename or os.path.basename(audio_file_path)
         
         # Determine content type
-        content_type, _ = mimetypes.guess_type(audio_file_path)
+        content_type, _ = mimetypes.guess_type(filename)
         if not content_type:
             content_type = "audio/mpeg"
         
         # Create multipart form data
         boundary = f"----WebKitFormBoundary{os.urandom(16).hex()}"
-        filename = os.path.basename(audio_file_path)
         
-        body_parts = []
-        body_parts.append(f"--{boundary}".encode())
-        body_parts.append(f'Content-Disposition: form-data; name="audio"; filename="{filename}"'.encode())
-        body_parts.append(f"Content-Type: {content_type}".encode())
-        body_parts.append(b"")
-        body_parts.append(file_data)
-        body_parts.append(f"--{boundary}--".encode())
+        # Stream the file between the multipart header and trailer instead of reading it into memory
+        # (master WAVs can be hundreds of MB); Content-Length is known up front from the file size.
+        head = b"\r\n".join([
+            f"--{boundary}".encode(),
+            f'Content-Disposition: form-data; name="audio"; filename="{filename}"'.encode(),
+            f"Content-Type: {content_type}".encode(),
+            b"",
+            b"",
+        ])
+        tail = f"\r\n--{boundary}--".encode()
+        file_size = os.path.getsize(audio_file_path)
         
-        body = b"\r\n".join(body_parts)
+        def body():
+            yield head
+            with open(audio_file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(_UPLOAD_CHUNK_SIZE), b""):
+                    yield chunk
+            yield tail
         
         headers = {
             "X-API-Key": self.api_key,
             "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(head) + file_size + len(tail)),
         }
         
-        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+        req = urllib.request.Request(url, data=body(), headers=headers, method="POST")
         try:
             with urllib.request.urlopen(req, timeout=120) as resp:  # Longer timeout for large files
                 raw = resp.read().decode("utf-8", errors="replace")
-                payload = json.loads(raw)
+                payload = _json_loads(raw)
                 if not payload.get("success"):
                     raise RuntimeError(payload.get("error", "Failed to upload audio"))
                 return payload["data"]["url"]
         except urllib.error.HTTPError as e:
             raw = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
             try:
-                payload = json.loads(raw) if raw else {"error": f"HTTP {e.code}"}
+                payload = _json_loads(raw) if raw else {"error": f"HTTP {e.code}"}
                 raise RuntimeError(payload.get("error", f"HTTP {e.code}"))
             except Exception:
                 raise RuntimeError(f"HTTP {e.code}: {raw[:300]}")
@@ -465,7 +587,6 @@ class ConceptoClient:
         mode: str = "replace",
     ) -> str:
         """Upload image file to a shot and return URL"""
-        import mimetypes
         url = f"{self.endpoint}/shots/{shot_id}/images"
 
         with open(image_file_path, "rb") as f:
@@ -514,14 +635,14 @@ class ConceptoClient:
         try:
             with urllib.request.urlopen(req, timeout=120) as resp:
                 raw = resp.read().decode("utf-8", errors="replace")
-                payload = json.loads(raw)
+                payload = _json_loads(raw)
                 if not payload.get("success"):
                     raise RuntimeError(payload.get("error", "Failed to upload image"))
                 return payload["data"].get("mainImage") or payload["data"].get("url") or ""
         except urllib.error.HTTPError as e:
             raw = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
             try:
-                payload = json.loads(raw) if raw else {"error": f"HTTP {e.code}"}
+                payload = _json_loads(raw) if raw else {"error": f"HTTP {e.code}"}
                 raise RuntimeError(payload.get("error", f"HTTP {e.code}"))
             except Exception:
                 raise RuntimeError(f"HTTP {e.code}: {raw[:300]}")
@@ -536,7 +657,6 @@ class ConceptoClient:
         set_main: bool = True,
     ) -> str:
         """Upload video file to a shot and return URL"""
-        import mimetypes
         url = f"{self.endpoint}/shots/{shot_id}/videos"
 
         with open(video_file_path, "rb") as f:
@@ -590,19 +710,238 @@ class ConceptoClient:
         try:
             with urllib.request.urlopen(req, timeout=180) as resp:
                 raw = resp.read().decode("utf-8", errors="replace")
-                payload = json.loads(raw)
+                payload = _json_loads(raw)
                 if not payload.get("success"):
                     raise RuntimeError(payload.get("error", "Failed to upload video"))
                 return payload["data"].get("videoUrl") or payload["data"].get("url") or ""
         except urllib.error.HTTPError as e:
             raw = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
             try:
-                payload = json.loads(raw) if raw else {"error": f"HTTP {e.code}"}
+                payload = _json_loads(raw) if raw else {"error": f"HTTP {e.code}"}
                 raise RuntimeError(payload.get("error", f"HTTP {e.code}"))
             except Exception:
                 raise RuntimeError(f"HTTP {e.code}: {raw[:300]}")
 
 
+# Read size when streaming an audio file into its upload request
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Audio clips are small and their uploads mostly wait on the server, so more can be in flight at once
+_AUDIO_UPLOAD_WORKERS = 8
+
+
+def _upload_shot_media(
+    client: ConceptoClient, episode_id: str, kind: str, shot: Dict[str, Any], seg: Dict[str, Any], file_path: str
+) -> str:
+    """Upload a MAIN-track file as the shot's video or image (mode=replace); returns the new URL."""
+    if kind == "video":
+        return client.upload_shot_video(shot.get("id"), file_path, episode_id, seg.get("id"), mode="replace", set_main=True)
+    return client.upload_shot_image(shot.get("id"), file_path, episode_id, seg.get("id"), mode="replace")
+
+
+def _upload_audio_tracks(
+    client: ConceptoClient,
+    episode_id: str,
+    audio_tracks: List[Dict[str, Any]],
+    pending: List[Tuple[Dict[str, Any], str, str]],
+    log: Callable[[str], None],
+    prefix: str,
+) -> List[Dict[str, Any]]:
+    """
+    Upload the source files of `pending` [(clip dict, file path, upload filename)] concurrently and set each clip's "url".
+    A file used by several clips (same path, size and mtime) is uploaded once and its URL shared.
+    Returns `audio_tracks` without the clips whose upload failed (and without tracks left empty).
+    """
+    # Fingerprint -> index into `unique`; slot[i] is the unique upload pending[i] waits on
+    unique: List[Tuple[str, str]] = []
+    seen: Dict[Tuple[Any, ...], int] = {}
+    slot: List[int] = []
+    for _clip, path, name in pending:
+        try:
+            st = os.stat(path)
+            key: Tuple[Any, ...] = (_path_key(path), st.st_size, st.st_mtime_ns)
+        except OSError:
+            key = (_path_key(path),)
+        if key not in seen:
+            seen[key] = len(unique)
+            unique.append((path, name))
+        slot.append(seen[key])
+    if len(unique) < len(pending):
+        log(f"{prefix}: {len(pending) - len(unique)} clip(s) reuse an already queued source file")
+    uploaded: List[Any] = [None] * len(unique)
+    if unique:
+        with ThreadPoolExecutor(max_workers=min(_AUDIO_UPLOAD_WORKERS, len(unique))) as pool:
+            futures = {
+                pool.submit(client.upload_audio_clip, episode_id, path, filename=name): i
+                for i, (path, name) in enumerate(unique)
+            }
+            for fut in as_completed(futures):
+                try:
+                    uploaded[futures[fut]] = fut.result()
+                except Exception as e:
+                    uploaded[futures[fut]] = e
+    results = [uploaded[i] for i in slot]
+    for (clip, _path, _name), result in zip(pending, results):
+        if isinstance(result, BaseException):
+            log(f"{prefix}: ✗ Failed to upload '{clip['name']}': {result}")
+            clip["url"] = None
+        else:
+            clip["url"] = result
+            log(f"{prefix}: ✓ Uploaded '{clip['name']}' -> {result}")
+    kept: List[Dict[str, Any]] = []
+    for track in audio_tracks:
+        track["clips"] = [c for c in track["clips"] if c.get("url")]
+        if track["clips"]:
+            kept.append(track)
+    return kept
+
+
+def _export_audio_tracks(
+    client: ConceptoClient,
+    episode_id: str,
+    timeline: Any,
+    a_tracks: int,
+    fps: float,
+    tl_start_sec: float,
+    log: Callable[[str], None],
+    prefix: str,
+) -> List[Dict[str, Any]]:
+    """
+    Read every clip on the timeline's audio tracks 1..`a_tracks` and upload their source files to the episode.
+    Returns the AV Preview audioTracks entries; clips that can't be read or uploaded are left out.
+    """
+    tl_start_frame = int(round(tl_start_sec * fps))
+    export_stamp = int(time.time())  # one timestamp for every clip/track ID in this export
+    audio_tracks: List[Dict[str, Any]] = []
+    pending: List[Tuple[Dict[str, Any], str, str]] = []  # (clip entry, source file, upload filename)
+    clip_props_cache: Dict[str, Dict[str, Any]] = {}  # media pool ID -> clip properties
+    dir_listings: Dict[str, Optional[set]] = {}  # source folder -> file names
+
+    # Bound once: each attribute lookup on a Resolve object is its own round trip
+    get_track_items = timeline.GetItemListInTrack
+    get_track_name = _method(timeline, "GetTrackName")
+    for track_idx in range(1, a_tracks + 1):
+        items = get_track_items("audio", track_idx) or []
+        if not items:
+            continue
+
+        track_name = f"Audio {track_idx}"
+        try:
+            if get_track_name:
+                name_result = get_track_name("audio", track_idx)
+                if name_result:
+                    track_name = name_result
+        except Exception:
+            pass
+
+        log(f"{prefix}: Processing audio track {track_idx}: '{track_name}' ({len(items)} clips)")
+        clips_data: List[Dict[str, Any]] = []
+        track_slug = _safe_slug(track_name)  # same for every clip's export filename
+
+        for item_idx, item in enumerate(items):
+            try:
+                item_name = _name(item, "(unknown)")
+                start_frame = _item_start_frame(item)
+                dur_frame = _item_duration_frames(item)
+                if start_frame is None or dur_frame is None:
+                    log(f"{prefix}: Skipping audio clip '{item_name}' - could not read timing")
+                    continue
+
+                # Relative to the timeline start
+                rel_start_sec = (start_frame - tl_start_frame) / fps
+                dur_sec = dur_frame / fps
+
+                # Get source offset (and volume, below) from one GetProperty() dict; single-key reads only for what it lacks
+                get_prop = _method(item, "GetProperty")
+                item_props = _item_properties(get_prop)
+                offset_sec = _item_source_offset(get_prop, item_props) / fps
+
+                # Volume (0-1)
+                volume = 1.0
+                try:
+                    if get_prop:
+                        vol_val = item_props.get("AudioLevels") or item_props.get("Volume")
+                        if vol_val is None:
+                            vol_val = get_prop("AudioLevels") or get_prop("Volume")
+                        if vol_val is not None:
+                            # Resolve uses dB, convert to linear (approximate)
+                            if isinstance(vol_val, (list, tuple)) and len(vol_val) > 0:
+                                vol_db = float(vol_val[0])
+                                volume = max(0.0, min(1.0, 10 ** (vol_db / 20)))
+                            elif isinstance(vol_val, (int, float)):
+                                volume = max(0.0, min(1.0, float(vol_val)))
+                except Exception:
+                    pass
+
+                media_pool_item = None
+                try:
+                    get_mp_item = _method(item, "GetMediaPoolItem")
+                    if get_mp_item:
+                        media_pool_item = get_mp_item()
+                except Exception:
+                    pass
+                if not media_pool_item:
+                    log(f"{prefix}: Warning: Could not get MediaPoolItem for '{item_name}', skipping")
+                    continue
+
+                # File path and source duration from one property read
+                props = _clip_properties(media_pool_item, clip_props_cache)
+                file_path = props.get("File Path") or props.get("FilePath")
+                if not file_path or not _listed_file_exists(file_path, dir_listings):
+                    log(f"{prefix}: Warning: Source file not found for '{item_name}', skipping")
+                    continue
+
+                # Name the upload after the track/clip; the source file is sent as-is
+                file_ext = os.path.splitext(file_path)[1][1:] or "mp3"
+                export_filename = f"{track_slug}_{item_idx+1}_{_safe_slug(item_name)}.{file_ext}"
+                log(f"{prefix}: Queued '{item_name}' -> {export_filename} (start={rel_start_sec:.3f}s, dur={dur_sec:.3f}s, offset={offset_sec:.3f}s)")
+
+                # Source duration lets AV Preview skip loading metadata for every clip
+                source_duration_sec = _source_duration_seconds(props.get("Duration"), fps)
+
+                # Uploaded with the rest of the timeline's clips once every track is read
+                clip_entry = {
+                    "id": f"clip_{track_idx}_{item_idx}_{export_stamp}",
+                    "name": item_name,
+                    "url": None,
+                    "startTime": rel_start_sec,
+                    "duration": dur_sec,
+                    "offset": offset_sec,
+                    "volume": volume,
+                    "sourceDuration": source_duration_sec or dur_sec,
+                }
+                clips_data.append(clip_entry)
+                pending.append((clip_entry, file_path, export_filename))
+            except Exception as e:
+                log(f"{prefix}: Error processing audio clip {item_idx + 1} on track {track_idx}: {type(e).__name__}: {e}")
+
+        if clips_data:
+            audio_tracks.append({
+                "id": f"track_{track_idx}_{export_stamp}",
+                "name": track_name,
+                "type": "audio",
+                "clips": clips_data,
+                "isMuted": False,
+                "volume": 1.0,
+            })
+
+    if pending:
+        log(f"{prefix}: Uploading {len(pending)} audio clip(s)...")
+    return _upload_audio_tracks(client, episode_id, audio_tracks, pending, log, prefix)
+
+
+def _shot_sort_key(shot: Dict[str, Any]) -> Tuple[float, float]:
+    """AV script order: row ('order') first, then shotNumber."""
+    return (float(shot.get("order", 0) or 0), float(shot.get("shotNumber", 0) or 0))
+
+
+def _shots_in_script_order(shots: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Shots sorted into AV script order, each paired with its RAW index in segment.shots.
+    Processing follows script order, but clipIds (`${segment.id}-${shot.id}-${index}`) must use the raw index.
+    """
+    return sorted(enumerate(shots), key=lambda pair: _shot_sort_key(pair[1]))
+
+
 def _collect_take_assets(shot: Dict[str, Any], api_endpoint: str = "") -> List[Tuple[str, str]]:
     """
     Returns list of (url, suggested_filename).
@@ -624,7 +963,7 @@ def _collect_take_assets(shot: Dict[str, Any], api_endpoint: str = "") -> List[T
         ext = ".jpg"
         if "." in image_url.split("?")[0]:
             url_ext = os.path.splitext(image_url.split("?")[0])[1].lower()
-            if url_ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]:
+            if url_ext in _IMAGE_EXT_SET:
                 ext = url_ext
         add(image_url, f"{take}_MAIN_image{ext}")
 
@@ -791,19 +1130,50 @@ def _get_timeline_settings(timeline: Any) -> Tuple[float, float, str]:
     fps_raw = timeline.GetSetting("timelineFrameRate")
     fps = float(fps_raw) if fps_raw else 24.0
     start_tc = timeline.GetStartTimecode() or "00:00:00:00"
-    parts = start_tc.split(":")
-    tl_start_sec = 0.0
-    if len(parts) == 4:
-        tl_start_sec = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2]) + (int(parts[3]) / fps)
-    return fps, tl_start_sec, start_tc
+    return fps, _timecode_to_seconds(start_tc, fps) or 0.0, start_tc
+
+
+def _srt_tc(secs: float) -> str:
+    """Seconds -> SRT timestamp HH:MM:SS,mmm (rounded to the nearest millisecond)."""
+    ms = max(0, int(round(secs * 1000)))
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+
+def _write_srt(path: str, entries: List[Dict[str, Any]], offset_sec: float = 0.0) -> None:
+    """
+    Write [{"start", "duration", "text"}, ...] to `path` as SRT, one cue at a time (no joined copy of
+    the whole file in memory); offset_sec shifts every cue (e.g. timeline start TC).
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for i, e in enumerate(entries, 1):
+            if i > 1:
+                f.write("\n")
+            f.write(
+                f"{i}\n"
+                f"{_srt_tc(e['start'] + offset_sec)} --> {_srt_tc(e['start'] + e['duration'] + offset_sec)}\n"
+                f"{e['text'].replace(chr(10), ' ')}\n"
+            )
+
+
+def _split_take_tag(content: str, pattern: "re.Pattern[str]" = _TAKE_SUB_RE) -> Tuple[Optional[str], str]:
+    """(first take id tagged in `content`, upper-cased, or None; `content` with every tag removed) in one regex pass."""
+    takes: List[str] = []
+
+    def _take(m: "re.Match[str]") -> str:
+        takes.append(m.group(1).upper())
+        return ""
+
+    stripped = pattern.sub(_take, content)
+    return (takes[0] if takes else None), stripped
 
 
 def _extract_take_and_visual(content: str) -> Tuple[Optional[str], str]:
-    take_match = re.search(r"\[?\s*(SC\d{2}T\d{2})\s*\]?", content, re.IGNORECASE)
-    if take_match:
-        take = take_match.group(1).upper()
-        visual_desc = re.sub(r"\[?\s*SC\d{2}T\d{2}\s*\]?\s*-?\s*", "", content, flags=re.IGNORECASE).strip()
-        return take, visual_desc
+    take, stripped = _split_take_tag(content, _TAKE_TAG_STRIP_RE)
+    if take:
+        return take, stripped.strip()
     return None, content.strip()
 
 
@@ -825,57 +1195,26 @@ def _collect_subtitle_entries(
     if log_callback:
         log_callback(f"EXPORT: Scanning {s_tracks} subtitle track(s)...")
 
+    tl_start_frame = int(round(tl_start_sec * fps))
     entries: List[Dict[str, Any]] = []
     for t in range(1, s_tracks + 1):
         items = timeline.GetItemListInTrack("subtitle", t) or []
+        # Items on one track share an API class: pick the text accessors once per track
+        readers = _subtitle_text_readers(items[0]) if items else []
         for it in items:
             try:
-                content = ""
-                try:
-                    content = it.GetName()
-                except Exception:
-                    pass
-                if not content:
-                    try:
-                        fn = _method(it, "GetText")
-                        if fn:
-                            content = fn()
-                    except Exception:
-                        pass
-                if not content:
-                    try:
-                        prop_fn = _method(it, "GetProperty")
-                        if prop_fn:
-                            content = prop_fn("Text") or prop_fn("Caption")
-                    except Exception:
-                        pass
+                content = _read_subtitle_text(it, readers)
                 if not content:
                     continue
 
-                start_frame = None
-                dur_frame = None
-                for m in ["GetStart", "GetStartFrame"]:
-                    fn = _method(it, m)
-                    if fn:
-                        try:
-                            start_frame = int(fn())
-                            break
-                        except Exception:
-                            pass
-                for m in ["GetDuration", "GetDurationFrames"]:
-                    fn = _method(it, m)
-                    if fn:
-                        try:
-                            dur_frame = int(fn())
-                            break
-                        except Exception:
-                            pass
+                start_frame = _item_start_frame(it)
+                dur_frame = _item_duration_frames(it)
                 if start_frame is None or dur_frame is None:
                     if log_callback:
                         log_callback("EXPORT: Skipping subtitle - could not read timing")
                     continue
 
-                rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
+                rel_start_sec = (start_frame - tl_start_frame) / fps
                 dur_sec = dur_frame / fps
                 take, visual_desc = _extract_take_and_visual(content)
                 entries.append({
@@ -909,12 +1248,13 @@ def _collect_main_track_clips(
     if v_tracks == 0:
         raise RuntimeError("No video tracks found in timeline.")
 
+    tl_start_frame = int(round(tl_start_sec * fps))
     main_track_idx = None
+    get_track_name = _method(timeline, "GetTrackName")
     for idx in range(1, v_tracks + 1):
         try:
-            get_track_name = _method(timeline, "GetTrackName")
             if get_track_name:
-                name_result = timeline.GetTrackName("video", idx)
+                name_result = get_track_name("video", idx)
                 if name_result and str(name_result).strip().upper() == "MAIN":
                     main_track_idx = idx
                     break
@@ -926,53 +1266,30 @@ def _collect_main_track_clips(
 
     items = timeline.GetItemListInTrack("video", main_track_idx) or []
     clips: List[Dict[str, Any]] = []
+    clip_props_cache: Dict[str, Dict[str, Any]] = {}  # media pool ID -> clip properties, for clips used more than once
+    dir_listings: Dict[str, Optional[set]] = {}  # source folder -> file names, so existence checks don't stat each clip
     for item_idx, item in enumerate(items):
         try:
-            item_name = getattr(item, "GetName", lambda: "(unknown)")()
-            start_frame = None
-            dur_frame = None
-            for m in ["GetStart", "GetStartFrame"]:
-                fn = _method(item, m)
-                if fn:
-                    try:
-                        start_frame = int(fn())
-                        break
-                    except Exception:
-                        pass
-            for m in ["GetDuration", "GetDurationFrames"]:
-                fn = _method(item, m)
-                if fn:
-                    try:
-                        dur_frame = int(fn())
-                        break
-                    except Exception:
-                        pass
+            item_name = _name(item, "(unknown)")
+            start_frame = _item_start_frame(item)
+            dur_frame = _item_duration_frames(item)
             if start_frame is None or dur_frame is None:
                 if log_callback:
                     log_callback(f"EXPORT SRT+VIDEO: Skipping clip '{item_name}' - could not read timing")
                 continue
 
-            rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
+            rel_start_sec = (start_frame - tl_start_frame) / fps
             dur_sec = dur_frame / fps
 
-            offset_frame = 0
-            for prop_name in ["SourceStart", "In", "StartFrame"]:
-                try:
-                    get_prop = _method(item, "GetProperty")
-                    if get_prop:
-                        prop_val = get_prop(prop_name)
-                        if prop_val is not None:
-                            offset_frame = int(prop_val)
-                            break
-                except Exception:
-                    pass
+            get_prop = _method(item, "GetProperty")
+            offset_frame = _item_source_offset(get_prop)
             offset_sec = offset_frame / fps
 
             media_pool_item = None
             try:
                 get_mp_item = _method(item, "GetMediaPoolItem")
                 if get_mp_item:
-                    media_pool_item = item.GetMediaPoolItem()
+                    media_pool_item = get_mp_item()
             except Exception:
                 pass
             if not media_pool_item:
@@ -981,44 +1298,25 @@ def _collect_main_track_clips(
                 continue
 
             # Extract take code from item name first (this is the source of truth)
-            take_match = re.search(r"(SC\d{2}T\d{2})", item_name, re.IGNORECASE)
+            take_match = _TAKE_RE_I.search(item_name)
             if not take_match:
                 if log_callback:
                     log_callback(f"EXPORT SRT+VIDEO: Skipping '{item_name}' - no SCxxTxx in item name")
                 continue
             take = take_match.group(1).upper()  # Keep this - don't overwrite!
 
-            file_path = None
-            try:
-                get_file_path = _method(media_pool_item, "GetClipProperty")
-                if get_file_path:
-                    # Try multiple property names
-                    for prop_name in ["File Path", "FilePath", "File"]:
-                        try:
-                            props = media_pool_item.GetClipProperty([prop_name])
-                            if props and isinstance(props, dict):
-                                file_path = props.get(prop_name) or props.get("File Path") or props.get("FilePath")
-                                if file_path:
-                                    break
-                        except Exception:
-                            pass
-                    
-                    # If dict didn't work, try direct property access
-                    if not file_path:
-                        try:
-                            file_path = media_pool_item.GetClipProperty("File Path")
-                        except Exception:
-                            pass
-            except Exception as e:
-                if log_callback:
-                    log_callback(f"EXPORT SRT+VIDEO: Error getting file path: {e}")
+            # All clip properties in one call; try the names the path has gone by across Resolve builds
+            props = _clip_properties(media_pool_item, clip_props_cache)
+            file_path = props.get("File Path") or props.get("FilePath") or props.get("File")
             
+            # Stat once here; the export worker reuses file_exists instead of re-checking the (possibly network) path
+            file_exists = bool(file_path) and _listed_file_exists(file_path, dir_listings)
             if not file_path:
                 if log_callback:
                     log_callback(f"EXPORT SRT+VIDEO: Warning: Could not get file path for '{item_name}', but found take {take} - will try to use item name")
                 # Use item name as fallback - extract extension from it
                 base_name = item_name
-            elif not os.path.exists(file_path):
+            elif not file_exists:
                 if log_callback:
                     log_callback(f"EXPORT SRT+VIDEO: Warning: Source file not found at '{file_path}' for '{item_name}', but found take {take} - will try to use item name")
                 # File doesn't exist, but we have take code - use item name
@@ -1029,19 +1327,20 @@ def _collect_main_track_clips(
             # IMPORTANT: Don't overwrite take code from filename - item_name is the source of truth
             # The file path might be in a folder with a different take code, but the timeline item name is correct
             # Only log if there's a mismatch for debugging
-            filename_take_match = re.search(r"(SC\d{2}T\d{2})", base_name, re.IGNORECASE)
+            filename_take_match = _TAKE_RE_I.search(base_name)
             if filename_take_match:
                 filename_take = filename_take_match.group(1).upper()
                 if filename_take != take:
                     if log_callback:
                         log_callback(f"EXPORT SRT+VIDEO: Note: Item name has take {take} but filename has {filename_take} - using {take} from item name")
             ext = os.path.splitext(base_name)[1].lower()
-            is_image = ext in [".png", ".jpg", ".jpeg", ".webp", ".gif"]
+            is_image = ext in _IMAGE_EXT_SET
             clip_type = "image" if is_image else "video"
 
             clips.append({
                 "take": take,
                 "file_path": file_path,  # May be None if file not found, but we still have take code
+                "file_exists": file_exists,
                 "start": rel_start_sec,
                 "duration": dur_sec,
                 "offset": offset_sec,
@@ -1058,7 +1357,151 @@ def _collect_main_track_clips(
     return clips
 
 
-def _download_file(url: str, dest: Path) -> None:
+# 1 MiB read/write buffer for asset downloads (videos are often hundreds of MB).
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class DownloadIndex:
+    """
+    Sidecar <episode_dir>/.download_index.json: {url: {"etag", "lastModified", "size", "path"}}.
+    Lets re-runs revalidate already-downloaded assets with a conditional GET (304 = keep local file).
+    `put` only updates memory; `save` writes the file once the run's downloads are done.
+    """
+    FILENAME = ".download_index.json"
+
+    def __init__(self, folder: Path):
+        self.path = Path(folder) / self.FILENAME
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = data
+        except Exception:
+            pass
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(url)
+
+    def can_revalidate(self, url: str, dest: Path) -> bool:
+        """True if we hold a validator for `url` that still describes the file at `dest`."""
+        entry = self.get(url)
+        if not entry or not (entry.get("etag") or entry.get("lastModified")):
+            return False
+        try:
+            return entry.get("path") == str(dest) and dest.stat().st_size == entry.get("size")
+        except OSError:
+            return False
+
+    def put(self, url: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[url] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index if anything changed (temp file + replace, under the lock so writers never interleave)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                tmp = self.path.with_name(self.path.name + ".tmp")
+                tmp.write_text(json.dumps(self._entries, indent=2), encoding="utf-8")
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except Exception as e:
+                _log_to_file(f"DOWNLOAD: Could not write {self.path}: {e}")
+
+
+# Asset downloads reuse HTTP(S) connections (keep-alive) from one pool shared by every thread, so a
+# build that pulls dozens of files from the same bucket pays the TCP/TLS handshake once per connection
+# instead of per file, and the connections outlive each download's thread pool.
+_HTTP_REDIRECTS = (301, 302, 303, 307, 308)
+_HTTP_MAX_REDIRECTS = 5
+_HTTP_POOL_MAXSIZE = 32  # idle connections kept per host
+_http_idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_http_idle_lock = threading.Lock()
+
+
+def _checkout_conn(key: Tuple[str, str], timeout: float) -> http.client.HTTPConnection:
+    with _http_idle_lock:
+        idle = _http_idle.get(key)
+        conn = idle.pop() if idle else None
+    if conn is None:
+        cls = http.client.HTTPSConnection if key[0] == "https" else http.client.HTTPConnection
+        return cls(key[1], timeout=timeout)
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _checkin_conn(key: Tuple[str, str], conn: http.client.HTTPConnection, resp: Any) -> None:
+    """Return `conn` to the pool if `resp` was read to the end and the server keeps it open, else close it."""
+    if resp.isclosed() and not resp.will_close:
+        with _http_idle_lock:
+            idle = _http_idle.setdefault(key, [])
+            if len(idle) < _HTTP_POOL_MAXSIZE:
+                idle.append(conn)
+                return
+    conn.close()
+
+
+@contextlib.contextmanager
+def _http_get(url: str, headers: Dict[str, str], timeout: float = 60) -> Any:
+    """
+    GET `url` on a pooled keep-alive connection to its host, following redirects, and yield the response.
+    The connection goes back to the pool if the body was read to the end, else it is closed.
+    Raises urllib.error.HTTPError for 304/4xx/5xx like urlopen does. Falls back to urlopen when a proxy applies.
+    """
+    proxies = urllib.request.getproxies()
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or (
+            parts.scheme in proxies and not urllib.request.proxy_bypass(parts.hostname or "")
+        ):
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as resp:
+                yield resp
+            return
+        target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        key = (parts.scheme, parts.netloc)
+        conn = _checkout_conn(key, timeout)
+        body = b""
+        try:
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                # The server may have closed an idle pooled socket: retry once on a fresh connection
+                conn.close()
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+            location = resp.getheader("Location") if resp.status in _HTTP_REDIRECTS else None
+            if location or resp.status == 304 or resp.status >= 400:
+                body = resp.read()
+            else:
+                yield resp
+        except BaseException:
+            # Failed or abandoned mid-body: don't hand that socket to the next download
+            conn.close()
+            raise
+        _checkin_conn(key, conn, resp)
+        if location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if resp.status == 304 or resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+        return
+    raise RuntimeError(f"Too many redirects downloading {url}")
+
+
+def _download_file(url: str, dest: Path, index: Optional[DownloadIndex] = None) -> bool:
+    """
+    Download url -> dest. With an index, sends If-None-Match/If-Modified-Since for files
+    we already have and records the response validators.
+    Returns False if the server answered 304 Not Modified (dest left untouched), else True.
+    """
     dest.parent.mkdir(parents=True, exist_ok=True)
     # urllib is strict about URL escaping; many of our asset URLs can contain spaces/() etc.
     # Normalize by percent-encoding only the path portion (keep query as-is).
@@ -1069,32 +1512,302 @@ def _download_file(url: str, dest: Path) -> None:
     except Exception:
         safe_url = url
 
+    headers = {"User-Agent": "ConceptoResolveSync/1.0"}
+    if index and index.can_revalidate(url, dest):
+        entry = index.get(url) or {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("lastModified"):
+            headers["If-Modified-Since"] = entry["lastModified"]
+
     _log_to_file(f"DOWNLOAD: {safe_url} -> {dest}")
-    req = urllib.request.Request(safe_url, headers={"User-Agent": "ConceptoResolveSync/1.0"})
-    with urllib.request.urlopen(req, timeout=60) as resp:
+    # Stream into a sibling temp file and swap it in at the end so an interrupted
+    # download never leaves a truncated asset behind (which would be skipped next run).
+    tmp = dest.with_name(dest.name + ".part")
+    try:
+        with _http_get(safe_url, headers, timeout=60) as resp:
+            try:
+                status = getattr(resp, "status", None)
+                _log_to_file(f"DOWNLOAD: HTTP status={status}")
+            except Exception:
+                pass
+            with open(tmp, "wb") as f:
+                shutil.copyfileobj(resp, f, length=_DOWNLOAD_CHUNK_SIZE)
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+        os.replace(tmp, dest)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            _log_to_file(f"DOWNLOAD: Not modified, keeping {dest}")
+            return False
+        raise
+    except BaseException:
         try:
-            status = getattr(resp, "status", None)
-            _log_to_file(f"DOWNLOAD: HTTP status={status}")
-        except Exception:
+            tmp.unlink()
+        except OSError:
             pass
-        with open(dest, "wb") as f:
-            while True:
-                chunk = resp.read(1024 * 256)
-                if not chunk:
-                    break
-                f.write(chunk)
+        raise
     _log_to_file(f"DOWNLOAD: OK {dest} ({dest.stat().st_size if dest.exists() else 'n/a'} bytes)")
+    if index and (etag or last_modified):
+        index.put(url, {
+            "etag": etag,
+            "lastModified": last_modified,
+            "size": dest.stat().st_size,
+            "path": str(dest),
+        })
+    return True
 
 
-def _timecode_to_frames(tc: str, fps: float) -> int:
+def _fetch_asset(url: str, dest: Path, index: Optional[DownloadIndex]) -> bool:
+    """
+    Make sure `dest` holds the asset at `url`. Existing files are only re-requested when the
+    index has a validator for them (conditional GET); if that revalidation fails we keep the
+    local copy. Returns True if new bytes were written.
+    """
+    if dest.exists():
+        if not index or not index.can_revalidate(url, dest):
+            return False
+        try:
+            return _download_file(url, dest, index)
+        except Exception as e:
+            _log_to_file(f"DOWNLOAD: Revalidation failed for {dest}, keeping local copy: {e}")
+            return False
+    return _download_file(url, dest, index)
+
+
+def _asset_dest(folder: Path, url: str, filename: str) -> Path:
+    """Local path of a downloaded asset: the slugged filename, given the URL's extension if it has none."""
+    ext = os.path.splitext(url.split("?")[0])[1]
+    if not os.path.splitext(filename)[1] and ext:
+        filename = filename + ext
+    return folder / _safe_slug(filename)
+
+
+def _fetch_assets(
+    jobs: List[Tuple[str, Path]],
+    index: Optional[DownloadIndex],
+    workers: int = _DOWNLOAD_WORKERS,
+    fetch: Callable[[str, Path, Optional[DownloadIndex]], bool] = _fetch_asset,
+    log: Callable[[str], None] = _log_to_file,
+) -> Dict[Path, Any]:
+    """
+    Run `fetch` (default `_fetch_asset`; `_download_file` to always re-request) for every (url, dest)
+    on a thread pool. Each dest is fetched once: a different URL that maps to an already queued dest is
+    logged and skipped. Returns {dest: the bool `fetch` returned, or the exception it raised}.
+    """
+    unique: Dict[Path, str] = {}
+    for url, dest in jobs:
+        first = unique.setdefault(dest, url)
+        if first != url:
+            log(f"WARNING: Not downloading {url}: {dest.name} already comes from {first}")
+    results: Dict[Path, Any] = {}
+    if not unique:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as pool:
+        futures = {pool.submit(fetch, url, dest, index): dest for dest, url in unique.items()}
+        for fut in as_completed(futures):
+            try:
+                results[futures[fut]] = fut.result()
+            except Exception as e:
+                results[futures[fut]] = e
+    if index:
+        index.save()
+    return results
+
+
+def _main_asset_filename(take: str, video_url: Optional[str], image_url: Optional[str]) -> str:
+    """Local filename of a take's MAIN asset: the video if there is one, else the image (extension from its URL)."""
+    if video_url:
+        return f"{take}_MAIN_video.mp4"
+    url_ext = os.path.splitext(os.path.basename((image_url or "").split("?")[0]))[1].lower()
+    return f"{take}_MAIN_image{url_ext if url_ext in _IMAGE_EXT_SET else '.jpg'}"
+
+
+def _media_pool_item_key(mp_item: Any) -> Optional[str]:
+    """Stable ID of a MediaPoolItem (GetUniqueId/GetMediaId), or None on builds without one."""
+    for m in ("GetUniqueId", "GetMediaId"):
+        fn = getattr(mp_item, m, None)
+        if fn is not None:
+            try:
+                key = fn()
+            except Exception:
+                continue
+            if key:
+                return str(key)
+    return None
+
+
+def _clip_properties(mp_item: Any, cache: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Every clip property of a MediaPoolItem from a single GetClipProperty() call ({} if unavailable).
+    With `cache`, the dict is shared by every timeline item that uses the same source clip.
+    """
+    key = _media_pool_item_key(mp_item) if cache is not None else None
+    if key is not None and key in cache:
+        return cache[key]
+    try:
+        props = mp_item.GetClipProperty()
+    except Exception:
+        return {}
+    if not isinstance(props, dict):
+        return {}
+    if key is not None:
+        cache[key] = props
+    return props
+
+
+def _listed_file_exists(path: str, listings: Dict[str, Optional[set]]) -> bool:
+    """
+    os.path.exists(path), answered from one os.scandir() per directory cached in `listings`
+    (a name missing from the listing - e.g. different case on Windows/macOS - still gets a real stat).
+    """
+    folder, name = os.path.split(path)
+    if folder not in listings:
+        try:
+            with os.scandir(folder or ".") as it:
+                listings[folder] = {e.name for e in it}
+        except OSError:
+            listings[folder] = None
+    entries = listings[folder]
+    return (entries is not None and name in entries) or os.path.exists(path)
+
+
+def _same_file(a: Any, b: Any) -> bool:
+    """True if both paths name the same existing file (compared by inode, so case/separators don't matter)."""
+    try:
+        return bool(a) and os.path.samefile(a, b)
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+# macOS volumes are case-insensitive by default, but os.path.normcase only folds case on Windows
+_FOLD_PATH_CASE = sys.platform == "darwin"
+
+
+def _path_key(path: Any) -> str:
+    """Normalized absolute path for dict lookups (case-folded on Windows and macOS)."""
+    key = os.path.normcase(os.path.abspath(str(path)))
+    return key.casefold() if _FOLD_PATH_CASE else key
+
+
+def _index_folder_by_path(folder: Any) -> Dict[str, Any]:
+    """_path_key(file path) -> MediaPoolItem for the clips in a Media Pool folder, read in one pass."""
+    index: Dict[str, Any] = {}
     try:
-        parts = tc.strip().split(":")
-        if len(parts) != 4:
-            return 0
-        hh, mm, ss, ff = [int(p) for p in parts]
-        return int(round((((hh * 60 + mm) * 60) + ss) * fps + ff))
+        clips = folder.GetClipList() or []
     except Exception:
+        return index
+    for clip in clips:
+        try:
+            props = clip.GetClipProperty(["File Path"])
+        except Exception:
+            continue
+        if isinstance(props, dict):
+            path = props.get("File Path") or props.get("FilePath")
+            if path:
+                index.setdefault(_path_key(path), clip)
+    return index
+
+
+@dataclass(frozen=True)
+class LocalFile:
+    """A downloaded take asset with the name facts main-file selection needs, computed once."""
+    path: str
+    basename: str
+    is_video: bool
+    is_image: bool
+    is_main_video: bool
+    is_main_image: bool
+
+
+def _local_file_info(path: str) -> LocalFile:
+    basename = os.path.basename(path)
+    ext = os.path.splitext(basename)[1].lower()
+    is_video = ext == ".mp4"
+    is_image = ext in _IMAGE_EXT_SET
+    return LocalFile(
+        path=path,
+        basename=basename,
+        is_video=is_video,
+        is_image=is_image,
+        is_main_video=is_video and "MAIN_video" in basename,
+        is_main_image=is_image and "main_image" in basename.lower(),
+    )
+
+
+def _pick_main_file(files: List[LocalFile], has_video: bool, has_image: bool) -> Tuple[Optional[LocalFile], str]:
+    """
+    Pick the local file to place on the timeline for a take.
+    Returns (file, how) where `how` describes the rule that matched (for logging).
+    """
+    if has_video:
+        lf = next((f for f in files if f.is_main_video), None)
+        if lf:
+            return lf, "Found main video file"
+    if has_image:
+        lf = next((f for f in files if f.is_main_image), None)
+        if lf:
+            return lf, "Found main image file"
+    # Fallback: any video or image of the expected kind
+    if has_video:
+        lf = next((f for f in files if f.is_video), None)
+        if lf:
+            return lf, "Using fallback video file"
+    elif has_image:
+        lf = next((f for f in files if f.is_image), None)
+        if lf:
+            return lf, "Using fallback image file"
+    # Last resort: use first file
+    if files:
+        return files[0], "Using first available file as main"
+    return None, ""
+
+
+def _tc_match_frames(m: Any, fps: float) -> int:
+    """
+    Frame count of a matched _TC_RE timecode. Non-drop timecode counts each second at the nominal
+    rate (24 at 23.976, 30 at 29.97), which is how Resolve numbers timeline frames. Drop-frame
+    timecode (";" separator) also skips the labels dropped at the start of every minute except
+    each tenth: 2 per minute at 29.97, 4 at 59.94.
+    """
+    hh, mm, ss, sep, ff = m.groups()
+    frames = ((int(hh) * 60 + int(mm)) * 60 + int(ss)) * (int(round(fps)) or 1) + int(ff)
+    if sep == ";":
+        dropped = int(round(fps * 0.066666))
+        minutes = int(hh) * 60 + int(mm)
+        frames -= dropped * (minutes - minutes // 10)
+    return frames
+
+
+def _timecode_to_seconds(tc: Any, fps: float) -> Optional[float]:
+    """"HH:MM:SS:FF" -> seconds at `fps`; None if `tc` is not a timecode."""
+    m = _TC_RE.fullmatch(tc.strip()) if isinstance(tc, str) else None
+    if not m:
+        return None
+    return _tc_match_frames(m, fps) / fps
+
+
+def _source_duration_seconds(value: Any, fps: float) -> float:
+    """A clip "Duration" property ("HH:MM:SS:FF" timecode or frame count) in seconds; 0.0 if unreadable."""
+    if not value:
+        return 0.0
+    text = str(value)
+    m = _TC_RE.fullmatch(text.strip())
+    if m:
+        return _tc_match_frames(m, fps) / fps
+    if ":" in text:
+        return 0.0
+    try:
+        return float(text) / fps
+    except ValueError:
+        return 0.0
+
+
+def _timecode_to_frames(tc: str, fps: float) -> int:
+    m = _TC_RE.fullmatch(tc.strip()) if isinstance(tc, str) else None
+    if not m:
         return 0
+    return _tc_match_frames(m, fps)
 
 
 def _frames_to_timecode(frames: int, fps: float) -> str:
@@ -1126,27 +1839,99 @@ def resolve_get_context() -> Tuple[Any, Any, Any]:
     return resolve, project, media_pool
 
 
-def resolve_ensure_bins(media_pool: Any, root_name: str, segment_name: str, take_name: str) -> Any:
+class BinCache:
+    """
+    Memoizes Media Pool folder handles by path, e.g. ("CONCEPTO", "SC01_Intro", "SC01T01").
+    Each parent's subfolders are listed once on first visit; later lookups (other takes in the
+    same segment, the Subtitles/audio bins, ...) skip the GetSubFolderList walk entirely.
+    """
+
+    def __init__(self, media_pool: Any):
+        root = media_pool.GetRootFolder()
+        if not _method(media_pool, "AddSubFolder") or not _method(root, "GetSubFolderList"):
+            raise RuntimeError("Resolve API missing folder methods (AddSubFolder/GetSubFolderList).")
+        self.media_pool = media_pool
+        self._folders: Dict[Tuple[str, ...], Any] = {(): root}
+        self._children: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+
+    def folder(self, *path: str) -> Any:
+        """Find or create RootFolder / path[0] / path[1] / ... and return the last folder."""
+        cached = self._folders.get(path)
+        if cached is not None:
+            return cached
+        parent_path = path[:-1]
+        parent = self.folder(*parent_path)
+        children = self._children.get(parent_path)
+        if children is None:
+            children = {}
+            for f in parent.GetSubFolderList() or []:
+                children.setdefault(_name(f), f)
+            self._children[parent_path] = children
+        name = path[-1]
+        found = children.get(name)
+        if found is None:
+            found = self.media_pool.AddSubFolder(parent, name)
+            if found is None:
+                return None
+            children[name] = found
+        self._folders[path] = found
+        return found
+
+
+def resolve_ensure_bins(media_pool: Any, root_name: str, segment_name: str, take_name: str,
+                        cache: Optional[BinCache] = None) -> Any:
     """
     Create or find: RootFolder / root_name / segment_name / take_name
-    Returns the take folder object.
+    Returns the take folder object. Pass a BinCache to reuse folder handles across calls.
+    """
+    if cache is None:
+        cache = BinCache(media_pool)
+    return cache.folder(root_name, segment_name, take_name)
+
+
+def _segment_bin_label(seg: Dict[str, Any]) -> str:
+    """Media Pool bin name for a segment, e.g. "SC01_Intro" (capped at 80 chars)."""
+    return f"SC{int(seg.get('segmentNumber', 0)):02d}_{_safe_slug(seg.get('title', ''))}"[:80]
+
+
+def _build_name_index(items: List[Any]) -> Dict[str, Any]:
+    """
+    name -> MediaPoolItem for `items`, also keyed by the _safe_slug() form of each name
+    (our downloaded files are saved under slugged names; exact names win on collision).
     """
-    root = media_pool.GetRootFolder()
-    add_folder = _method(media_pool, "AddSubFolder")
-    get_folders = _method(root, "GetSubFolderList")
-    if not add_folder or not get_folders:
-        raise RuntimeError("Resolve API missing folder methods (AddSubFolder/GetSubFolderList).")
+    index: Dict[str, Any] = {}
+    for it in items or []:
+        try:
+            nm = _name(it)
+        except Exception:
+            continue
+        if nm:
+            index[nm] = it
+    for nm, it in list(index.items()):
+        index.setdefault(_safe_slug(nm), it)
+    return index
+
 
-    def find_or_create(parent: Any, name: str) -> Any:
-        for f in parent.GetSubFolderList() or []:
-            if getattr(f, "GetName", lambda: "")() == name:
-                return f
-        return media_pool.AddSubFolder(parent, name)
+def _lookup_by_name(index: Dict[str, Any], want: str) -> Optional[Any]:
+    """O(1) exact/slug lookup; only scans for a containing name when Resolve decorated the clip name."""
+    hit = index.get(want)
+    if hit is None and want:
+        hit = next((v for k, v in index.items() if want in k), None)
+    return hit
 
-    concepto_folder = find_or_create(root, root_name)
-    seg_folder = find_or_create(concepto_folder, segment_name)
-    take_folder = find_or_create(seg_folder, take_name)
-    return take_folder
+
+def _match_imported_item(imported: List[Any], folder: Any, main_file: Optional[str]) -> Optional[Any]:
+    """
+    MediaPoolItem for `main_file` among what ImportMedia returned, matched by name through one index
+    (exact/slug, then containment); falls back to the first imported item. The bin is only listed
+    when ImportMedia returned nothing (e.g. the file was already in the pool).
+    """
+    candidates = imported
+    if not candidates:
+        get_clips = _method(folder, "GetClipList")
+        candidates = (get_clips() or []) if get_clips else []
+    hit = _lookup_by_name(_build_name_index(candidates), os.path.basename(main_file)) if main_file else None
+    return hit or (imported[0] if imported else None)
 
 
 def resolve_import_files(media_pool: Any, folder: Any, files: List[str]) -> List[Any]:
@@ -1162,11 +1947,426 @@ def resolve_import_files(media_pool: Any, folder: Any, files: List[str]) -> List
     return items or []
 
 
-def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item: Any, *,
+# TimelineItem accessor names that worked last time; all items come from the same API build,
+# so later items try the winner first instead of re-probing the whole ladder.
+_PREFERRED_START_METHOD: Optional[str] = None
+_PREFERRED_END_METHOD: Optional[str] = None
+
+
+_PREFERRED_DURATION_METHOD: Optional[str] = None
+
+_START_ACCESSORS = ("GetStart", "GetStartFrame")
+# Wider ladder used when reading a clip's record position for sync (older API builds)
+_RECORD_POS_ACCESSORS = ("GetStart", "GetStartFrame", "GetRecordFrame", "GetLeftOffset", "GetLeftOffsetFrames")
+_DURATION_ACCESSORS = ("GetDuration", "GetDurationFrames")
+
+
+# TimelineItem setter ladders used when moving/retiming clips during sync-from-Concepto
+_POSITION_SETTERS = ("SetStart", "SetStartFrame", "SetRecordFrame", "SetLeftOffset", "SetPosition")
+_DURATION_SETTERS = ("SetDuration", "SetDurationFrames")
+# SetProperty keys tried for a clip's record position / source in-offset, same "last winner first" ordering
+_POSITION_PROPS = ("RecordFrame", "StartFrame", "Start", "LeftOffset", "Position")
+_OFFSET_PROPS = ("In", "Start", "StartFrame", "SourceStart")
+_preferred_setter: Dict[Tuple[str, ...], str] = {}
+
+
+def _setter_ladder(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """`names` with the setter that last succeeded moved to the front."""
+    m = _preferred_setter.get(names)
+    return (m,) + tuple(n for n in names if n != m) if m else names
+
+
+def _call_frame_accessor(item: Any, names: Tuple[str, ...], preferred: Optional[str]) -> Tuple[Optional[int], Optional[str]]:
+    """Call the first accessor in `names` (trying `preferred` first) that works; returns (frame, name)."""
+    if preferred and preferred in names:
+        # Happy path: the accessor that worked last time - one attribute load and call, no ladder
+        try:
+            return int(getattr(item, preferred)()), preferred
+        except Exception:
+            pass
+    for m in names:
+        if m == preferred:
+            continue
+        fn = getattr(item, m, None)
+        if fn is not None:
+            try:
+                return int(fn()), m
+            except Exception:
+                pass
+    return None, None
+
+
+def _item_start_frame(item: Any, names: Tuple[str, ...] = _START_ACCESSORS) -> Optional[int]:
+    """Record start frame of a TimelineItem via the accessor that worked last time."""
+    global _PREFERRED_START_METHOD
+    frame, m = _call_frame_accessor(item, names, _PREFERRED_START_METHOD)
+    if m:
+        _PREFERRED_START_METHOD = m
+    return frame
+
+
+def _item_duration_frames(item: Any) -> Optional[int]:
+    """Duration in frames of a TimelineItem via the accessor that worked last time."""
+    global _PREFERRED_DURATION_METHOD
+    frames, m = _call_frame_accessor(item, _DURATION_ACCESSORS, _PREFERRED_DURATION_METHOD)
+    if m:
+        _PREFERRED_DURATION_METHOD = m
+    return frames
+
+
+# GetProperty keys that can hold a clip's source in-offset, and the one that answered last time
+_SOURCE_OFFSET_PROPS = ("SourceStart", "In", "StartFrame")
+_PREFERRED_OFFSET_PROP: Optional[str] = None
+
+
+def _item_properties(get_prop: Any) -> Dict[str, Any]:
+    """The property dict from one no-argument call of an item's GetProperty ({} if unavailable)."""
+    if not get_prop:
+        return {}
+    try:
+        props = get_prop()
+    except Exception:
+        return {}
+    return props if isinstance(props, dict) else {}
+
+
+def _item_source_offset(get_prop: Any, props: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Source in-offset in frames read through an item's GetProperty (0 if none answers).
+    A dict already fetched with _item_properties() is checked first; single-key reads only happen if it has no offset.
+    """
+    global _PREFERRED_OFFSET_PROP
+    if props:
+        v = _prop_number(props, *_SOURCE_OFFSET_PROPS)
+        if v is not None:
+            return int(v)
+    if not get_prop:
+        return 0
+    names = _SOURCE_OFFSET_PROPS
+    pref = _PREFERRED_OFFSET_PROP
+    if pref:
+        names = (pref,) + tuple(n for n in names if n != pref)
+    for prop_name in names:
+        try:
+            prop_val = get_prop(prop_name)
+            if prop_val is not None:
+                offset_frame = int(prop_val)
+                _PREFERRED_OFFSET_PROP = prop_name
+                return offset_frame
+        except Exception:
+            pass
+    return 0
+
+
+def _prop_number(props: Dict[str, Any], *keys: str) -> Optional[float]:
+    """First of `keys` in a property dict that holds a number (numeric strings included)."""
+    for k in keys:
+        v = props.get(k)
+        if v is None or v == "":
+            continue
+        try:
+            return float(v)
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+# Subtitle item property keys that can hold the caption text, in priority order
+_SUBTITLE_TEXT_PROPS = ("Text", "Caption")
+
+
+def _subtitle_prop_text(item: Any, keys: Tuple[str, ...] = _SUBTITLE_TEXT_PROPS) -> str:
+    """First non-empty of `keys` from a single GetProperty() dict read ("" if none)."""
+    props = item.GetProperty()
+    if not isinstance(props, dict):
+        return ""
+    for k in keys:
+        v = props.get(k)
+        if v:
+            return v
+    return ""
+
+
+def _subtitle_text_readers(sample: Any, keys: Tuple[str, ...] = _SUBTITLE_TEXT_PROPS) -> List[Callable[[Any], str]]:
+    """
+    Text accessors for one track's subtitle items in priority order (GetName, GetText, the `keys`
+    properties), limited to the ones `sample` - the track's first item - actually has.
+    """
+    readers: List[Callable[[Any], str]] = [lambda it: it.GetName()]
+    if _method(sample, "GetText") is not None:
+        readers.append(lambda it: it.GetText())
+    if _method(sample, "GetProperty") is not None:
+        readers.append(lambda it: _subtitle_prop_text(it, keys))
+    return readers
+
+
+def _read_subtitle_text(item: Any, readers: List[Callable[[Any], str]]) -> str:
+    """
+    First non-empty text `readers` give for `item` ("" if none), in their priority order. A reader whose
+    accessor doesn't exist on this build (AttributeError) is dropped, so the rest of the track skips it.
+    """
+    for read in list(readers):
+        try:
+            text = read(item)
+        except AttributeError:
+            readers.remove(read)
+            continue
+        except Exception:
+            continue
+        if text:
+            return text
+    return ""
+
+
+def _item_sync_timing(item: Any, names: Tuple[str, ...] = _START_ACCESSORS) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    """
+    (record start frame, duration frames, source in-frame) of a TimelineItem for sync.
+    The record position always comes from the `names` accessors: the property dict's "Start" is the
+    source trim-in, not the record frame. Duration/In are read from the dict, fetched once.
+    """
+    props: Any = None
+    get_props = getattr(item, "GetProperty", None) or getattr(item, "GetProperties", None) or getattr(item, "GetClipProperty", None)
+    if get_props is not None:
+        try:
+            props = get_props()
+        except Exception:
+            pass
+    if not isinstance(props, dict):
+        props = {}
+    duration = _prop_number(props, "Duration")
+    return (
+        _item_start_frame(item, names),
+        int(duration) if duration is not None else _item_duration_frames(item),
+        _prop_number(props, "In", "StartFrame"),
+    )
+
+
+def _clip_timing_matches(
+    dur_frames: Optional[int], in_frame: Optional[float], duration_sec: float, offset_sec: float, fps: float
+) -> bool:
+    """
+    True when a clip's duration and source in-point already match Concepto's (within a frame).
+    Values Concepto doesn't set (<= 0) or the clip can't report count as matching.
+    """
+    if dur_frames is not None and duration_sec > 0 and abs(dur_frames - int(round(duration_sec * fps))) > 1:
+        return False
+    if in_frame is not None and offset_sec > 0 and abs(in_frame - int(round(offset_sec * fps))) > 1:
+        return False
+    return True
+
+
+def _timeline_item_name(it: Any) -> str:
+    """TimelineItem name, falling back to its MediaPoolItem's name; "" if neither is readable."""
+    try:
+        get_name = getattr(it, "GetName", None)
+        nm = get_name() if get_name is not None else ""
+        if not nm:
+            get_mpi = getattr(it, "GetMediaPoolItem", None)
+            mpit = get_mpi() if get_mpi is not None else None
+            nm = _name(mpit) if mpit else ""
+        return nm or ""
+    except Exception:
+        return ""
+
+
+def _item_frame_range(item: Any) -> Optional[Tuple[int, int]]:
+    """(start, end) record frames of a TimelineItem, or None if neither accessor pair works."""
+    global _PREFERRED_END_METHOD
+    ex_start = _item_start_frame(item)
+    ex_end, m = _call_frame_accessor(item, ("GetEnd", "GetEndFrame"), _PREFERRED_END_METHOD)
+    if m:
+        _PREFERRED_END_METHOD = m
+    if ex_start is None or ex_end is None:
+        return None
+    return ex_start, ex_end
+
+
+def _build_take_map(shots_raw: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    take id -> {"shot", "idx"} for a segment's shots in raw order (idx feeds the AVPreview clipId).
+    Keys are interned like the ones _index_timeline_by_take produces, so lookups hit on identity.
+    """
+    return {
+        sys.intern(take): {"shot": sh, "idx": idx}
+        for idx, sh in enumerate(shots_raw)
+        for take in ((sh.get("take") or "").replace("_image", ""),)
+        if take
+    }
+
+
+def _index_timeline_by_take(timeline: Any, track_type: str = "video") -> Dict[str, List[Tuple[int, Any]]]:
+    """
+    take id (SC##T##) -> [(track_index, TimelineItem), ...] for every item on the `track_type` tracks,
+    in track order. Each item's name is read once, so callers look takes up instead of rescanning tracks.
+    """
+    index: Dict[str, List[Tuple[int, Any]]] = {}
+    get_items = _method(timeline, "GetItemListInTrack")
+    if not get_items:
+        return index
+    try:
+        n_tracks = int(timeline.GetTrackCount(track_type) or 0)
+    except Exception:
+        n_tracks = 1
+    for t in range(1, n_tracks + 1):
+        try:
+            items = get_items(track_type, t) or []
+        except Exception:
+            continue
+        for it in items:
+            nm = _timeline_item_name(it)
+            take_match = _TAKE_RE.search(nm) if "SC" in nm else None
+            if take_match:
+                index.setdefault(sys.intern(take_match.group(1)), []).append((t, it))
+    return index
+
+
+def _begin_undo_group(project: Any, name: str) -> Optional[Callable[[], None]]:
+    """
+    Open one undo group for a batch of timeline edits. Only targets Fusion-style builds whose
+    project exposes StartUndo/EndUndo; Resolve's documented scripting API has no undo calls.
+    Returns the function that closes the group, or None when it could not be opened.
+    """
+    start_undo = _method(project, "StartUndo")
+    end_undo = _method(project, "EndUndo")
+    if not start_undo or not end_undo:
+        return None
+    try:
+        start_undo(name)
+    except Exception:
+        return None
+    return lambda: end_undo(True)
+
+
+def _find_take_item(timeline: Any, track_type: str, track_index: int, take: str, frame: int,
+                    tolerance: int = 2) -> Optional[Any]:
+    """
+    Item on one track whose name contains `take` and that starts within `tolerance` frames of `frame`.
+    Track items come back in timeline order, so a binary search over their start frames (read lazily,
+    O(log n) accessor calls) finds the window; a full scan is only the fallback for unordered/unreadable lists.
+    """
+    try:
+        items = timeline.GetItemListInTrack(track_type, track_index) or []
+    except Exception:
+        return None
+    lo, hi = 0, len(items)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = _item_start_frame(items[mid])
+        if pos is None:
+            break
+        if pos < frame - tolerance:
+            lo = mid + 1
+        else:
+            hi = mid
+    else:
+        for it in items[lo:]:
+            pos = _item_start_frame(it)
+            if pos is None or pos > frame + tolerance:
+                break
+            if take in _timeline_item_name(it):
+                return it
+    for it in items:
+        if take in _timeline_item_name(it):
+            pos = _item_start_frame(it)
+            if pos is not None and abs(pos - frame) <= tolerance:
+                return it
+    return None
+
+
+def _track_intervals(timeline: Any, track_type: str, track_index: int) -> List[Tuple[int, int]]:
+    """Sorted (start, end) frame intervals of the items currently on a timeline track."""
+    intervals: List[Tuple[int, int]] = []
+    if not _method(timeline, "GetItemListInTrack"):
+        return intervals
+    try:
+        for item in timeline.GetItemListInTrack(track_type, track_index) or []:
+            rng = _item_frame_range(item)
+            if rng:
+                intervals.append(rng)
+    except Exception:
+        pass
+    intervals.sort()
+    return intervals
+
+
+def _find_overlap(intervals: List[Tuple[int, int]], start: int, end: int) -> Optional[Tuple[int, int]]:
+    """
+    First interval in the sorted, non-overlapping `intervals` (one track's clips) that overlaps
+    [start, end). Only the neighbours around the bisect point can overlap, so this is O(log n).
+    """
+    i = bisect.bisect_right(intervals, (start, float("inf")))
+    # Last clip starting at/before `start` overlaps if it ends after `start`
+    if i > 0 and intervals[i - 1][1] > start:
+        return intervals[i - 1]
+    # Next clip overlaps if it starts before we end
+    if i < len(intervals) and intervals[i][0] < end:
+        return intervals[i]
+    return None
+
+
+def _clamp_trim_to_clip(item: Any, start_frame: int, end_frame: int, fps: float, log: Callable[[str], None]) -> Tuple[int, int]:
+    """
+    Clamp a source trim (startFrame, endFrame) to the MediaPoolItem's own duration and make sure
+    it is a valid, non-empty range; returns the (start_frame, end_frame) to place with.
+    """
+    # Get the actual clip duration to validate our trim
+    clip_duration_frames = None
+    try:
+        get_duration = _method(item, "GetClipProperty")
+        if get_duration:
+            props = item.GetClipProperty(["Duration"])
+            if props and isinstance(props, dict):
+                clip_duration_str = props.get("Duration")
+                if clip_duration_str:
+                    # Try parsing as timecode "HH:MM:SS:FF"
+                    if isinstance(clip_duration_str, str) and ":" in clip_duration_str:
+                        try:
+                            total_sec = _timecode_to_seconds(clip_duration_str, fps)
+                            if total_sec is not None:
+                                clip_duration_frames = int(round(total_sec * fps))
+                            else:
+                                # Try as float seconds
+                                clip_duration_frames = int(round(float(clip_duration_str) * fps))
+                        except:
+                            pass
+                    else:
+                        # Try as float (seconds) or int (frames)
+                        try:
+                            val = float(clip_duration_str)
+                            clip_duration_frames = int(round(val * fps)) if val < 1000 else int(val)
+                        except:
+                            pass
+        if clip_duration_frames:
+            log(f"  Clip actual duration: {clip_duration_frames} frames")
+            if end_frame > clip_duration_frames:
+                log(f"  Warning: Trim end ({end_frame}) exceeds clip duration ({clip_duration_frames}), clamping")
+                end_frame = clip_duration_frames
+            # CRITICAL: Ensure end_frame > start_frame after clamping
+            if end_frame <= start_frame:
+                log(f"  ERROR: After clamping, end_frame ({end_frame}) <= start_frame ({start_frame})")
+                start_frame = 0
+                end_frame = max(int(fps), min(clip_duration_frames, int(fps * 3)))  # At least 1s, max 3s or clip length
+                log(f"  Fixed: start_frame={start_frame}, end_frame={end_frame}, duration={end_frame - start_frame} frames")
+    except Exception as e:
+        log(f"  Could not get clip duration: {e}")
+    
+    # FINAL VALIDATION: Must have valid duration before placement
+    if end_frame <= start_frame:
+        log(f"  ERROR: Invalid frame range: start={start_frame}, end={end_frame}. Forcing minimum 1 second.")
+        start_frame = 0
+        end_frame = int(fps)  # 1 second minimum
+    return start_frame, end_frame
+
+
+def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item: Any, *,
                               record_seconds: float, duration_seconds: float, offset_seconds: float,
-                              log_callback=None, track_index: int = 1, track_type: str = "video") -> None:
+                              log_callback=None, track_index: int = 1, track_type: str = "video",
+                              ensure_current: bool = True) -> Optional[Any]:
     """
     Place media pool item on timeline with precise positioning.
+    Pass ensure_current=False when the caller already made `timeline` current (batch placement).
+    Returns the created TimelineItem when the API hands one back (None if it only reported success);
+    raises RuntimeError if every placement method failed.
     
     According to DaVinci Resolve API:
     - startFrame: Source IN point (trim start) - where to start reading from the clip
@@ -1208,10 +2408,8 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
             if start_tc_str and isinstance(start_tc_str, str) and ":" in start_tc_str:
                 # Parse timecode like "01:00:00:00"
                 try:
-                    parts = start_tc_str.split(":")
-                    if len(parts) == 4:
-                        h, m, s, f = map(int, parts)
-                        timeline_start_sec = h * 3600 + m * 60 + s + (f / fps)
+                    timeline_start_sec = _timecode_to_seconds(start_tc_str, fps)
+                    if timeline_start_sec is not None:
                         timeline_start_frame = int(round(timeline_start_sec * fps))
                         log(f"Timeline start timecode: {start_tc_str} ({timeline_start_frame} frames)")
                 except Exception:
@@ -1244,57 +2442,8 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
         end_frame = start_frame + duration_frames
         log(f"Warning: Invalid frame range, adjusted to duration={duration_frames} frames")
     
-    # Get the actual clip duration to validate our trim
-    clip_duration_frames = None
-    try:
-        get_duration = _method(item, "GetClipProperty")
-        if get_duration:
-            props = item.GetClipProperty(["Duration"])
-            if props and isinstance(props, dict):
-                clip_duration_str = props.get("Duration")
-                if clip_duration_str:
-                    # Try parsing as timecode "HH:MM:SS:FF"
-                    if isinstance(clip_duration_str, str) and ":" in clip_duration_str:
-                        try:
-                            parts = clip_duration_str.split(":")
-                            if len(parts) == 4:
-                                h, m, s, f = map(int, parts)
-                                total_sec = h * 3600 + m * 60 + s + (f / fps)
-                                clip_duration_frames = int(round(total_sec * fps))
-                            else:
-                                # Try as float seconds
-                                clip_duration_frames = int(round(float(clip_duration_str) * fps))
-                        except:
-                            pass
-                    else:
-                        # Try as float (seconds) or int (frames)
-                        try:
-                            val = float(clip_duration_str)
-                            clip_duration_frames = int(round(val * fps)) if val < 1000 else int(val)
-                        except:
-                            pass
-        if clip_duration_frames:
-            log(f"  Clip actual duration: {clip_duration_frames} frames")
-            if end_frame > clip_duration_frames:
-                log(f"  Warning: Trim end ({end_frame}) exceeds clip duration ({clip_duration_frames}), clamping")
-                end_frame = clip_duration_frames
-            # CRITICAL: Ensure end_frame > start_frame after clamping
-            if end_frame <= start_frame:
-                log(f"  ERROR: After clamping, end_frame ({end_frame}) <= start_frame ({start_frame})")
-                start_frame = 0
-                end_frame = max(int(fps), min(clip_duration_frames, int(fps * 3)))  # At least 1s, max 3s or clip length
-                duration_frames = end_frame - start_frame
-                log(f"  Fixed: start_frame={start_frame}, end_frame={end_frame}, duration={duration_frames} frames")
-    except Exception as e:
-        log(f"  Could not get clip duration: {e}")
-    
-    # FINAL VALIDATION: Must have valid duration before placement
-    if end_frame <= start_frame:
-        log(f"  ERROR: Invalid frame range: start={start_frame}, end={end_frame}. Forcing minimum 1 second.")
-        start_frame = 0
-        end_frame = int(fps)  # 1 second minimum
-        duration_frames = end_frame - start_frame
-        record_frame = max(0, record_frame)  # Ensure valid timeline position
+    start_frame, end_frame = _clamp_trim_to_clip(item, start_frame, end_frame, fps, log)
+    duration_frames = end_frame - start_frame
     log(f"  FINAL: start_frame={start_frame}, end_frame={end_frame}, duration={duration_frames} frames, record_frame={record_frame}")
 
     mp_append = _method(media_pool, "AppendToTimeline")
@@ -1313,11 +2462,12 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
             return None
 
     # CRITICAL: Ensure timeline is current and unlocked before placement
-    try:
-        project.SetCurrentTimeline(timeline)
-        log("Set timeline as current before placement")
-    except Exception as e:
-        log(f"Warning: Could not set timeline as current: {e}")
+    if ensure_current:
+        try:
+            project.SetCurrentTimeline(timeline)
+            log("Set timeline as current before placement")
+        except Exception as e:
+            log(f"Warning: Could not set timeline as current: {e}")
     
     # Try multiple approaches - Resolve API varies significantly across versions
     # Method 1: MediaPool.AppendToTimeline with dict (most precise, supports trim)
@@ -1359,36 +2509,24 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
                     continue
                 if isinstance(result, list) and len(result) > 0:
                     log(f"✓ Timeline placement successful! Created {len(result)} timeline item(s)")
-                    # Verify the item is actually visible on the timeline
-                    import time
-                    time.sleep(0.1)  # Delay for Resolve to process
-                    # Verify item exists and has valid duration
-                    verify_items = timeline.GetItemListInTrack(track_type, track_index) or []
-                    if verify_items:
-                        last_item = verify_items[-1]
-                        try:
-                            get_start = _method(last_item, "GetStart")
-                            get_end = _method(last_item, "GetEnd")
-                            if get_start and get_end:
-                                item_start = last_item.GetStart()
-                                item_end = last_item.GetEnd()
-                                item_dur = item_end - item_start if item_end > item_start else 0
-                                log(f"  Verified: Timeline item start={item_start}, end={item_end}, duration={item_dur} frames")
-                                if item_dur <= 0:
-                                    log(f"  WARNING: Timeline item has zero/negative duration! This may be why it's invisible.")
-                                else:
-                                    log(f"  ✓ Clip should be visible on timeline")
-                        except Exception as e:
-                            log(f"  Could not verify timeline item: {e}")
-                    return
+                    # Verify with the TimelineItem the API returned (no sleep + track re-read)
+                    placed = result[0]
+                    rng = _item_frame_range(placed)
+                    if rng:
+                        item_start, item_end = rng
+                        item_dur = item_end - item_start if item_end > item_start else 0
+                        log(f"  Verified: Timeline item start={item_start}, end={item_end}, duration={item_dur} frames")
+                        if item_dur <= 0:
+                            log(f"  WARNING: Timeline item has zero/negative duration! This may be why it's invisible.")
+                        else:
+                            log(f"  ✓ Clip should be visible on timeline")
+                    return placed
                 elif result is True:
                     log(f"✓ Timeline placement successful (returned True)")
-                    import time
-                    time.sleep(0.1)
-                    return
+                    return None
                 else:
                     log(f"✓ Timeline placement successful (returned truthy value)")
-                    return
+                    return None
             else:
                 log(f"  Attempt {attempt+1} returned False/None, trying next method...")
                 
@@ -1428,15 +2566,15 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
                     log(f"✓ InsertClip successful! Timeline item created.")
                     # Try to trim after placement
                     try:
-                        set_start = _method(timeline_item, "SetProperty")
-                        if set_start:
+                        set_prop = _method(timeline_item, "SetProperty")
+                        if set_prop:
                             # Try to set trim points
-                            timeline_item.SetProperty("Start", start_frame)
-                            timeline_item.SetProperty("End", end_frame)
+                            set_prop("Start", start_frame)
+                            set_prop("End", end_frame)
                             log(f"  Applied trim: start={start_frame}, end={end_frame}")
                     except Exception:
                         pass
-                    return
+                    return timeline_item
             else:
                 log("  Could not get file path from MediaPoolItem for InsertClip")
         except Exception as e:
@@ -1455,7 +2593,7 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
             after_n = track_count_now()
             if result is not False and result is not None and (before_n is None or after_n is None or after_n > before_n):
                 log("✓ InsertClips placed item (fallback).")
-                return
+                return None
         except Exception as e:
             log(f"  InsertClips failed: {type(e).__name__}: {e}")
 
@@ -1471,7 +2609,7 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
             after_n = track_count_now()
             if result is not False and result is not None and (before_n is None or after_n is None or after_n > before_n):
                 log("✓ Timeline.AppendToTimeline placed item (fallback).")
-                return
+                return None
         except Exception as e:
             log(f"  Timeline.AppendToTimeline failed: {type(e).__name__}: {e}")
 
@@ -1493,31 +2631,122 @@ def resolve_place_on_timeline(project: Any, media_pool: Any, timeline: Any, item
         if result is not False and result is not None and (before_n is None or after_n is None or after_n > before_n):
             log("✓ Item placed (fallback method). Note: Trim/offset NOT applied - may need manual adjustment.")
             # Try to trim after placement using TimelineItem methods
+            # (the item count check above already confirmed the new item is on the track)
+            timeline_item = None
             try:
-                import time
-                time.sleep(0.1)
                 if get_items:
                     items = timeline.GetItemListInTrack(track_type, track_index) or []
                     if items:
                         # Get the last item (should be the one we just added)
                         timeline_item = items[-1]
-                        set_start = _method(timeline_item, "SetProperty")
-                        if set_start:
+                        set_prop = _method(timeline_item, "SetProperty")
+                        if set_prop:
                             try:
-                                timeline_item.SetProperty("Start", start_frame)
-                                timeline_item.SetProperty("End", end_frame)
+                                set_prop("Start", start_frame)
+                                set_prop("End", end_frame)
                                 log(f"  Applied trim after placement: start={start_frame}, end={end_frame}")
                             except Exception:
                                 pass
             except Exception:
                 pass
-            return
+            return timeline_item
     except Exception as e:
         log(f"  Fallback AppendToTimeline failed: {type(e).__name__}: {e}")
 
     raise RuntimeError("All timeline placement methods failed.")
 
 
+def resolve_place_batch(project: Any, media_pool: Any, timeline: Any, placements: List[Dict[str, Any]], *,
+                        log_callback=None) -> int:
+    """
+    Place several clips with one MediaPool.AppendToTimeline([clipInfo, ...]) call.
+    Each placement is {"item": MediaPoolItem, "record_seconds", "duration_seconds", "offset_seconds",
+    "track_index", "track_type"}. If Resolve rejects the batch, falls back to resolve_place_on_timeline
+    per clip. Returns the number of clips placed.
+    """
+    def log(msg):
+        if log_callback:
+            log_callback(msg)
+        else:
+            _log_to_file(msg)
+
+    if not placements:
+        return 0
+    mp_append = _method(media_pool, "AppendToTimeline")
+    if mp_append:
+        try:
+            fps, tl_start_sec, _start_tc = _get_timeline_settings(timeline)
+        except Exception:
+            fps, tl_start_sec = 24.0, 0.0
+        timeline_start_frame = int(round(tl_start_sec * fps))
+        clip_infos = []
+        for p in placements:
+            duration_seconds = p["duration_seconds"] if p["duration_seconds"] >= 0.1 else 1.0
+            start_frame = max(0, int(round(p["offset_seconds"] * fps)))
+            # Same trim validation as the per-clip path
+            start_frame, end_frame = _clamp_trim_to_clip(
+                p["item"], start_frame, start_frame + max(1, int(round(duration_seconds * fps))), fps, log
+            )
+            clip_infos.append({
+                "mediaPoolItem": p["item"],
+                "startFrame": start_frame,
+                "endFrame": end_frame,
+                "recordFrame": max(0, int(round(p["record_seconds"] * fps))) + timeline_start_frame,
+                "trackIndex": int(p.get("track_index", 1)),
+                "mediaType": 2 if p.get("track_type") == "audio" else 1,
+            })
+        try:
+            result = mp_append(clip_infos)
+        except Exception as e:
+            log(f"Batch AppendToTimeline failed: {type(e).__name__}: {e}")
+            result = None
+        if isinstance(result, list) and result:
+            if len(result) >= len(placements):
+                log(f"✓ Batch AppendToTimeline placed {len(result)} clip(s)")
+                return len(result)
+            # Partial batch: match the created items to their clipInfos by record frame and
+            # place whatever is left one by one
+            placed_frames: Dict[int, int] = {}
+            for it in result:
+                frame = _item_start_frame(it)
+                if frame is None:
+                    log(f"WARNING: Batch AppendToTimeline placed {len(result)} of {len(placements)} clip(s); "
+                        "cannot tell which, so the rest are not retried")
+                    return len(result)
+                placed_frames[frame] = placed_frames.get(frame, 0) + 1
+            missing = []
+            for p, info in zip(placements, clip_infos):
+                if placed_frames.get(info["recordFrame"]):
+                    placed_frames[info["recordFrame"]] -= 1
+                else:
+                    missing.append(p)
+            log(f"WARNING: Batch AppendToTimeline placed {len(result)} of {len(placements)} clip(s); "
+                f"placing the other {len(missing)} one by one...")
+            placements = missing
+            placed = len(result)
+        else:
+            log("Batch AppendToTimeline placed nothing; placing clips one by one...")
+            placed = 0
+    else:
+        placed = 0
+
+    for p in placements:
+        try:
+            resolve_place_on_timeline(project, media_pool, timeline, p["item"],
+                                      record_seconds=p["record_seconds"],
+                                      duration_seconds=p["duration_seconds"],
+                                      offset_seconds=p["offset_seconds"],
+                                      log_callback=log_callback,
+                                      track_index=p.get("track_index", 1),
+                                      track_type=p.get("track_type", "video"),
+                                      ensure_current=False)
+            placed += 1
+        except Exception as e:
+            name = _name(p["item"], "(unknown)")
+            log(f"Failed placing '{name}': {type(e).__name__}: {e}")
+    return placed
+
+
 def _audio_clip_filename(track: Dict[str, Any], clip: Dict[str, Any]) -> str:
     track_name = track.get("name") or track.get("id") or "Track"
     clip_name = clip.get("name") or clip.get("id") or "clip"
@@ -1535,6 +2764,26 @@ def _audio_clip_filename(track: Dict[str, Any], clip: Dict[str, Any]) -> str:
     return f"AVPreview_{safe_track}_{safe_clip}_{clip_id_short}{ext}"
 
 
+def _audio_clip_specs(track: Dict[str, Any]) -> List[Tuple[int, str, float, float, float]]:
+    """
+    (clip_index, slugged media name, start, duration, offset) for each clip dict of an AVPreview track,
+    parsed in one pass so the placement loop only does lookups. Non-positive durations become 1s.
+    """
+    specs = []
+    for c_idx, cl in enumerate(track.get("clips") or []):
+        if not isinstance(cl, dict):
+            continue
+        du = float(cl.get("duration") or 0)
+        specs.append((
+            c_idx,
+            _safe_slug(_audio_clip_filename(track, cl)),
+            float(cl.get("startTime") or 0),
+            du if du > 0 else 1.0,
+            float(cl.get("offset") or 0),
+        ))
+    return specs
+
+
 def resolve_get_or_create_timeline(project: Any, timeline_name: str) -> Any:
     """
     Returns an existing timeline with name or creates a new empty timeline.
@@ -1548,7 +2797,7 @@ def resolve_get_or_create_timeline(project: Any, timeline_name: str) -> Any:
         count = int(project.GetTimelineCount() or 0)
         for i in range(1, count + 1):
             tl = project.GetTimelineByIndex(i)
-            if tl and getattr(tl, "GetName", lambda: "")() == timeline_name:
+            if tl and _name(tl) == timeline_name:
                 if set_current:
                     project.SetCurrentTimeline(tl)
                 return tl
@@ -1569,6 +2818,58 @@ def resolve_get_or_create_timeline(project: Any, timeline_name: str) -> Any:
     return tl
 
 
+class _WorkerQueue:
+    """Runs submitted callables one at a time, in order, on a single long-lived daemon thread (started on first use)."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._jobs: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[[], None]) -> int:
+        """Queue fn; returns how many earlier jobs are still queued or running ahead of it."""
+        ahead = self._jobs.unfinished_tasks
+        self._jobs.put(fn)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+        return ahead
+
+    def _run(self):
+        while True:
+            fn = self._jobs.get()
+            try:
+                fn()
+            except Exception:
+                # Workers log their own errors; this only keeps the queue alive
+                traceback.print_exc()
+            finally:
+                self._jobs.task_done()
+
+
+if USE_PYSIDE:
+    class _QtWorker(QtCore.QObject):  # type: ignore
+        """
+        Wraps a worker callable for a background thread; created on the GUI thread, so its `done`
+        signal reaches GUI-thread receivers as a queued call.
+        """
+        done = QtCore.Signal()
+
+        def __init__(self, fn: Callable[[], None]):
+            super().__init__()
+            self._fn = fn
+            self.finished = False
+
+        def run(self):
+            try:
+                self._fn()
+            finally:
+                self.finished = True
+                self.done.emit()
+
+
 class MainWindow(QtWidgets.QWidget):  # type: ignore
     def __init__(self):
         super().__init__()
@@ -1581,8 +2882,42 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
         self.show: Optional[Dict[str, Any]] = None
         self.selected_segment_id: Optional[str] = None
 
+        # Log lines are queued here (from any thread) and flushed to the widget by a GUI-thread timer
+        self._log_lock = threading.Lock()
+        self._log_buffer: List[str] = []
+
         self._build_ui()
 
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
+        # Live (_QtWorker, on_done) entries; kept referenced until their on_done has run
+        self._qt_workers: List[Tuple[Any, Callable[[], None]]] = []
+        # Background actions (build, sync, export, import) run one after another on this queue
+        self._bg = _WorkerQueue("concepto-bg")
+
+    def _run_in_background(self, worker: Callable[[], None], on_done: Optional[Callable[[], None]] = None):
+        """Queue a worker behind any background action that is still running; on_done runs on the GUI thread afterwards."""
+        if on_done is not None:
+            job = _QtWorker(worker)
+            self._qt_workers.append((job, on_done))
+            # Bound to this window, so Qt queues the call onto the GUI thread
+            job.done.connect(self._reap_qt_workers)
+            worker = job.run
+        if self._bg.submit(worker):
+            self._log("Waiting for the previous operation to finish...")
+
+    def _reap_qt_workers(self):
+        for entry in list(self._qt_workers):
+            job, on_done = entry
+            if not job.finished:
+                continue
+            self._qt_workers.remove(entry)
+            job.deleteLater()
+            on_done()
+
     def _build_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -1706,10 +3041,21 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
         self.diagnose_btn.clicked.connect(self.on_diagnose)
 
     def _log(self, msg: str):
-        self.log.appendPlainText(msg)
-        self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+        # Safe to call from worker threads: only the buffer is touched here
+        with self._log_lock:
+            self._log_buffer.append(msg)
         _log_to_file(f"GUI: {msg}")
 
+    def _flush_log(self):
+        """Append all queued log lines in one go (runs on the GUI thread)."""
+        with self._log_lock:
+            if not self._log_buffer:
+                return
+            batch = self._log_buffer
+            self._log_buffer = []
+        self.log.appendPlainText("\n".join(batch))
+        self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+
     def on_save(self):
         self.cfg.api_endpoint = self.endpoint_edit.text().strip()
         self.cfg.api_key = self.key_edit.text().strip()
@@ -1738,7 +3084,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
             )
             if not ok or not text.strip():
                 return
-            data = json.loads(text)
+            data = _json_loads(text)
             if isinstance(data, dict):
                 if data.get("apiEndpoint"):
                     self.endpoint_edit.setText(str(data["apiEndpoint"]))
@@ -1829,7 +3175,6 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
             self._log("✓ Refresh complete - episode data reloaded from Concepto.")
         except Exception as e:
             self._log(f"Refresh ERROR: {e}")
-            import traceback
             self._log(f"Traceback: {traceback.format_exc()}")
 
     def on_segment_changed(self, _idx: int):
@@ -1875,9 +3220,6 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
         avp = self.episode.get("avPreviewData") if self.episode else {}
         overrides = (avp or {}).get("videoClipStartTimes") or {}
         
-        # Sort shots by order (row) then shotNumber to match AV script order
-        sorted_shots = sorted(shots, key=lambda s: (float(s.get("order", 0) or 0), float(s.get("shotNumber", 0) or 0)))
-        
         current_end = 0.0  # Track where the last clip ends
         # IMPORTANT: clipId index must match AVPreview.tsx: segment.shots.forEach((shot, index) => ...)
         for idx, shot in enumerate(shots):
@@ -1906,6 +3248,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 # Resolve context
                 self._log("Connecting to Resolve...")
                 _resolve, project, media_pool = resolve_get_context()
+                bins = BinCache(media_pool)
 
                 # Determine show/episode folder
                 show_name = _safe_slug((self.show or {}).get("name") or self.episode.get("showId") or "UnknownShow")
@@ -1914,12 +3257,15 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 episode_dir = base_dir / show_name / episode_name
                 episode_dir.mkdir(parents=True, exist_ok=True)
                 self._log(f"Local episode folder: {episode_dir}")
+                dl_index = DownloadIndex(episode_dir)
 
                 # Find selected segment
                 segments = ((self.episode.get("avScript") or {}).get("segments") or [])
                 seg = next((s for s in segments if s.get("id") == self.selected_segment_id), None)
                 if not seg:
                     raise RuntimeError("Selected segment not found.")
+                # Bins are <root>/<seg_label>/<take>; the label depends only on the segment
+                seg_label = _segment_bin_label(seg)
 
                 # Use RAW order for clipId + startTimes to match Concepto AVPreview indexing.
                 shots_raw = seg.get("shots") or []
@@ -1928,7 +3274,25 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 # Timeline
                 tl_name = f"CONCEPTO_{show_name}_{episode_name}"
                 timeline = resolve_get_or_create_timeline(project, tl_name)
-                self._log(f"Using timeline: {getattr(timeline,'GetName',lambda:tl_name)()}")
+                tl_display_name = _name(timeline, tl_name)
+                self._log(f"Using timeline: {tl_display_name}")
+
+                # Frame rate + start timecode don't change during the build: read them once
+                # (most timelines start at 01:00:00:00, i.e. a 3600s offset)
+                try:
+                    fps, tl_start_sec, start_tc = _get_timeline_settings(timeline)
+                    self._log(f"Timeline starts at {start_tc} ({tl_start_sec}s offset) @ {fps}fps")
+                except Exception as e:
+                    fps, tl_start_sec = 24.0, 0.0
+                    self._log(f"Note: Could not read timeline settings, using 24fps and 0.0 start offset: {e}")
+
+                # Make the timeline current once; every placement below targets it
+                try:
+                    project.SetCurrentTimeline(timeline)
+                    self._log(f"Set timeline as current: {tl_display_name}")
+                except Exception as e:
+                    self._log(f"Warning: Could not set timeline as current: {e}")
+                timeline_start_frame = int(round(tl_start_sec * fps))
 
                 # Collect audio track assets once for the entire segment (these go in episode folder, not take folders)
                 audio_track_assets = _collect_audio_track_assets(
@@ -1939,62 +3303,69 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 )
                 audio_local_files: List[str] = []  # Collect downloaded audio files for later bin import
                 
+                # Download the segment's audio tracks and every take's assets on one pool up front;
+                # the loops below only read the results, so placement order is unchanged
+                sorted_shots = _shots_in_script_order(shots_raw)
+                takes = [(shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "") for idx, (_, shot) in enumerate(sorted_shots)]
+                take_assets = [_collect_take_assets(shot, self.cfg.api_endpoint) for _, shot in sorted_shots]
+                audio_dir = episode_dir / "AVPreview_Audio"
+                download_jobs = [(url, _asset_dest(audio_dir, url, filename)) for url, filename in audio_track_assets]
+                for take, assets in zip(takes, take_assets):
+                    download_jobs.extend((url, _asset_dest(episode_dir / take, url, filename)) for url, filename in assets)
+                self._log(
+                    f"Downloading {len(audio_track_assets)} audio track assets from AV Preview "
+                    f"and {len(download_jobs) - len(audio_track_assets)} take assets..."
+                )
+                fetched = _fetch_assets(download_jobs, dl_index, self.cfg.max_parallel_downloads, log=self._log)
+
                 if audio_track_assets:
-                    audio_dir = episode_dir / "AVPreview_Audio"
                     audio_dir.mkdir(parents=True, exist_ok=True)
-                    self._log(f"Downloading {len(audio_track_assets)} audio track assets from AV Preview...")
                     for url, filename in audio_track_assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = audio_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"Downloaded audio track: {dest.name}")
-                                audio_local_files.append(str(dest))
-                            except Exception as e:
-                                self._log(f"Failed to download audio track {filename}: {e}")
-                                continue
-                        else:
-                            # File already exists, add to list for import
-                            audio_local_files.append(str(dest))
+                        dest = _asset_dest(audio_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"Failed to download audio track {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"Downloaded audio track: {dest.name}")
+                        audio_local_files.append(str(dest))
                 else:
                     self._log("INFO: No audio tracks found in AV Preview for this segment.")
 
                 # Process takes - sort by order (row) to ensure proper sequencing
-                sorted_shots = sorted(shots_raw, key=lambda s: (float(s.get("order", 0) or 0), float(s.get("shotNumber", 0) or 0)))
                 self._log(f"Processing {len(sorted_shots)} shots in order (sorted by row/order field)")
                 
                 # List to collect placeholders for SRT generation
                 placeholders_to_create = []
                 
-                for idx, shot in enumerate(sorted_shots):
-                    take = (shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "")
+                # Timeline methods used per take, looked up once
+                add_marker_fn = _method(timeline, "AddMarker")
+                # Markers are queued per take and added after all placements
+                pending_markers: List[Tuple[int, str, str, str, int]] = []
+
+                # Frame intervals occupied on V1: read from Resolve once, then kept up to date as we place
+                placed_intervals = _track_intervals(timeline, "video", 1)
+                
+                for idx, (raw_idx, shot) in enumerate(sorted_shots):
+                    take = takes[idx]
                     take_dir = episode_dir / take
 
-                    # Download assets
-                    assets = _collect_take_assets(shot, self.cfg.api_endpoint)
-                    # ... rest of download ...
-                    local_files: List[str] = []
+                    # Assets were fetched up front (see download_jobs above)
+                    assets = take_assets[idx]
+                    local_files: List[LocalFile] = []
                     for url, filename in assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = take_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"[{take}] Downloaded: {dest.name}")
-                            except Exception as e:
-                                self._log(f"[{take}] Failed to download {filename}: {e}")
-                                continue
-                        local_files.append(str(dest))
+                        dest = _asset_dest(take_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"[{take}] Failed to download {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"[{take}] Downloaded: {dest.name}")
+                        local_files.append(_local_file_info(str(dest)))
 
                     # Create bins + import
-                    seg_label = f"SC{int(seg.get('segmentNumber',0)):02d}_{_safe_slug(seg.get('title',''))}"[:80]
-                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, take)
-                    imported = resolve_import_files(media_pool, take_folder, local_files)
+                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, take, cache=bins)
+                    imported = resolve_import_files(media_pool, take_folder, [lf.path for lf in local_files])
                     self._log(f"[{take}] Imported {len(imported)} items into bin.")
 
                     # Place main on timeline (or collect for subtitle if no video/image)
@@ -2004,7 +3375,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                     visual_description = shot.get("visual", "")
                     
                     # Collect details for ALL takes into SRT (for full script overlay)
-                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{idx}"
+                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{raw_idx}"
                     start_sec = float(start_times.get(clip_id, 0.0))
                     dur_sec = float(shot.get("duration") or 0)
                     if dur_sec <= 0: dur_sec = 3.0
@@ -2027,73 +3398,28 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
 
 
                     # Find matching local file for main - prioritize based on what's actually available
-                    main_file = None
-                    if has_video:
-                        # Look for MAIN_video first
-                        for f in local_files:
-                            if f.endswith(".mp4") and "MAIN_video" in os.path.basename(f):
-                                main_file = f
-                                self._log(f"[{take}] Found main video file: {os.path.basename(f)}")
-                                break
-                    
-                    if not main_file and has_image:
-                        # Look for MAIN_image (check multiple extensions)
-                        for f in local_files:
-                            basename = os.path.basename(f).lower()
-                            if "MAIN_image" in basename and any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                main_file = f
-                                self._log(f"[{take}] Found main image file: {os.path.basename(f)}")
-                                break
-                    
-                    # Fallback: if we still don't have a main file, try to find any video or image
-                    if not main_file:
-                        if has_video:
-                            # Look for any .mp4 file
-                            for f in local_files:
-                                if f.endswith(".mp4"):
-                                    main_file = f
-                                    self._log(f"[{take}] Using fallback video file: {os.path.basename(f)}")
-                                    break
-                        elif has_image:
-                            # Look for any image file
-                            for f in local_files:
-                                basename = os.path.basename(f).lower()
-                                if any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                    main_file = f
-                                    self._log(f"[{take}] Using fallback image file: {os.path.basename(f)}")
-                                    break
-                    
-                    # Last resort: use first file
-                    if not main_file and local_files:
-                        main_file = local_files[0]
-                        self._log(f"[{take}] Using first available file as main: {os.path.basename(main_file)}")
+                    main_lf, how = _pick_main_file(local_files, has_video, has_image)
+                    main_file = main_lf.path if main_lf else None
+                    if main_lf:
+                        self._log(f"[{take}] {how}: {main_lf.basename}")
                     
                     if not main_file:
                         self._log(f"[{take}] WARNING: Could not find main file in downloaded assets!")
                         self._log(f"[{take}] Debug: local_files count={len(local_files)}")
                         for f in local_files[:5]:  # Show first 5 files
-                            self._log(f"[{take}]   - {os.path.basename(f)}")
+                            self._log(f"[{take}]   - {f.basename}")
 
                     # Find media pool item that matches the imported main file (best-effort)
-                    main_item = imported[0] if imported else None
-                    # If we can list clips in folder, pick by name match
-                    get_clips = _method(take_folder, "GetClipList")
-                    if get_clips and main_file:
-                        want = os.path.basename(main_file)
-                        for it in take_folder.GetClipList() or []:
-                            nm = getattr(it, "GetName", lambda: "")()
-                            if nm == want or want in nm:
-                                main_item = it
-                                break
+                    main_item = _match_imported_item(imported, take_folder, main_file)
 
                     if not main_item:
                         self._log(f"[{take}] Could not find MediaPoolItem for main, skipping timeline.")
                         self._log(f"[{take}] Debug: imported={len(imported)} items, main_file={main_file}")
                         if imported:
-                            self._log(f"[{take}] Debug: first imported item name={getattr(imported[0], 'GetName', lambda: '(no GetName)')()}")
+                            self._log(f"[{take}] Debug: first imported item name={_name(imported[0], '(no GetName)')}")
                         continue
 
-                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{idx}"
+                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{raw_idx}"
                     start_sec = float(start_times.get(clip_id, 0.0))
                     dur_sec = float(shot.get("duration") or 0)
                     if dur_sec <= 0:
@@ -2101,263 +3427,76 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         self._log(f"[{take}] Warning: Duration was {shot.get('duration')}, using default 3.0s")
                     off_sec = float(shot.get("videoOffset") or 0) or 0.0
 
-                    item_name = getattr(main_item, "GetName", lambda: "(unknown)")()
+                    item_name = _name(main_item, "(unknown)")
                     self._log(f"[{take}] Placing '{item_name}' on timeline: start={start_sec}s dur={dur_sec}s offset={off_sec}s")
                     
-                    # Validate media pool item before placement
-                    try:
-                        # Check if item has GetClipProperty method
-                        if not hasattr(main_item, "GetClipProperty") and not hasattr(main_item, "GetDuration"):
-                            self._log(f"[{take}] Warning: MediaPoolItem may be invalid (no GetClipProperty/GetDuration method)")
-                        
-                        # Verify item name is not empty
-                        if not item_name or item_name == "(unknown)":
-                            self._log(f"[{take}] Warning: MediaPoolItem has no name")
-                    except Exception as e:
-                        self._log(f"[{take}] Warning: Could not validate MediaPoolItem: {e}")
-                    
-                    # Ensure timeline is current and unlocked
-                    try:
-                        project.SetCurrentTimeline(timeline)
-                        self._log(f"[{take}] Set timeline as current: {getattr(timeline, 'GetName', lambda: '(unknown)')()}")
-                    except Exception as e:
-                        self._log(f"[{take}] Warning: Could not set timeline as current: {e}")
-                    
-                    # Check for overlaps with existing clips on timeline and adjust position
-                    try:
-                        fps_raw = timeline.GetSetting("timelineFrameRate")
-                        fps = float(fps_raw) if fps_raw else 24.0
-                    except Exception:
-                        fps = 24.0
-                    
-                    # Get timeline start timecode
-                    timeline_start_frame = 0
-                    try:
-                        get_start_tc = _method(timeline, "GetStartTimecode")
-                        if get_start_tc:
-                            start_tc_str = timeline.GetStartTimecode()
-                            if start_tc_str and isinstance(start_tc_str, str) and ":" in start_tc_str:
-                                try:
-                                    parts = start_tc_str.split(":")
-                                    if len(parts) == 4:
-                                        h, m, s, f = map(int, parts)
-                                        timeline_start_sec = h * 3600 + m * 60 + s + (f / fps)
-                                        timeline_start_frame = int(round(timeline_start_sec * fps))
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
+                    # Validate media pool item before placement: _name() above already called GetName,
+                    # so a missing method shows up as the default instead of extra hasattr probes
+                    if item_name == "(unknown)":
+                        self._log(f"[{take}] Warning: MediaPoolItem may be invalid (no GetName method)")
+                    elif not item_name:
+                        self._log(f"[{take}] Warning: MediaPoolItem has no name")
                     
                     # Calculate target frame positions
                     target_start_frame = int(round(start_sec * fps)) + timeline_start_frame
                     target_end_frame = target_start_frame + int(round(dur_sec * fps))
                     
-                    # Get existing clips on V1 to check for overlaps
-                    get_items = _method(timeline, "GetItemListInTrack")
-                    if get_items:
-                        try:
-                            existing_items = timeline.GetItemListInTrack("video", 1) or []
-                            for ex_item in existing_items:
-                                try:
-                                    ex_start = None
-                                    ex_end = None
-                                    for m in ["GetStart", "GetStartFrame"]:
-                                        fn = _method(ex_item, m)
-                                        if fn:
-                                            try:
-                                                ex_start = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
-                                    for m in ["GetEnd", "GetEndFrame"]:
-                                        fn = _method(ex_item, m)
-                                        if fn:
-                                            try:
-                                                ex_end = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
-                                    if ex_start is not None and ex_end is not None:
-                                        # Check for overlap
-                                        if not (target_end_frame <= ex_start or target_start_frame >= ex_end):
-                                            # Overlap detected - move new clip to start AFTER existing clip
-                                            self._log(f"[{take}] Overlap detected with clip at frames {ex_start}-{ex_end}, adjusting position")
-                                            adjusted_start_frame = ex_end
-                                            start_sec = (adjusted_start_frame - timeline_start_frame) / fps
-                                            target_start_frame = adjusted_start_frame
-                                            target_end_frame = target_start_frame + int(round(dur_sec * fps))
-                                            self._log(f"[{take}] Adjusted start to {start_sec:.3f}s (frame {adjusted_start_frame}) to avoid overlap")
-                                            break
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
+                    # Check against clips already on V1 (sorted interval list, no per-take timeline scan).
+                    # Each shift only moves forward through the sorted list, so this walk ends at the first gap.
+                    overlap = _find_overlap(placed_intervals, target_start_frame, target_end_frame)
+                    while overlap:
+                        ex_start, ex_end = overlap
+                        # Overlap detected - move new clip to start AFTER existing clip
+                        self._log(f"[{take}] Overlap detected with clip at frames {ex_start}-{ex_end}, adjusting position")
+                        adjusted_start_frame = ex_end
+                        start_sec = (adjusted_start_frame - timeline_start_frame) / fps
+                        target_start_frame = adjusted_start_frame
+                        target_end_frame = target_start_frame + int(round(dur_sec * fps))
+                        self._log(f"[{take}] Adjusted start to {start_sec:.3f}s (frame {adjusted_start_frame}) to avoid overlap")
+                        overlap = _find_overlap(placed_intervals, target_start_frame, target_end_frame)
                     
                     try:
                         # Both videos and images use "video" track type in Resolve
                         # This allows images to be moved just like videos
-                        is_image = main_file and any(main_file.lower().endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"])
+                        is_image = bool(main_lf and main_lf.is_image)  # extension already classified in _local_file_info
                         track_type = "video"  # Images also go on video tracks in Resolve
                         self._log(f"[{take}] Placing {'image' if is_image else 'video'} on video track V1 at {start_sec:.3f}s")
-                        resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=1, track_type=track_type)
+                        placed_item = resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=1, track_type=track_type, ensure_current=False)
+                        bisect.insort(placed_intervals, (target_start_frame, target_end_frame))
                         self._log(f"[{take}] ✓ Successfully placed on timeline")
+                        # Verify from the returned TimelineItem (no sleep / track re-scan)
+                        rng = _item_frame_range(placed_item) if placed_item is not None else None
+                        if rng:
+                            self._log(f"[{take}] ✓ Verified clip on timeline: start={rng[0]}, end={rng[1]}")
                     except Exception as e:
                         self._log(f"[{take}] ✗ Failed to place on timeline: {type(e).__name__}: {e}")
-                        import traceback
-                        self._log(f"[{take}] Traceback: {traceback.format_exc()}")
-                    
-                    # Verify clip was actually placed by checking timeline items
-                    try:
-                        get_items = _method(timeline, "GetItemListInTrack")
-                        if get_items:
-                            # Small delay to let Resolve process
-                            import time
-                            time.sleep(0.1)
-                            placed_items = timeline.GetItemListInTrack("video", 1) or []
-                            # Check if our clip is there by name
-                            found = False
-                            for placed_item in placed_items:
-                                try:
-                                    placed_name = getattr(placed_item, "GetName", lambda: "")()
-                                    if item_name in placed_name or take in placed_name:
-                                        # Get the timeline item properties
-                                        try:
-                                            get_start = _method(placed_item, "GetStart")
-                                            get_end = _method(placed_item, "GetEnd")
-                                            if get_start and get_end:
-                                                item_start = placed_item.GetStart()
-                                                item_end = placed_item.GetEnd()
-                                                self._log(f"[{take}] ✓ Verified clip on timeline: start={item_start}, end={item_end}")
-                                        except Exception:
-                                            pass
-                                        found = True
-                                        break
-                                except Exception:
-                                    pass
-                            if not found:
-                                self._log(f"[{take}] ⚠ WARNING: Clip may not be visible on timeline after placement")
-                    except Exception as e:
-                        self._log(f"[{take}] Could not verify timeline placement: {e}")
                     
                     # Add a marker for mapping/sync (best-effort)
-                    try:
-                        fps_raw = timeline.GetSetting("timelineFrameRate")
-                        fps = float(fps_raw) if fps_raw else 24.0
-                    except Exception:
-                        fps = 24.0
-                    add_marker = _method(timeline, "AddMarker")
-                    if add_marker:
-                        try:
-                            frame = _seconds_to_frames(start_sec, fps)
-                            note = json.dumps({
-                                "concepto": True,
-                                "episodeId": self.cfg.episode_id,
-                                "segmentId": seg.get("id"),
-                                "shotId": shot.get("id"),
-                                "take": take,
-                                "clipId": clip_id,
-                            })
-                            timeline.AddMarker(frame, "Blue", f"{take}", note, 1)
-                        except Exception:
-                            pass
+                    if add_marker_fn:
+                        note = _marker_note(self.cfg.episode_id, seg.get("id"), shot.get("id"), take, clip_id)
+                        pending_markers.append((_seconds_to_frames(start_sec, fps), "Blue", f"{take}", note, 1))
 
-                # After all takes are processed, create subtitle track from placeholders if any
-                if placeholders_to_create:
-                    self._log(f"Generating subtitle track for {len(placeholders_to_create)} placeholders...")
+                # Flush the take markers in one go now that V1 is laid out (best-effort)
+                for marker in pending_markers:
                     try:
-                        # Convert to SRT time format: HH:MM:SS,mmm
-                        def to_srt_time(secs):
-                            h = int(secs // 3600)
-                            m = int((secs % 3600) // 60)
-                            s = int(secs % 60)
-                            ms = int((secs % 1) * 1000)
-                            return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-                        
-                        srt_lines = []
-                        for i, p in enumerate(placeholders_to_create):
-                            start_sec = p['start']
-                            end_sec = p['start'] + p['duration']
-                            # SRT likes single lines or explicit \n
-                            text = p['text'].replace('\n', ' ')
-                            
-                            srt_lines.append(str(i + 1))
-                            srt_lines.append(f"{to_srt_time(start_sec)} --> {to_srt_time(end_sec)}")
-                            srt_lines.append(text)
-                            srt_lines.append("")
-                        
-                        srt_content = "\n".join(srt_lines)
-                        srt_path = os.path.join(episode_dir, "placeholders.srt")
-                        with open(srt_path, "w", encoding="utf-8") as f:
-                            f.write(srt_content)
-                        
-                        self._log(f"Importing subtitles from {srt_path}...")
-                        # Resolve API: ImportIntoTimeline(path, importType="srt")
-                        import_into = _method(timeline, "ImportIntoTimeline")
-                        if import_into:
-                            result = timeline.ImportIntoTimeline(srt_path, {"importType": "subtitle"})
-                            if not result:
-                                # Try alternate importType
-                                result = timeline.ImportIntoTimeline(srt_path, "srt")
-                            
-                            if result:
-                                self._log(f"✓ Subtitle track created successfully!")
-                            else:
-                                self._log(f"⚠ Automatic subtitle import returned False. You can manually import {srt_path}")
-                        else:
-                            self._log(f"⚠ Timeline.ImportIntoTimeline method not found. File is at: {srt_path}")
-                    except Exception as e:
-                        self._log(f"✗ Failed to create subtitle track: {e}")
+                        add_marker_fn(*marker)
+                    except Exception:
+                        pass
 
                 # After all takes are processed, create subtitle track from placeholders if any
                 if placeholders_to_create:
                     self._log(f"Generating subtitle track for {len(placeholders_to_create)} placeholders...")
                     try:
-                        # STEP 1: Get timeline start offset in seconds
-                        # Most timelines start at 01:00:00:00 (3600 seconds)
-                        tl_start_sec = 0.0
-                        try:
-                            fps_raw = timeline.GetSetting("timelineFrameRate")
-                            fps = float(fps_raw) if fps_raw else 24.0
-                            start_tc = timeline.GetStartTimecode() # e.g. "01:00:00:00"
-                            parts = start_tc.split(":")
-                            if len(parts) == 4:
-                                tl_start_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
-                                self._log(f"Timeline starts at {start_tc} ({tl_start_sec}s offset)")
-                        except Exception as e:
-                            self._log(f"Note: Using 0.0 as start offset: {e}")
-
-                        # Convert to SRT time format: HH:MM:SS,mmm
-                        def to_srt_time(secs):
-                            # Add timeline start offset to make times absolute to timeline
-                            absolute_secs = secs + tl_start_sec
-                            h = int(absolute_secs // 3600)
-                            m = int((absolute_secs % 3600) // 60)
-                            s = int(absolute_secs % 60)
-                            ms = int((absolute_secs % 1) * 1000)
-                            return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-                        
-                        srt_lines = []
-                        for i, p in enumerate(placeholders_to_create):
-                            start_sec = p['start']
-                            end_sec = p['start'] + p['duration']
-                            text = p['text'].replace('\n', ' ')
-                            
-                            srt_lines.append(str(i + 1))
-                            srt_lines.append(f"{to_srt_time(start_sec)} --> {to_srt_time(end_sec)}")
-                            srt_lines.append(text)
-                            srt_lines.append("")
-                        
-                        srt_content = "\n".join(srt_lines)
+                        # STEP 1: SRT times are absolute, so they include the timeline start offset (tl_start_sec)
                         srt_path = os.path.join(episode_dir, "placeholders.srt")
-                        with open(srt_path, "w", encoding="utf-8") as f:
-                            f.write(srt_content)
+                        _write_srt(srt_path, placeholders_to_create, tl_start_sec)
                         
                         self._log(f"Importing subtitles from {srt_path}...")
                         
                         # STEP 2: Import SRT into Media Pool for visibility
                         srt_item = None
                         try:
-                            srt_bin = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, "Subtitles")
+                            srt_bin = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, "Subtitles", cache=bins)
                             media_pool.SetCurrentFolder(srt_bin)
                             imported_items = media_pool.ImportMedia([srt_path])
                             if imported_items:
@@ -2386,35 +3525,9 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 # After all takes are processed, create audio bin and import audio files
                 if audio_local_files:
                     try:
-                        seg_label = f"SC{int(seg.get('segmentNumber',0)):02d}_{_safe_slug(seg.get('title',''))}"[:80]
-                        concepto_root = media_pool.GetRootFolder()
-                        concepto_folder = None
-                        # Find or create CONCEPTO folder
-                        for f in concepto_root.GetSubFolderList() or []:
-                            if getattr(f, "GetName", lambda: "")() == "CONCEPTO":
-                                concepto_folder = f
-                                break
-                        if not concepto_folder:
-                            concepto_folder = media_pool.AddSubFolder(concepto_root, "CONCEPTO")
-                        
-                        # Find or create segment folder
-                        seg_folder = None
-                        for f in concepto_folder.GetSubFolderList() or []:
-                            if getattr(f, "GetName", lambda: "")() == seg_label:
-                                seg_folder = f
-                                break
-                        if not seg_folder:
-                            seg_folder = media_pool.AddSubFolder(concepto_folder, seg_label)
-                        
-                        # Create AVPreview_Audio bin (below all takes)
+                        # Same BinCache as the take bins: CONCEPTO/<segment> are already resolved, no folder walks
                         audio_bin_name = "AVPreview_Audio"
-                        audio_bin = None
-                        for f in seg_folder.GetSubFolderList() or []:
-                            if getattr(f, "GetName", lambda: "")() == audio_bin_name:
-                                audio_bin = f
-                                break
-                        if not audio_bin:
-                            audio_bin = media_pool.AddSubFolder(seg_folder, audio_bin_name)
+                        audio_bin = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, audio_bin_name, cache=bins)
                         
                         self._log(f"Creating audio bin '{audio_bin_name}' and importing {len(audio_local_files)} audio file(s)...")
                         imported_audio = resolve_import_files(media_pool, audio_bin, audio_local_files)
@@ -2427,117 +3540,66 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                             if not audio_tracks:
                                 self._log("AUDIO: No avPreviewData.audioTracks to place on timeline.")
                             else:
-                                # Build name -> MediaPoolItem map from audio bin
-                                name_to_item: Dict[str, Any] = {}
-                                get_clip_list = _method(audio_bin, "GetClipList")
-                                if get_clip_list:
-                                    for it in (audio_bin.GetClipList() or []):
-                                        try:
-                                            nm = getattr(it, "GetName", lambda: "")()
-                                            if nm:
-                                                name_to_item[nm] = it
-                                        except Exception:
-                                            pass
-
-                                # Ensure enough audio tracks exist (best-effort)
-                                get_track_count = _method(timeline, "GetTrackCount")
-                                add_track = _method(timeline, "AddTrack")
-                                desired = len(audio_tracks)
-                                if get_track_count:
-                                    try:
-                                        current_a = int(timeline.GetTrackCount("audio") or 0)
-                                    except Exception:
-                                        current_a = 1
-                                    if add_track and current_a < desired:
-                                        for _ in range(desired - current_a):
-                                            try:
-                                                add_track("audio")
-                                            except Exception:
-                                                break
+                                # Build name -> MediaPoolItem map straight from what ImportMedia returned
+                                # (only list the bin if the import gave nothing back)
+                                name_items = imported_audio
+                                if not name_items and _method(audio_bin, "GetClipList"):
+                                    name_items = audio_bin.GetClipList() or []
+                                name_to_item = _build_name_index(name_items)
 
                                 # Place AVPreview audio on A2+ (A1 is reserved for embedded video audio)
                                 audio_track_offset = 2  # Start AVPreview audio on A2
                                 self._log(f"AUDIO: Placing {sum(len(t.get('clips') or []) for t in audio_tracks)} AVPreview audio clip(s) onto timeline A{audio_track_offset}+...")
-                                
-                                # Ensure at least A2 exists for AVPreview audio
-                                if get_track_count:
+
+                                # Ensure A2..A(1+N) exist: read the track count once, add the missing tracks (best-effort)
+                                needed_a = audio_track_offset + len(audio_tracks) - 1
+                                add_track = _method(timeline, "AddTrack")
+                                if add_track and _method(timeline, "GetTrackCount"):
                                     try:
                                         current_a = int(timeline.GetTrackCount("audio") or 0)
                                     except Exception:
                                         current_a = 1
-                                    if add_track and current_a < audio_track_offset:
-                                        for _ in range(audio_track_offset - current_a):
-                                            try:
-                                                add_track("audio")
-                                            except Exception:
-                                                break
-                                
+                                    for _ in range(needed_a - current_a):
+                                        try:
+                                            add_track("audio")
+                                        except Exception:
+                                            break
+
+                                audio_placements: List[Dict[str, Any]] = []
                                 for t_idx, tr in enumerate(audio_tracks):
-                                    clips = tr.get("clips") or []
                                     # Use separate audio track per AVPreview track (A2, A3, etc.)
                                     target_audio_track = audio_track_offset + t_idx
                                     
-                                    # Ensure track exists
-                                    if get_track_count and add_track:
-                                        try:
-                                            current_a = int(timeline.GetTrackCount("audio") or 0)
-                                            if current_a < target_audio_track:
-                                                for _ in range(target_audio_track - current_a):
-                                                    try:
-                                                        add_track("audio")
-                                                    except Exception:
-                                                        break
-                                        except Exception:
-                                            pass
-                                    
-                                    for c_idx, cl in enumerate(clips):
-                                        if not isinstance(cl, dict):
-                                            continue
-                                        fn = _audio_clip_filename(tr, cl)
-                                        want_name = _safe_slug(fn)
-                                        mp_item = name_to_item.get(want_name)
-                                        if not mp_item and name_to_item:
-                                            # fallback: contains match
-                                            for k, v in name_to_item.items():
-                                                if want_name in k:
-                                                    mp_item = v
-                                                    break
+                                    for c_idx, want_name, st, du, off in _audio_clip_specs(tr):
+                                        mp_item = _lookup_by_name(name_to_item, want_name)
                                         if not mp_item:
                                             self._log(f"AUDIO: Missing MediaPoolItem for {want_name} (AVPreview track {t_idx+1} clip {c_idx+1})")
                                             continue
-                                        st = float(cl.get("startTime") or 0)
-                                        du = float(cl.get("duration") or 0)
-                                        off = float(cl.get("offset") or 0)
-                                        if du <= 0:
-                                            du = 1.0
                                         self._log(f"AUDIO: Place '{want_name}' A{target_audio_track} (AVPreview track {t_idx+1}) start={st}s dur={du}s offset={off}s")
-                                        try:
-                                            resolve_place_on_timeline(
-                                                project,
-                                                media_pool,
-                                                timeline,
-                                                mp_item,
-                                                record_seconds=st,
-                                                duration_seconds=du,
-                                                offset_seconds=off,
-                                                log_callback=self._log,
-                                                track_index=target_audio_track,
-                                                track_type="audio",
-                                            )
-                                        except Exception as e:
-                                            self._log(f"AUDIO: Failed placing '{want_name}': {type(e).__name__}: {e}")
+                                        audio_placements.append({
+                                            "item": mp_item,
+                                            "record_seconds": st,
+                                            "duration_seconds": du,
+                                            "offset_seconds": off,
+                                            "track_index": target_audio_track,
+                                            "track_type": "audio",
+                                        })
+
+                                # One AppendToTimeline round-trip for all AVPreview audio clips
+                                placed_n = resolve_place_batch(project, media_pool, timeline, audio_placements, log_callback=self._log)
+                                self._log(f"AUDIO: Placed {placed_n}/{len(audio_placements)} AVPreview audio clip(s)")
                         except Exception as e:
                             self._log(f"AUDIO: Unexpected error while placing audio: {type(e).__name__}: {e}")
                     except Exception as e:
-                        self._log(f"ERROR: Failed to create audio bin or import audio files: {e}")
-                        import traceback
-                        self._log(f"Traceback: {traceback.format_exc()}")
+                        self._log(f"ERROR: Failed to create audio bin or import audio files: {type(e).__name__}: {e}")
 
                 self._log("Done: Download + bins + timeline build completed.")
             except Exception as e:
                 self._log(f"ERROR: {e}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        # One build at a time: the button comes back when the queued build finishes
+        self.download_btn.setEnabled(False)
+        self._run_in_background(worker, on_done=lambda: self.download_btn.setEnabled(True))
 
     def on_sync(self):
         def worker():
@@ -2557,11 +3619,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 if not seg:
                     raise RuntimeError("Selected segment not found.")
                 shots_raw = seg.get("shots") or []
-                take_to_shot: Dict[str, Dict[str, Any]] = {}
-                for idx, sh in enumerate(shots_raw):
-                    take = (sh.get("take") or "").replace("_image", "")
-                    if take:
-                        take_to_shot[take] = {"shot": sh, "idx": idx}
+                take_to_shot = _build_take_map(shots_raw)
 
                 # fps
                 try:
@@ -2578,10 +3636,8 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         start_tc_str = timeline.GetStartTimecode()
                         if start_tc_str and isinstance(start_tc_str, str) and ":" in start_tc_str:
                             try:
-                                parts = start_tc_str.split(":")
-                                if len(parts) == 4:
-                                    h, m, s, f = map(int, parts)
-                                    timeline_start_sec = h * 3600 + m * 60 + s + (f / fps)
+                                timeline_start_sec = _timecode_to_seconds(start_tc_str, fps)
+                                if timeline_start_sec is not None:
                                     timeline_start_frame = int(round(timeline_start_sec * fps))
                                     self._log(f"SYNC: Timeline start timecode: {start_tc_str} ({timeline_start_frame} frames)")
                             except Exception:
@@ -2596,60 +3652,31 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 get_track_count = _method(timeline, "GetTrackCount")
                 get_items = _method(timeline, "GetItemListInTrack")
                 
-                if get_track_count and get_items:
-                    # 1. SCAN VIDEO TRACKS (Timing & Offset)
-                    try:
-                        v_tracks = int(timeline.GetTrackCount("video") or 0)
-                    except Exception:
-                        v_tracks = 1
-                    
-                    self._log(f"SYNC: Scanning {v_tracks} video tracks for timing...")
-                    for t in range(1, v_tracks + 1):
-                        items = timeline.GetItemListInTrack("video", t) or []
-                        for it in items:
-                            nm = ""
-                            try:
-                                nm = it.GetName()
-                            except Exception:
-                                try:
-                                    mpit = it.GetMediaPoolItem()
-                                    nm = mpit.GetName() if mpit else ""
-                                except Exception:
-                                    nm = ""
-                            
-                            take_match = re.search(r"(SC\d{2}T\d{2})", nm)
-                            if take_match:
-                                take = take_match.group(1)
-                                if take in take_to_shot:
-                                    sh = take_to_shot[take]["shot"]
-                                    idx = take_to_shot[take]["idx"]
-                                    clip_id = f"{seg.get('id')}-{sh.get('id')}-{idx}"
-                                    
-                                    # Read position
-                                    for m in ["GetStart", "GetStartFrame"]:
-                                        fn = _method(it, m)
-                                        if fn:
-                                            pos = fn()
-                                            if pos is not None:
-                                                updated_start_times[clip_id] = (int(pos) - timeline_start_frame) / fps
-                                                break
+                if not take_to_shot:
+                    # No takes in this segment: nothing on the video or subtitle tracks can match
+                    self._log("SYNC: Segment has no takes; skipping timeline scan.")
+                elif get_track_count and get_items:
+                    # 1. SCAN VIDEO TRACKS (Timing & Offset): one pass over all tracks, then look takes up
+                    take_index = _index_timeline_by_take(timeline, "video")
+                    self._log(f"SYNC: Found {len(take_index)} take(s) on video tracks for timing...")
+                    for take, entries in take_index.items():
+                        if take not in take_to_shot:
+                            continue
+                        for _t, it in entries:
+                            sh = take_to_shot[take]["shot"]
+                            idx = take_to_shot[take]["idx"]
+                            clip_id = f"{seg.get('id')}-{sh.get('id')}-{idx}"
                                     
-                                    # Read duration & offset
-                                    updates = {}
-                                    dur_fn = _method(it, "GetDuration")
-                                    if dur_fn: updates["duration"] = float(dur_fn()) / fps
+                            # Position, duration & source offset from one property read
+                            pos, dur_frames, in_frame = _item_sync_timing(it)
+                            if pos is not None:
+                                updated_start_times[clip_id] = (pos - timeline_start_frame) / fps
                                     
-                                    # Source Offset (best effort)
-                                    try:
-                                        prop_fn = _method(it, "GetProperty") or _method(it, "GetClipProperty")
-                                        if prop_fn:
-                                            props = prop_fn()
-                                            if isinstance(props, dict):
-                                                in_f = props.get("In") or props.get("StartFrame")
-                                                if in_f: updates["videoOffset"] = float(in_f) / fps
-                                    except Exception: pass
+                            updates = {}
+                            if dur_frames is not None: updates["duration"] = dur_frames / fps
+                            if in_frame: updates["videoOffset"] = in_frame / fps
                                     
-                                    if updates: updated_shots.append((sh.get("id"), updates))
+                            if updates: updated_shots.append((sh.get("id"), updates))
 
                     # 2. SCAN SUBTITLE TRACKS (Visual Description)
                     try:
@@ -2661,44 +3688,24 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         self._log(f"SYNC: Scanning {s_tracks} subtitle tracks for text edits...")
                         for t in range(1, s_tracks + 1):
                             items = timeline.GetItemListInTrack("subtitle", t) or []
+                            # Items on one track share an API class: pick the text accessors once per track
+                            # (GetName - Resolve often puts subtitle text in the name - then GetText, then properties)
+                            readers = _subtitle_text_readers(items[0], _SUBTITLE_TEXT_PROPS + ("Notes",)) if items else []
                             for it in items:
                                 try:
-                                    # Try EVERY possible way to get text from a subtitle item
-                                    content = ""
-                                    
-                                    # 1. Try GetName (Resolve often puts subtitle text in name)
-                                    try: content = it.GetName()
-                                    except Exception: pass
-                                    
-                                    # 2. Try GetText
-                                    if not content:
-                                        try:
-                                            fn = _method(it, "GetText")
-                                            if fn: content = fn()
-                                        except Exception: pass
-                                        
-                                    # 3. Try Properties
-                                    if not content:
-                                        try:
-                                            prop_fn = _method(it, "GetProperty")
-                                            if prop_fn:
-                                                content = prop_fn("Text") or prop_fn("Caption") or prop_fn("Notes")
-                                        except Exception: pass
+                                    content = _read_subtitle_text(it, readers)
 
-                                    if not content:
+                                    # No "SC" means no take tag: skip the regex for plain titles/captions
+                                    if not content or "SC" not in content:
                                         continue
                                     
-                                    # Clean content for regex (remove newlines)
-                                    search_text = content.replace("\n", " ")
-                                    
-                                    # Look for take ID like [SC01T06] - more flexible regex
-                                    take_match = re.search(r"\[?\s*(SC\d{2}T\d{2})\s*\]?", search_text)
-                                    if take_match:
-                                        take = take_match.group(1)
+                                    # Take ID like [SC01T06] and the text without it, from one regex pass
+                                    take, stripped = _split_take_tag(content)
+                                    if take:
                                         if take in take_to_shot:
                                             sh = take_to_shot[take]["shot"]
-                                            # New visual: remove the [SCXXTXX] part from the content
-                                            new_visual = re.sub(r"\[?\s*SC\d{2}T\d{2}\s*\]?\s*", "", content, flags=re.IGNORECASE).strip()
+                                            # New visual: the content with the [SCXXTXX] part removed
+                                            new_visual = stripped.strip()
                                             
                                             old_visual = (sh.get("visual") or "").strip()
                                             if new_visual and new_visual != old_visual:
@@ -2719,16 +3726,23 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         self._log(f"SYNC: ✓ Successfully updated videoClipStartTimes in Concepto")
                     except Exception as e:
                         self._log(f"SYNC: ERROR updating Concepto: {type(e).__name__}: {e}")
-                        import traceback
-                        self._log(f"SYNC: Traceback: {traceback.format_exc()}")
                 else:
                     self._log("SYNC: No startTime changes detected (or unable to read them).")
                     self._log("SYNC: Tip: Make sure clips are on the timeline and visible in the Edit page.")
 
                 if updated_shots:
-                    self._log(f"SYNC: Updating {len(updated_shots)} shots (duration/videoOffset) -> Concepto...")
+                    # One entry per shot: timing and subtitle-visual edits for the same shot go out together
+                    merged_updates: Dict[str, Dict[str, Any]] = {}
                     for shot_id, updates in updated_shots:
-                        self.client.update_shot(shot_id, updates)
+                        merged_updates.setdefault(shot_id, {}).update(updates)
+                    self._log(f"SYNC: Updating {len(merged_updates)} shots (duration/videoOffset) -> Concepto...")
+                    missing = self.client.update_shots_bulk(self.cfg.episode_id, merged_updates)
+                    if missing is None:
+                        self._log("SYNC: Server has no bulk shot update; updating shots one by one...")
+                        for shot_id, updates in merged_updates.items():
+                            self.client.update_shot(shot_id, updates)
+                    elif missing:
+                        self._log(f"SYNC: Warning: {len(missing)} shot(s) not found in Concepto, not updated: {', '.join(missing)}")
                 else:
                     self._log("SYNC: No duration/videoOffset changes detected (or unable to read them).")
 
@@ -2736,11 +3750,12 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
             except Exception as e:
                 self._log(f"SYNC ERROR: {e}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_sync_from_concepto(self):
         """Sync changes FROM Concepto TO Resolve timeline"""
         def worker():
+            end_undo: Optional[Callable[[], None]] = None  # closes the undo group around the timeline edits
             try:
                 if not self.client or not self.episode or not self.selected_segment_id:
                     raise RuntimeError("Load an episode and select a segment first.")
@@ -2763,7 +3778,8 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 
                 # Connect to Resolve
                 self._log("SYNC FROM CONCEPTO: Connecting to Resolve...")
-                _resolve, project, _media_pool = resolve_get_context()
+                _resolve, project, media_pool = resolve_get_context()
+                bins = BinCache(media_pool)
                 timeline = project.GetCurrentTimeline()
                 if not timeline:
                     raise RuntimeError("No current timeline open.")
@@ -2783,10 +3799,8 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         start_tc_str = timeline.GetStartTimecode()
                         if start_tc_str and isinstance(start_tc_str, str) and ":" in start_tc_str:
                             try:
-                                parts = start_tc_str.split(":")
-                                if len(parts) == 4:
-                                    h, m, s, f = map(int, parts)
-                                    timeline_start_sec = h * 3600 + m * 60 + s + (f / fps)
+                                timeline_start_sec = _timecode_to_seconds(start_tc_str, fps)
+                                if timeline_start_sec is not None:
                                     timeline_start_frame = int(round(timeline_start_sec * fps))
                                     self._log(f"SYNC FROM CONCEPTO: Timeline start: {start_tc_str} ({timeline_start_frame} frames)")
                             except Exception:
@@ -2795,11 +3809,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                     pass
                 
                 # Build take -> shot mapping
-                take_to_shot: Dict[str, Dict[str, Any]] = {}
-                for idx, sh in enumerate(shots_raw):
-                    take = (sh.get("take") or "").replace("_image", "")
-                    if take:
-                        take_to_shot[take] = {"shot": sh, "idx": idx}
+                take_to_shot = _build_take_map(shots_raw)
                 
                 # Find and update timeline items
                 get_items = _method(timeline, "GetItemListInTrack")
@@ -2807,36 +3817,39 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                     raise RuntimeError("Cannot read timeline items (missing GetItemListInTrack).")
                 
                 updated_count = 0
-                try:
-                    v_tracks = int(timeline.GetTrackCount("video") or 0)
-                except Exception:
-                    v_tracks = 1
-                
-                self._log(f"SYNC FROM CONCEPTO: Scanning {v_tracks} video track(s)...")
-                for t in range(1, v_tracks + 1):
-                    try:
-                        items = timeline.GetItemListInTrack("video", t) or []
-                    except Exception:
+                # One pass over all video tracks (a snapshot taken before any clip is moved), then look takes up
+                take_index = _index_timeline_by_take(timeline, "video")
+                self._log(f"SYNC FROM CONCEPTO: Found {len(take_index)} take(s) on video tracks...")
+
+                # Fetch every placed take's main file from Concepto in parallel before touching the timeline
+                show_name = _safe_slug((self.show or {}).get("name") or self.episode.get("showId") or "UnknownShow")
+                episode_name = _safe_slug(self.episode.get("title") or self.cfg.episode_id)
+                episode_dir = Path(self.cfg.download_root) / show_name / episode_name
+                seg_label = _segment_bin_label(seg)
+                folder_indexes: Dict[str, Dict[str, Any]] = {}
+                download_jobs: List[Tuple[str, Path]] = []
+                for take in take_index:
+                    sh = (take_to_shot.get(take) or {}).get("shot")
+                    main_url = sh and (sh.get("videoUrl") or sh.get("imageUrl"))
+                    if main_url:
+                        filename = _main_asset_filename(take, sh.get("videoUrl"), sh.get("imageUrl"))
+                        download_jobs.append((_resolve_url(main_url, self.cfg.api_endpoint), episode_dir / take / filename))
+                if download_jobs:
+                    self._log(f"SYNC FROM CONCEPTO: Downloading {len(download_jobs)} main file(s) from Concepto...")
+                # Always re-request (conditionally where the index has a validator) so changed files are picked up
+                downloads = _fetch_assets(
+                    download_jobs, DownloadIndex(episode_dir), self.cfg.max_parallel_downloads, fetch=_download_file, log=self._log
+                )
+
+                end_undo = _begin_undo_group(project, "Sync from Concepto")
+                if end_undo:
+                    self._log("SYNC FROM CONCEPTO: Grouping timeline edits into one undo step")
+                else:
+                    self._log("SYNC FROM CONCEPTO: Undo grouping not available in this Resolve build; edits are undone one by one")
+                for take, entries in take_index.items():
+                    if take not in take_to_shot:
                         continue
-                    
-                    for it in items:
-                        # Identify clip by name
-                        nm = ""
-                        try:
-                            nm = it.GetName()
-                        except Exception:
-                            try:
-                                mpit = it.GetMediaPoolItem()
-                                nm = mpit.GetName() if mpit else ""
-                            except Exception:
-                                nm = ""
-                        
-                        take_match = re.search(r"(SC\d{2}T\d{2})", nm)
-                        if not take_match:
-                            continue
-                        take = take_match.group(1)
-                        if take not in take_to_shot:
-                            continue
+                    for t, it in entries:
                         
                         sh = take_to_shot[take]["shot"]
                         idx = take_to_shot[take]["idx"]
@@ -2858,7 +3871,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         try:
                             get_mp_item = _method(it, "GetMediaPoolItem")
                             if get_mp_item:
-                                current_mp_item = it.GetMediaPoolItem()
+                                current_mp_item = get_mp_item()
                                 if current_mp_item:
                                     # Try to get file path from MediaPoolItem
                                     try:
@@ -2876,107 +3889,71 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         
                         if concepto_main_url:
                             # Determine expected filename based on take and type
-                            url_filename = os.path.basename(concepto_main_url.split("?")[0])
-                            if concepto_main_video_url:
-                                expected_filename = f"{take}_MAIN_video.mp4"
-                            else:
-                                # Image - try to get extension from URL
-                                ext = ".jpg"
-                                if "." in url_filename:
-                                    url_ext = os.path.splitext(url_filename)[1].lower()
-                                    if url_ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]:
-                                        ext = url_ext
-                                expected_filename = f"{take}_MAIN_image{ext}"
-                            
-                            # Get episode directory structure
-                            show_name = _safe_slug((self.show or {}).get("name") or self.episode.get("showId") or "UnknownShow")
-                            episode_name = _safe_slug(self.episode.get("title") or self.cfg.episode_id)
-                            episode_dir = Path(self.cfg.download_root) / show_name / episode_name
+                            expected_filename = _main_asset_filename(take, concepto_main_video_url, concepto_main_image_url)
                             take_dir = episode_dir / take
                             expected_file_path = take_dir / expected_filename
                             
                             # Check if current clip's file matches expected file path
                             current_filename = os.path.basename(current_file_path) if current_file_path else ""
-                            current_file_matches = current_file_path and os.path.exists(current_file_path) and os.path.normpath(current_file_path) == os.path.normpath(str(expected_file_path))
+                            current_file_matches = _same_file(current_file_path, expected_file_path)
                             
-                            # Always download if URL exists (to ensure we have latest version from Concepto)
-                            self._log(f"SYNC FROM CONCEPTO: [{take}] Downloading main file from Concepto: {expected_filename}")
                             try:
-                                take_dir.mkdir(parents=True, exist_ok=True)
-                                
-                                # Download file
+                                # Downloaded up front on the pool; re-raise its failure here so it is handled per take
                                 dest_file = expected_file_path
-                                # Resolve URL if needed
-                                resolved_url = _resolve_url(concepto_main_url, self.cfg.api_endpoint)
-                                _download_file(resolved_url, dest_file)
-                                self._log(f"SYNC FROM CONCEPTO: [{take}] ✓ Downloaded main file: {dest_file.name}")
-                                
-                                # Check if we need to replace on timeline
-                                if not current_file_matches:
-                                    self._log(f"SYNC FROM CONCEPTO: [{take}] File path changed: current='{current_filename}', expected='{expected_filename}' - will replace on timeline")
-                                    needs_file_replacement = True
+                                download_result = downloads.get(expected_file_path)
+                                if isinstance(download_result, BaseException):
+                                    raise download_result
+                                if download_result is False and current_file_matches:
+                                    # 304 from Concepto and the clip already points at this file: nothing to replace or import
+                                    self._log(f"SYNC FROM CONCEPTO: [{take}] Main file unchanged and already on timeline: {dest_file.name}")
                                 else:
-                                    self._log(f"SYNC FROM CONCEPTO: [{take}] File path matches, but checking if MediaPoolItem needs update")
-                                    # Even if file path matches, we might need to update if MediaPoolItem is different
-                                    needs_file_replacement = True  # Always replace to ensure we're using the latest file
+                                    if download_result is False:
+                                        self._log(f"SYNC FROM CONCEPTO: [{take}] Main file unchanged, using local copy: {dest_file.name}")
+                                    else:
+                                        self._log(f"SYNC FROM CONCEPTO: [{take}] ✓ Downloaded main file: {dest_file.name}")
                                 
-                                # Import to media pool
-                                seg_label = f"SC{int(seg.get('segmentNumber',0)):02d}_{_safe_slug(seg.get('title',''))}"[:80]
-                                take_folder = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, take)
+                                    # Check if we need to replace on timeline
+                                    if not current_file_matches:
+                                        self._log(f"SYNC FROM CONCEPTO: [{take}] File path changed: current='{current_filename}', expected='{expected_filename}' - will replace on timeline")
+                                        needs_file_replacement = True
+                                    else:
+                                        self._log(f"SYNC FROM CONCEPTO: [{take}] File path matches, but checking if MediaPoolItem needs update")
+                                        # Even if file path matches, we might need to update if MediaPoolItem is different
+                                        needs_file_replacement = True  # Always replace to ensure we're using the latest file
                                 
-                                # Check if item already exists in folder with same file path
-                                found_item = None
-                                try:
-                                    folder_items = take_folder.GetClipList() if hasattr(take_folder, "GetClipList") else []
-                                    for folder_item in folder_items or []:
-                                        try:
-                                            item_path = None
-                                            props = folder_item.GetClipProperty(["File Path"])
-                                            if props and isinstance(props, dict):
-                                                item_path = props.get("File Path") or props.get("FilePath")
-                                            if item_path and os.path.normpath(item_path) == os.path.normpath(str(dest_file)):
-                                                found_item = folder_item
-                                                break
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
+                                    # Import to media pool
+                                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, take, cache=bins)
                                 
-                                if found_item:
-                                    new_mp_item = found_item
-                                    self._log(f"SYNC FROM CONCEPTO: [{take}] Found existing MediaPoolItem for file")
-                                else:
-                                    # Import it
-                                    imported_items = resolve_import_files(media_pool, take_folder, [str(dest_file)])
-                                    if imported_items:
-                                        new_mp_item = imported_items[0]
-                                        self._log(f"SYNC FROM CONCEPTO: [{take}] ✓ Imported file to bin")
+                                    # Check if item already exists in folder with same file path
+                                    # (each take bin is listed once; repeat clips of the take reuse its index)
+                                    folder_index = folder_indexes.get(take)
+                                    if folder_index is None:
+                                        folder_index = folder_indexes[take] = _index_folder_by_path(take_folder)
+                                    found_item = folder_index.get(_path_key(dest_file))
+                                
+                                    if found_item:
+                                        new_mp_item = found_item
+                                        self._log(f"SYNC FROM CONCEPTO: [{take}] Found existing MediaPoolItem for file")
                                     else:
-                                        self._log(f"SYNC FROM CONCEPTO: [{take}] WARNING: Failed to import file")
-                                        needs_file_replacement = False
+                                        # Import it
+                                        imported_items = resolve_import_files(media_pool, take_folder, [str(dest_file)])
+                                        if imported_items:
+                                            new_mp_item = folder_index[_path_key(dest_file)] = imported_items[0]
+                                            self._log(f"SYNC FROM CONCEPTO: [{take}] ✓ Imported file to bin")
+                                        else:
+                                            self._log(f"SYNC FROM CONCEPTO: [{take}] WARNING: Failed to import file")
+                                            needs_file_replacement = False
                                         
                             except Exception as e:
-                                self._log(f"SYNC FROM CONCEPTO: [{take}] ERROR downloading/replacing file: {e}")
-                                import traceback
-                                self._log(f"Traceback: {traceback.format_exc()}")
+                                self._log(f"SYNC FROM CONCEPTO: [{take}] ERROR downloading/replacing file: {type(e).__name__}: {e}")
                                 needs_file_replacement = False
                         
                         if concepto_start_sec is None:
                             self._log(f"SYNC FROM CONCEPTO: [{take}] No startTime in Concepto, skipping")
                             continue
                         
-                        # Get current timeline position for comparison
-                        current_pos_frame = None
-                        for m in ["GetStart", "GetStartFrame", "GetRecordFrame", "GetLeftOffset"]:
-                            fn = _method(it, m)
-                            if fn:
-                                try:
-                                    val = fn()
-                                    if val is not None:
-                                        current_pos_frame = int(val)
-                                        break
-                                except Exception:
-                                    pass
+                        # Current position/duration/in-point for comparison (one property read per clip)
+                        current_pos_frame, current_dur_frames, current_in_frame = _item_sync_timing(it, _RECORD_POS_ACCESSORS)
                         
                         # Calculate target timeline frame (add timeline start offset)
                         target_frame = int(round(concepto_start_sec * fps)) + timeline_start_frame
@@ -2985,6 +3962,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         # If file needs replacement, use new_mp_item; otherwise use current
                         mp_item_to_use = new_mp_item if new_mp_item else current_mp_item
                         
+                        in_place = False  # position already right: skip the move methods, only retime
                         if current_pos_frame is not None:
                             current_pos_sec = (current_pos_frame - timeline_start_frame) / fps
                             self._log(f"SYNC FROM CONCEPTO: [{take}] Current pos={current_pos_sec:.3f}s (frame {current_pos_frame}), Target={concepto_start_sec:.3f}s (frame {target_frame})")
@@ -2994,16 +3972,21 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                             if needs_file_replacement:
                                 self._log(f"SYNC FROM CONCEPTO: [{take}] File needs replacement on timeline, will update")
                             elif abs(current_pos_frame - target_frame) <= 1:
-                                self._log(f"SYNC FROM CONCEPTO: [{take}] Already at correct position, skipping move")
-                                updated_count += 1
-                                continue
+                                if _clip_timing_matches(current_dur_frames, current_in_frame, concepto_duration, concepto_offset, fps):
+                                    self._log(f"SYNC FROM CONCEPTO: [{take}] Already in sync, skipping")
+                                    updated_count += 1
+                                    continue
+                                self._log(f"SYNC FROM CONCEPTO: [{take}] Already at correct position, updating duration/offset only")
+                                in_place = True
                         else:
                             self._log(f"SYNC FROM CONCEPTO: [{take}] Could not read current position, attempting update anyway")
                         
                         self._log(f"SYNC FROM CONCEPTO: [{take}] Updating to start={concepto_start_sec:.3f}s ({target_tc}), dur={concepto_duration:.3f}s, offset={concepto_offset:.3f}s")
                         
                         # Try to move/update the clip - use multiple methods
-                        moved = False
+                        moved = in_place
+                        placed_item = None  # TimelineItem handed back by InsertClipAtTrack, if any
+                        reinserted = False  # delete+insert replaces the TimelineItem; setter moves keep `it`
                         try:
                             # If we need to replace the file, we must use the new MediaPoolItem
                             if needs_file_replacement and new_mp_item:
@@ -3013,7 +3996,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                             # Method 1: Try DeleteClipAtTrack + InsertClipAtTrack (most reliable)
                             delete_at_track = _method(timeline, "DeleteClipAtTrack")
                             insert_at_track = _method(timeline, "InsertClipAtTrack")
-                            if delete_at_track and insert_at_track and current_pos_frame is not None:
+                            if not moved and delete_at_track and insert_at_track and current_pos_frame is not None:
                                 try:
                                     # Use the appropriate media pool item (new if replaced, current otherwise)
                                     mp_item = mp_item_to_use
@@ -3034,41 +4017,50 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                                             except Exception:
                                                 pass
                                         
-                                        # Delete old clip
+                                        # Delete old clip (only an explicit False means it is still there)
+                                        deleted = False
                                         try:
-                                            timeline.DeleteClipAtTrack(current_track, current_pos_frame)
-                                            self._log(f"  Deleted clip at track {current_track}, frame {current_pos_frame}")
+                                            deleted = timeline.DeleteClipAtTrack(current_track, current_pos_frame) is not False
+                                            if deleted:
+                                                self._log(f"  Deleted clip at track {current_track}, frame {current_pos_frame}")
+                                            else:
+                                                self._log("  DeleteClipAtTrack returned False")
                                         except Exception as e:
                                             self._log(f"  DeleteClipAtTrack failed: {e}")
                                         
-                                        # Insert at new position
-                                        try:
-                                            result = timeline.InsertClipAtTrack(current_track, target_frame, mp_item)
-                                            if result:
-                                                self._log(f"  InsertClipAtTrack successful at frame {target_frame}")
-                                                # Apply trim if we have source IN/OUT
-                                                if source_in is not None or source_out is not None:
-                                                    new_it = result
-                                                    set_prop = _method(new_it, "SetProperty")
-                                                    if set_prop:
-                                                        try:
-                                                            if source_in is not None:
-                                                                new_it.SetProperty("Start", source_in)
-                                                            if source_out is not None:
-                                                                new_it.SetProperty("End", source_out)
-                                                            self._log(f"  Applied trim: Start={source_in}, End={source_out}")
-                                                        except Exception:
-                                                            pass
-                                                moved = True
-                                        except Exception as e:
-                                            self._log(f"  InsertClipAtTrack failed: {e}")
-                                            # Try to restore old position if insert failed
-                                            if current_pos_frame is not None and mp_item:
-                                                try:
-                                                    timeline.InsertClipAtTrack(current_track, current_pos_frame, mp_item)
-                                                    self._log(f"  Restored clip to original position")
-                                                except Exception:
-                                                    pass
+                                        # Insert at new position; if the old clip is still there, leave moved False
+                                        # and fall through to the SetProperty/setter methods instead of duplicating it
+                                        result = None
+                                        if deleted:
+                                            try:
+                                                result = timeline.InsertClipAtTrack(current_track, target_frame, mp_item)
+                                            except Exception as e:
+                                                self._log(f"  InsertClipAtTrack failed: {e}")
+                                        if result:
+                                            self._log(f"  InsertClipAtTrack successful at frame {target_frame}")
+                                            reinserted = True
+                                            if not isinstance(result, bool):
+                                                placed_item = result
+                                            # Apply trim if we have source IN/OUT
+                                            if source_in is not None or source_out is not None:
+                                                set_prop = _method(result, "SetProperty")
+                                                if set_prop:
+                                                    try:
+                                                        if source_in is not None:
+                                                            set_prop("Start", source_in)
+                                                        if source_out is not None:
+                                                            set_prop("End", source_out)
+                                                        self._log(f"  Applied trim: Start={source_in}, End={source_out}")
+                                                    except Exception:
+                                                        pass
+                                            moved = True
+                                        elif deleted:
+                                            # Insert failed after the clip was removed: put it back where it was
+                                            try:
+                                                timeline.InsertClipAtTrack(current_track, current_pos_frame, mp_item)
+                                                self._log(f"  Restored clip to original position")
+                                            except Exception:
+                                                pass
                                 except Exception as e:
                                     self._log(f"  Delete+Insert method failed: {e}")
                             
@@ -3078,10 +4070,11 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                                 if set_prop:
                                     try:
                                         # Try common property names for timeline position
-                                        for prop_name in ["RecordFrame", "StartFrame", "Start", "LeftOffset", "Position"]:
+                                        for prop_name in _setter_ladder(_POSITION_PROPS):
                                             try:
-                                                it.SetProperty(prop_name, target_frame)
+                                                set_prop(prop_name, target_frame)
                                                 self._log(f"  Set {prop_name}={target_frame}")
+                                                _preferred_setter[_POSITION_PROPS] = prop_name
                                                 moved = True
                                                 break
                                             except Exception as e:
@@ -3091,12 +4084,13 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                             
                             # Method 3: Try SetStart/SetStartFrame methods
                             if not moved:
-                                for m in ["SetStart", "SetStartFrame", "SetRecordFrame", "SetLeftOffset", "SetPosition"]:
+                                for m in _setter_ladder(_POSITION_SETTERS):
                                     fn = _method(it, m)
                                     if fn:
                                         try:
                                             fn(target_frame)
                                             self._log(f"  Called {m}({target_frame})")
+                                            _preferred_setter[_POSITION_SETTERS] = m
                                             moved = True
                                             break
                                         except Exception as e:
@@ -3104,59 +4098,28 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                             
                             # If we successfully moved the clip, now update duration and offset
                             if moved:
-                                # Get the timeline item again (it might be a new object after insert)
+                                # The clip is a new object after delete+insert: use the one InsertClipAtTrack returned, and only
+                                # re-read that one track when the API gave back a bare True. Setter moves keep `it`.
                                 try:
-                                    items_after = timeline.GetItemListInTrack("video", t) or []
-                                    new_it = None
-                                    for check_it in items_after:
-                                        check_nm = ""
-                                        try:
-                                            check_nm = check_it.GetName()
-                                        except Exception:
-                                            try:
-                                                mpit = check_it.GetMediaPoolItem()
-                                                check_nm = mpit.GetName() if mpit else ""
-                                            except Exception:
-                                                pass
-                                        if take in check_nm:
-                                            # Verify position matches
-                                            check_pos = None
-                                            for pos_m in ["GetStart", "GetStartFrame"]:
-                                                pos_fn = _method(check_it, pos_m)
-                                                if pos_fn:
-                                                    try:
-                                                        check_pos = int(pos_fn())
-                                                        break
-                                                    except Exception:
-                                                        pass
-                                            if check_pos is not None and abs(check_pos - target_frame) <= 2:
-                                                new_it = check_it
-                                                break
-                                    
-                                    # Use new_it if found, otherwise use original it
-                                    update_it = new_it if new_it else it
+                                    update_it = placed_item
+                                    if update_it is None and reinserted:
+                                        update_it = _find_take_item(timeline, "video", t, take, target_frame)
+                                    update_it = update_it or it
                                     
                                     # Update duration if different
-                                    current_dur = None
-                                    for m in ["GetDuration", "GetDurationFrames"]:
-                                        fn = _method(update_it, m)
-                                        if fn:
-                                            try:
-                                                current_dur = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
+                                    current_dur = _item_duration_frames(update_it)
                                     
-                                    if current_dur is not None:
+                                    if current_dur is not None and concepto_duration > 0:
                                         target_dur_frames = int(round(concepto_duration * fps))
                                         if abs(current_dur - target_dur_frames) > 1:
                                             # Try to set duration
-                                            for m in ["SetDuration", "SetDurationFrames"]:
+                                            for m in _setter_ladder(_DURATION_SETTERS):
                                                 fn = _method(update_it, m)
                                                 if fn:
                                                     try:
                                                         fn(target_dur_frames)
                                                         self._log(f"  Set duration to {target_dur_frames} frames")
+                                                        _preferred_setter[_DURATION_SETTERS] = m
                                                         break
                                                     except Exception as e:
                                                         self._log(f"    {m} failed: {e}")
@@ -3167,10 +4130,11 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                                         set_prop = _method(update_it, "SetProperty")
                                         if set_prop:
                                             try:
-                                                for prop_name in ["In", "Start", "StartFrame", "SourceStart"]:
+                                                for prop_name in _setter_ladder(_OFFSET_PROPS):
                                                     try:
-                                                        update_it.SetProperty(prop_name, offset_frames)
+                                                        set_prop(prop_name, offset_frames)
                                                         self._log(f"  Set {prop_name}={offset_frames} (offset)")
+                                                        _preferred_setter[_OFFSET_PROPS] = prop_name
                                                         break
                                                     except Exception as e:
                                                         self._log(f"    {prop_name} failed: {e}")
@@ -3186,17 +4150,22 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                                 self._log(f"  ✗ Could not move [{take}] - all methods failed")
                         except Exception as e:
                             self._log(f"  ✗ Failed to update [{take}]: {type(e).__name__}: {e}")
-                            import traceback
-                            self._log(f"    Traceback: {traceback.format_exc()}")
                 
+                if end_undo:
+                    close_undo, end_undo = end_undo, None
+                    close_undo()
                 self._log(f"SYNC FROM CONCEPTO: ✓ Updated {updated_count} clip(s) on timeline")
                 self._log("SYNC FROM CONCEPTO complete. Check timeline to verify changes.")
             except Exception as e:
                 self._log(f"SYNC FROM CONCEPTO ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
+                if end_undo:
+                    try:
+                        end_undo()
+                    except Exception:
+                        pass
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_export_av_script(self):
         """Export current timeline subtitles as SRT file for AV Script import"""
@@ -3214,10 +4183,8 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 
                 # Get timeline start timecode
                 start_tc = timeline.GetStartTimecode()  # e.g. "01:00:00:00"
-                parts = start_tc.split(":")
-                tl_start_sec = 0.0
-                if len(parts) == 4:
-                    tl_start_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
+                tl_start_sec = _timecode_to_seconds(start_tc, fps) or 0.0
+                tl_start_frame = int(round(tl_start_sec * fps))
                 
                 self._log(f"EXPORT: Timeline starts at {start_tc} ({tl_start_sec:.3f}s offset)")
 
@@ -3238,64 +4205,30 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 subtitle_entries = []
                 for t in range(1, s_tracks + 1):
                     items = timeline.GetItemListInTrack("subtitle", t) or []
+                    # Items on one track share an API class: pick the text accessors once per track
+                    readers = _subtitle_text_readers(items[0]) if items else []
                     for it in items:
                         try:
-                            # Get text (try multiple methods)
-                            content = ""
-                            try: content = it.GetName()
-                            except: pass
-                            if not content:
-                                try:
-                                    fn = _method(it, "GetText")
-                                    if fn: content = fn()
-                                except: pass
-                            if not content:
-                                try:
-                                    prop_fn = _method(it, "GetProperty")
-                                    if prop_fn:
-                                        content = prop_fn("Text") or prop_fn("Caption")
-                                except: pass
+                            content = _read_subtitle_text(it, readers)
                             
                             if not content:
                                 continue
                             
                             # Get timing (start and duration)
-                            start_frame = None
-                            dur_frame = None
-                            
-                            for m in ["GetStart", "GetStartFrame"]:
-                                fn = _method(it, m)
-                                if fn:
-                                    try:
-                                        start_frame = int(fn())
-                                        break
-                                    except: pass
+                            start_frame = _item_start_frame(it)
                             
-                            for m in ["GetDuration", "GetDurationFrames"]:
-                                fn = _method(it, m)
-                                if fn:
-                                    try:
-                                        dur_frame = int(fn())
-                                        break
-                                    except: pass
+                            dur_frame = _item_duration_frames(it)
                             
                             if start_frame is None or dur_frame is None:
                                 self._log(f"EXPORT: Skipping subtitle - could not read timing")
                                 continue
                             
                             # Convert to relative seconds (subtract timeline start)
-                            rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
+                            rel_start_sec = (start_frame - tl_start_frame) / fps
                             dur_sec = dur_frame / fps
                             
-                            # Look for [SCxxTxx] pattern
-                            take_match = re.search(r"\[?\s*(SC\d{2}T\d{2})\s*\]?", content)
-                            if not take_match:
-                                # Try to extract visual description anyway (might be just text)
-                                visual_desc = content.strip()
-                            else:
-                                take = take_match.group(1)
-                                # Extract visual description after [SCxxTxx]
-                                visual_desc = re.sub(r"\[?\s*SC\d{2}T\d{2}\s*\]?\s*-?\s*", "", content, flags=re.IGNORECASE).strip()
+                            # Visual description: the text with any [SCxxTxx] tag stripped (plain text kept as-is)
+                            visual_desc = (_TAKE_TAG_STRIP_RE.sub("", content) if "SC" in content else content).strip()
                             
                             if visual_desc:
                                 subtitle_entries.append({
@@ -3316,35 +4249,11 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 subtitle_entries.sort(key=lambda x: x['start'])
                 self._log(f"EXPORT: Found {len(subtitle_entries)} subtitle entries")
                 
-                # Generate SRT
-                def to_srt_time(secs):
-                    h = int(secs // 3600)
-                    m = int((secs % 3600) // 60)
-                    s = int(secs % 60)
-                    ms = int((secs % 1) * 1000)
-                    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-                
-                srt_lines = []
-                for i, entry in enumerate(subtitle_entries):
-                    start_sec = entry['start']
-                    end_sec = start_sec + entry['duration']
-                    text = entry['text'].replace('\n', ' ')  # SRT format
-                    
-                    srt_lines.append(str(i + 1))
-                    srt_lines.append(f"{to_srt_time(start_sec)} --> {to_srt_time(end_sec)}")
-                    srt_lines.append(text)
-                    srt_lines.append("")
-                
-                srt_content = "\n".join(srt_lines)
-                
                 # Save to Downloads folder or user-selected location
-                import tkinter.filedialog
-                from pathlib import Path
-                
                 default_name = f"av_script_export_{timeline.GetName() or 'timeline'}.srt"
                 default_path = Path.home() / "Downloads" / default_name
                 
-                save_path = tkinter.filedialog.asksaveasfilename(
+                save_path = filedialog.asksaveasfilename(
                     defaultextension=".srt",
                     filetypes=[("SRT files", "*.srt"), ("All files", "*.*")],
                     initialfile=default_name,
@@ -3355,18 +4264,16 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                     self._log("EXPORT: Cancelled by user.")
                     return
                 
-                with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(srt_content)
+                _write_srt(save_path, subtitle_entries)
                 
                 self._log(f"✓ EXPORT: Saved {len(subtitle_entries)} entries to {save_path}")
                 self._log(f"You can now import this SRT file in Concepto AV Script page.")
                 
             except Exception as e:
                 self._log(f"EXPORT ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_export_srt_video(self):
         """Export SRT + MAIN track media and sync to Concepto AV Script/Preview"""
@@ -3395,7 +4302,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         self._log("EXPORT SRT+VIDEO: Skipping subtitle without take code")
                         continue
                     seg_num = 1
-                    take_match = re.search(r"SC(\d{2})T(\d{2})", take, re.IGNORECASE)
+                    take_match = _TAKE_PARTS_RE.search(take)
                     if take_match:
                         seg_num = int(take_match.group(1))
                     shots_payload.append({
@@ -3418,12 +4325,14 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 self.episode = ep
 
                 segments = ((ep.get("avScript") or {}).get("segments") or [])
+                # One walk over segments/shots: each take's shot, segment and AV Preview clip id
                 take_to_shot: Dict[str, Dict[str, Any]] = {}
                 for seg in segments:
-                    for shot in seg.get("shots") or []:
+                    seg_id = seg.get("id")
+                    for idx, shot in enumerate(seg.get("shots") or []):
                         take_val = (shot.get("take") or "").upper()
                         if take_val:
-                            take_to_shot[take_val] = {"shot": shot, "segment": seg}
+                            take_to_shot[take_val] = {"shot": shot, "segment": seg, "clip_id": f"{seg_id}-{shot.get('id')}-{idx}"}
 
                 clips = _collect_main_track_clips(timeline, fps, tl_start_sec, self._log)
                 if not clips:
@@ -3435,16 +4344,9 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
 
                 self._log(f"EXPORT SRT+VIDEO: Available shots in Concepto after import: {list(take_to_shot.keys())}")
 
-                take_to_clip_id: Dict[str, str] = {}
-                for seg in segments:
-                    for idx, shot in enumerate(seg.get("shots") or []):
-                        take_val = (shot.get("take") or "").upper()
-                        if take_val:
-                            take_to_clip_id[take_val] = f"{seg.get('id')}-{shot.get('id')}-{idx}"
-
                 video_start_times: Dict[str, float] = {}
                 for clip in clips:
-                    clip_id = take_to_clip_id.get(clip["take"])
+                    clip_id = (take_to_shot.get(clip["take"]) or {}).get("clip_id")
                     if clip_id:
                         video_start_times[clip_id] = float(clip["start"])
                     else:
@@ -3456,6 +4358,8 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
 
                 # Upload media + update duration/offset
                 processed_takes = set()
+                uploads: List[Tuple[str, str, Dict[str, Any], Dict[str, Any], str]] = []
+                timing_updates: Dict[str, Dict[str, Any]] = {}
                 for clip in clips:
                     take = clip["take"]
                     self._log(f"EXPORT SRT+VIDEO: Processing clip: {clip.get('item_name')} (take: {take})")
@@ -3482,10 +4386,10 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         
                         if abs(new_duration - old_duration) > 0.01 or abs(new_offset - old_offset) > 0.01:
                             self._log(f"[{take}] Updating duration: {old_duration:.2f}s -> {new_duration:.2f}s, offset: {old_offset:.2f}s -> {new_offset:.2f}s")
-                            self.client.update_shot(shot.get("id"), {
+                            timing_updates[shot.get("id")] = {
                                 "duration": new_duration,
                                 "videoOffset": new_offset,
-                            })
+                            }
                         else:
                             self._log(f"[{take}] Duration/offset unchanged: {new_duration:.2f}s, offset: {new_offset:.2f}s")
                     except Exception as e:
@@ -3497,7 +4401,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                         self._log(f"[{take}] Tip: The clip is on the timeline but source file path could not be determined.")
                         continue
                     
-                    if not os.path.exists(file_path):
+                    if not clip.get("file_exists"):
                         self._log(f"[{take}] Warning: File not found at '{file_path}' for '{clip.get('item_name')}'. Cannot upload.")
                         continue
                     
@@ -3516,33 +4420,36 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                             self._log(f"[{take}] Different file name: existing='{existing_filename}', new='{file_name}' - will upload")
                     
                     if should_upload:
-                        if clip["clip_type"] == "video":
-                            self._log(f"[{take}] Uploading video: {file_name}")
-                            try:
-                                url = self.client.upload_shot_video(
-                                    shot.get("id"),
-                                    file_path,
-                                    self.cfg.episode_id,
-                                    seg.get("id"),
-                                    mode="replace",  # Use replace to update existing video
-                                    set_main=True,
-                                )
-                                self._log(f"[{take}] ✓ Uploaded video -> {url}")
-                            except Exception as e:
-                                self._log(f"[{take}] ✗ Video upload failed: {e}")
-                        else:
-                            self._log(f"[{take}] Uploading image: {file_name}")
-                            try:
-                                url = self.client.upload_shot_image(
-                                    shot.get("id"),
-                                    file_path,
-                                    self.cfg.episode_id,
-                                    seg.get("id"),
-                                    mode="replace",  # Use replace to update existing image
-                                )
-                                self._log(f"[{take}] ✓ Uploaded image -> {url}")
-                            except Exception as e:
-                                self._log(f"[{take}] ✗ Image upload failed: {e}")
+                        kind = "video" if clip["clip_type"] == "video" else "image"
+                        self._log(f"[{take}] Uploading {kind}: {file_name}")
+                        uploads.append((take, kind, shot, seg, file_path))
+
+                # Duration/offset changes go out in one request, before any media upload
+                if timing_updates:
+                    self._log(f"EXPORT SRT+VIDEO: Updating duration/offset for {len(timing_updates)} shot(s)...")
+                    try:
+                        missing = self.client.update_shots_bulk(self.cfg.episode_id, timing_updates)
+                        if missing is None:
+                            self._log("EXPORT SRT+VIDEO: Server has no bulk shot update; updating shots one by one...")
+                            for shot_id, updates in timing_updates.items():
+                                try:
+                                    self.client.update_shot(shot_id, updates)
+                                except Exception as e:
+                                    self._log(f"EXPORT SRT+VIDEO: Warning: Could not update duration/offset of shot {shot_id}: {e}")
+                        elif missing:
+                            self._log(f"EXPORT SRT+VIDEO: Warning: {len(missing)} shot(s) not found in Concepto, not updated: {', '.join(missing)}")
+                    except Exception as e:
+                        self._log(f"EXPORT SRT+VIDEO: Warning: Could not update duration/offset: {e}")
+
+                # Uploads run one at a time once every duration/offset update is done: each upload
+                # rewrites the whole segment's shot list on the server, so concurrent uploads for
+                # takes in the same segment would overwrite each other's new URLs
+                for take, kind, shot, seg, file_path in uploads:
+                    try:
+                        url = _upload_shot_media(self.client, self.cfg.episode_id, kind, shot, seg, file_path)
+                        self._log(f"[{take}] ✓ Uploaded {kind} -> {url}")
+                    except Exception as e:
+                        self._log(f"[{take}] ✗ {kind.capitalize()} upload failed: {e}")
 
                 # Export audio tracks to AV Preview
                 self._log("EXPORT SRT+VIDEO: Exporting audio tracks...")
@@ -3551,215 +4458,26 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                     if a_tracks > 0:
                         self._log(f"EXPORT SRT+VIDEO: Found {a_tracks} audio track(s)")
                         
-                        audio_tracks_data: List[Dict[str, Any]] = []
-                        temp_audio_files: List[str] = []
-                        
-                        for track_idx in range(1, a_tracks + 1):
-                            items = timeline.GetItemListInTrack("audio", track_idx) or []
-                            if not items:
-                                continue
-                            
-                            # Get track name (try various methods)
-                            track_name = f"Audio {track_idx}"
-                            try:
-                                get_track_name = _method(timeline, "GetTrackName")
-                                if get_track_name:
-                                    name_result = timeline.GetTrackName("audio", track_idx)
-                                    if name_result:
-                                        track_name = name_result
-                            except Exception:
-                                pass
-                            
-                            self._log(f"EXPORT SRT+VIDEO: Processing audio track {track_idx}: '{track_name}' ({len(items)} clips)")
-                            
-                            clips_data: List[Dict[str, Any]] = []
-                            
-                            for item_idx, item in enumerate(items):
-                                try:
-                                    item_name = getattr(item, "GetName", lambda: "(unknown)")()
-                                    
-                                    # Get timeline position
-                                    start_frame = None
-                                    for m in ["GetStart", "GetStartFrame"]:
-                                        fn = _method(item, m)
-                                        if fn:
-                                            try:
-                                                start_frame = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
-                                    
-                                    # Get duration
-                                    dur_frame = None
-                                    for m in ["GetDuration", "GetDurationFrames"]:
-                                        fn = _method(item, m)
-                                        if fn:
-                                            try:
-                                                dur_frame = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
-                                    
-                                    if start_frame is None or dur_frame is None:
-                                        self._log(f"EXPORT SRT+VIDEO: Skipping audio clip '{item_name}' - could not read timing")
-                                        continue
-                                    
-                                    # Convert to relative seconds
-                                    rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
-                                    dur_sec = dur_frame / fps
-                                    
-                                    # Get source offset
-                                    offset_frame = 0
-                                    for prop_name in ["SourceStart", "In", "StartFrame"]:
-                                        try:
-                                            get_prop = _method(item, "GetProperty")
-                                            if get_prop:
-                                                prop_val = get_prop(prop_name)
-                                                if prop_val is not None:
-                                                    offset_frame = int(prop_val)
-                                                    break
-                                        except Exception:
-                                            pass
-                                    offset_sec = offset_frame / fps
-                                    
-                                    # Get volume
-                                    volume = 1.0
-                                    try:
-                                        get_prop = _method(item, "GetProperty")
-                                        if get_prop:
-                                            vol_val = get_prop("AudioLevels") or get_prop("Volume")
-                                            if vol_val is not None:
-                                                if isinstance(vol_val, (list, tuple)) and len(vol_val) > 0:
-                                                    vol_db = float(vol_val[0])
-                                                    volume = max(0.0, min(1.0, 10 ** (vol_db / 20)))
-                                                elif isinstance(vol_val, (int, float)):
-                                                    volume = max(0.0, min(1.0, float(vol_val)))
-                                    except Exception:
-                                        pass
-                                    
-                                    # Get MediaPoolItem
-                                    media_pool_item = None
-                                    try:
-                                        get_mp_item = _method(item, "GetMediaPoolItem")
-                                        if get_mp_item:
-                                            media_pool_item = item.GetMediaPoolItem()
-                                    except Exception:
-                                        pass
-                                    
-                                    if not media_pool_item:
-                                        self._log(f"EXPORT SRT+VIDEO: Warning: Could not get MediaPoolItem for '{item_name}', skipping")
-                                        continue
-                                    
-                                    # Get file path
-                                    file_path = None
-                                    try:
-                                        get_file_path = _method(media_pool_item, "GetClipProperty")
-                                        if get_file_path:
-                                            props = media_pool_item.GetClipProperty(["File Path"])
-                                            if props and isinstance(props, dict):
-                                                file_path = props.get("File Path") or props.get("FilePath")
-                                    except Exception:
-                                        pass
-                                    
-                                    if not file_path or not os.path.exists(file_path):
-                                        self._log(f"EXPORT SRT+VIDEO: Warning: Source file not found for '{item_name}', skipping")
-                                        continue
-                                    
-                                    # Copy file to temp location
-                                    file_ext = os.path.splitext(file_path)[1][1:] or 'mp3'
-                                    export_filename = f"{_safe_slug(track_name)}_{item_idx+1}_{_safe_slug(item_name)}.{file_ext}"
-                                    export_dir = Path(self.cfg.download_root) / "_temp_audio_export"
-                                    export_dir.mkdir(parents=True, exist_ok=True)
-                                    export_path = export_dir / export_filename
-                                    
-                                    import shutil
-                                    shutil.copy2(file_path, export_path)
-                                    temp_audio_files.append(str(export_path))
-                                    
-                                    # Upload to Concepto
-                                    try:
-                                        audio_url = self.client.upload_audio_clip(self.cfg.episode_id, str(export_path))
-                                        
-                                        # Get source duration
-                                        source_duration_sec = 0.0
-                                        try:
-                                            src_dur_val = media_pool_item.GetClipProperty("Duration")
-                                            if src_dur_val:
-                                                if ":" in str(src_dur_val):
-                                                    parts = str(src_dur_val).split(":")
-                                                    if len(parts) == 4:
-                                                        source_duration_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
-                                                else:
-                                                    source_duration_sec = float(src_dur_val) / fps
-                                        except Exception:
-                                            pass
-                                        
-                                        clips_data.append({
-                                            "id": f"clip_{track_idx}_{item_idx}_{int(time.time())}",
-                                            "name": item_name,
-                                            "url": audio_url,
-                                            "startTime": rel_start_sec,
-                                            "duration": dur_sec,
-                                            "offset": offset_sec,
-                                            "volume": volume,
-                                            "sourceDuration": source_duration_sec or dur_sec
-                                        })
-                                        self._log(f"EXPORT SRT+VIDEO: ✓ Uploaded audio clip '{item_name}' from track '{track_name}'")
-                                    except Exception as e:
-                                        self._log(f"EXPORT SRT+VIDEO: ✗ Failed to upload audio clip '{item_name}': {e}")
-                                
-                                except Exception as e:
-                                    self._log(f"EXPORT SRT+VIDEO: Error processing audio clip: {e}")
-                                    continue
-                            
-                            if clips_data:
-                                audio_tracks_data.append({
-                                    "id": f"track_{track_idx}",
-                                    "name": track_name,
-                                    "type": "audio",
-                                    "clips": clips_data,
-                                    "isMuted": False,
-                                    "volume": 1.0
-                                })
-                        
+                        audio_tracks_data = _export_audio_tracks(
+                            self.client, self.cfg.episode_id, timeline, a_tracks, fps, tl_start_sec, self._log, "EXPORT SRT+VIDEO"
+                        )
                         if audio_tracks_data:
                             self._log(f"EXPORT SRT+VIDEO: Sending {len(audio_tracks_data)} audio track(s) to Concepto...")
                             self.client.update_audio_tracks(self.cfg.episode_id, audio_tracks_data)
                             self._log(f"EXPORT SRT+VIDEO: ✓ Successfully exported {len(audio_tracks_data)} audio track(s) to AV Preview")
                         else:
                             self._log("EXPORT SRT+VIDEO: No audio clips were successfully exported")
-                        
-                        # Cleanup temp files
-                        for temp_file in temp_audio_files:
-                            try:
-                                if os.path.exists(temp_file):
-                                    os.remove(temp_file)
-                            except Exception:
-                                pass
-                        # Remove temp directory if empty
-                        try:
-                            export_dir = Path(self.cfg.download_root) / "_temp_audio_export"
-                            if export_dir.exists():
-                                try:
-                                    export_dir.rmdir()
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
                     else:
                         self._log("EXPORT SRT+VIDEO: No audio tracks found in timeline")
                 except Exception as e:
-                    self._log(f"EXPORT SRT+VIDEO: Error exporting audio tracks: {e}")
-                    import traceback
-                    self._log(f"Traceback: {traceback.format_exc()}")
+                    self._log(f"EXPORT SRT+VIDEO: Error exporting audio tracks: {type(e).__name__}: {e}")
 
                 self._log("EXPORT SRT+VIDEO: Complete.")
             except Exception as e:
                 self._log(f"EXPORT SRT+VIDEO ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_export_audio(self):
         """Export audio tracks from Resolve timeline to Concepto AV Preview"""
@@ -3780,10 +4498,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 
                 # Get timeline start timecode
                 start_tc = timeline.GetStartTimecode()
-                parts = start_tc.split(":")
-                tl_start_sec = 0.0
-                if len(parts) == 4:
-                    tl_start_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
+                tl_start_sec = _timecode_to_seconds(start_tc, fps) or 0.0
                 
                 self._log(f"EXPORT AUDIO: Timeline starts at {start_tc} ({tl_start_sec:.3f}s offset)")
 
@@ -3800,222 +4515,24 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 
                 self._log(f"EXPORT AUDIO: Found {a_tracks} audio track(s)")
 
-                # Collect audio tracks data
-                audio_tracks_data: List[Dict[str, Any]] = []
-                temp_audio_files: List[str] = []  # Track temp files for cleanup
-
-                try:
-                    for track_idx in range(1, a_tracks + 1):
-                        items = timeline.GetItemListInTrack("audio", track_idx) or []
-                        if not items:
-                            continue
-                        
-                        # Get track name (try various methods)
-                        track_name = f"Audio {track_idx}"
-                        try:
-                            get_track_name = _method(timeline, "GetTrackName")
-                            if get_track_name:
-                                name_result = timeline.GetTrackName("audio", track_idx)
-                                if name_result:
-                                    track_name = name_result
-                        except Exception:
-                            pass
-                        
-                        self._log(f"EXPORT AUDIO: Processing track {track_idx}: '{track_name}' ({len(items)} clips)")
-
-                        clips_data: List[Dict[str, Any]] = []
-                        
-                        for item_idx, item in enumerate(items):
-                            try:
-                                # Get clip properties
-                                item_name = getattr(item, "GetName", lambda: "(unknown)")()
-                                
-                                # Get timeline position (start time)
-                                start_frame = None
-                                for m in ["GetStart", "GetStartFrame"]:
-                                    fn = _method(item, m)
-                                    if fn:
-                                        try:
-                                            start_frame = int(fn())
-                                            break
-                                        except Exception:
-                                            pass
-                                
-                                # Get duration
-                                dur_frame = None
-                                for m in ["GetDuration", "GetDurationFrames"]:
-                                    fn = _method(item, m)
-                                    if fn:
-                                        try:
-                                            dur_frame = int(fn())
-                                            break
-                                        except Exception:
-                                            pass
-                                
-                                if start_frame is None or dur_frame is None:
-                                    self._log(f"EXPORT AUDIO: Skipping clip '{item_name}' - could not read timing")
-                                    continue
-                                
-                                # Convert to relative seconds (subtract timeline start)
-                                rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
-                                dur_sec = dur_frame / fps
-                                
-                                # Get source offset (trim in point)
-                                offset_frame = 0
-                                for prop_name in ["SourceStart", "In", "StartFrame"]:
-                                    try:
-                                        get_prop = _method(item, "GetProperty")
-                                        if get_prop:
-                                            prop_val = get_prop(prop_name)
-                                            if prop_val is not None:
-                                                offset_frame = int(prop_val)
-                                                break
-                                    except Exception:
-                                        pass
-                                offset_sec = offset_frame / fps
-                                
-                                # Get volume (0-1)
-                                volume = 1.0
-                                try:
-                                    get_prop = _method(item, "GetProperty")
-                                    if get_prop:
-                                        vol_val = get_prop("AudioLevels") or get_prop("Volume")
-                                        if vol_val is not None:
-                                            # Resolve uses dB, convert to linear (approximate)
-                                            if isinstance(vol_val, (list, tuple)) and len(vol_val) > 0:
-                                                vol_db = float(vol_val[0])
-                                                volume = max(0.0, min(1.0, 10 ** (vol_db / 20)))  # dB to linear
-                                            elif isinstance(vol_val, (int, float)):
-                                                volume = max(0.0, min(1.0, float(vol_val)))
-                                except Exception:
-                                    pass
-                                
-                                # Get MediaPoolItem to find source file
-                                media_pool_item = None
-                                try:
-                                    get_mp_item = _method(item, "GetMediaPoolItem")
-                                    if get_mp_item:
-                                        media_pool_item = item.GetMediaPoolItem()
-                                except Exception:
-                                    pass
-                                
-                                if not media_pool_item:
-                                    self._log(f"EXPORT AUDIO: Warning: Could not get MediaPoolItem for '{item_name}', skipping")
-                                    continue
-                                
-                                # Get file path from MediaPoolItem
-                                file_path = None
-                                try:
-                                    get_file_path = _method(media_pool_item, "GetClipProperty")
-                                    if get_file_path:
-                                        props = media_pool_item.GetClipProperty(["File Path"])
-                                        if props and isinstance(props, dict):
-                                            file_path = props.get("File Path") or props.get("FilePath")
-                                except Exception:
-                                    pass
-                                
-                                if not file_path or not os.path.exists(file_path):
-                                    self._log(f"EXPORT AUDIO: Warning: Source file not found for '{item_name}', skipping")
-                                    continue
-                                
-                                # Export audio clip (copy source file for now - could render trimmed version later)
-                                file_ext = os.path.splitext(file_path)[1][1:] or 'mp3'
-                                export_filename = f"{_safe_slug(track_name)}_{item_idx+1}_{_safe_slug(item_name)}.{file_ext}"
-                                
-                                # Create temp export directory
-                                export_dir = Path(self.cfg.download_root) / "_temp_audio_export"
-                                export_dir.mkdir(parents=True, exist_ok=True)
-                                export_path = export_dir / export_filename
-                                
-                                # Copy file (or could render trimmed version here)
-                                import shutil
-                                shutil.copy2(file_path, export_path)
-                                temp_audio_files.append(str(export_path))
-                                
-                                self._log(f"EXPORT AUDIO: Exporting '{item_name}' -> {export_filename} (start={rel_start_sec:.3f}s, dur={dur_sec:.3f}s, offset={offset_sec:.3f}s)")
-                                
-                                # Upload to Concepto
-                                try:
-                                    audio_url = self.client.upload_audio_clip(self.cfg.episode_id, str(export_path))
-                                    self._log(f"EXPORT AUDIO: ✓ Uploaded '{item_name}' -> {audio_url}")
-                                    
-                                    # Get source duration
-                                    source_duration_sec = 0.0
-                                    try:
-                                        src_dur_val = media_pool_item.GetClipProperty("Duration")
-                                        if src_dur_val:
-                                            if ":" in str(src_dur_val):
-                                                parts = str(src_dur_val).split(":")
-                                                if len(parts) == 4:
-                                                    source_duration_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
-                                            else:
-                                                source_duration_sec = float(src_dur_val) / fps
-                                    except:
-                                        pass
-
-                                    clips_data.append({
-                                        "id": f"clip_{track_idx}_{item_idx}",
-                                        "name": item_name,
-                                        "url": audio_url,
-                                        "startTime": rel_start_sec,
-                                        "duration": dur_sec,
-                                        "offset": offset_sec,
-                                        "volume": volume,
-                                        "sourceDuration": source_duration_sec or dur_sec
-                                    })
-                                except Exception as e:
-                                    self._log(f"EXPORT AUDIO: ✗ Failed to upload '{item_name}': {e}")
-                                
-                            except Exception as e:
-                                self._log(f"EXPORT AUDIO: Error processing clip: {e}")
-                                import traceback
-                                self._log(f"EXPORT AUDIO: Traceback: {traceback.format_exc()}")
-                        
-                        if clips_data:
-                            audio_tracks_data.append({
-                                "id": f"track_{track_idx}",
-                                "name": track_name,
-                                "type": "audio",
-                                "clips": clips_data,
-                                "isMuted": False,
-                                "volume": 1.0
-                            })
-                    
-                    if not audio_tracks_data:
-                        raise RuntimeError("No audio clips were successfully exported.")
-                    
-                    # Send to Concepto
-                    self._log(f"EXPORT AUDIO: Sending {len(audio_tracks_data)} track(s) with {sum(len(t['clips']) for t in audio_tracks_data)} clip(s) to Concepto...")
-                    self.client.update_audio_tracks(self.cfg.episode_id, audio_tracks_data)
-                    
-                    self._log(f"✓ EXPORT AUDIO: Successfully exported {len(audio_tracks_data)} audio track(s) to AV Preview")
-                    self._log(f"You can now see the audio tracks in Concepto AV Preview.")
-                    
-                finally:
-                    # Cleanup temp files
-                    for temp_file in temp_audio_files:
-                        try:
-                            if os.path.exists(temp_file):
-                                os.remove(temp_file)
-                        except Exception:
-                            pass
-                    # Remove temp directory if empty
-                    try:
-                        export_dir = Path(self.cfg.download_root) / "_temp_audio_export"
-                        if export_dir.exists():
-                            try:
-                                export_dir.rmdir()
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+                audio_tracks_data = _export_audio_tracks(
+                    self.client, self.cfg.episode_id, timeline, a_tracks, fps, tl_start_sec, self._log, "EXPORT AUDIO"
+                )
+                if not audio_tracks_data:
+                    raise RuntimeError("No audio clips were successfully exported.")
                 
+                # Send to Concepto
+                self._log(f"EXPORT AUDIO: Sending {len(audio_tracks_data)} track(s) with {sum(len(t['clips']) for t in audio_tracks_data)} clip(s) to Concepto...")
+                self.client.update_audio_tracks(self.cfg.episode_id, audio_tracks_data)
+                
+                self._log(f"✓ EXPORT AUDIO: Successfully exported {len(audio_tracks_data)} audio track(s) to AV Preview")
+                self._log(f"You can now see the audio tracks in Concepto AV Preview.")
+
             except Exception as e:
                 self._log(f"EXPORT AUDIO ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_import_to_timeline(self):
         """Import Concepto-generated videos into current timeline on NEW tracks (same logic as Download+Build but uses existing timeline)"""
@@ -4027,11 +4544,13 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 # Resolve context
                 self._log("IMPORT: Connecting to Resolve...")
                 _resolve, project, media_pool = resolve_get_context()
+                bins = BinCache(media_pool)
                 timeline = project.GetCurrentTimeline()
                 if not timeline:
                     raise RuntimeError("No current timeline open. Please open a timeline first.")
                 
-                self._log(f"IMPORT: Using current timeline: {getattr(timeline,'GetName',lambda:'(unknown)')()}")
+                tl_display_name = _name(timeline, "(unknown)")
+                self._log(f"IMPORT: Using current timeline: {tl_display_name}")
 
                 # Determine show/episode folder
                 show_name = _safe_slug((self.show or {}).get("name") or self.episode.get("showId") or "UnknownShow")
@@ -4040,12 +4559,15 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 episode_dir = base_dir / show_name / episode_name
                 episode_dir.mkdir(parents=True, exist_ok=True)
                 self._log(f"IMPORT: Local episode folder: {episode_dir}")
+                dl_index = DownloadIndex(episode_dir)
 
                 # Find selected segment
                 segments = ((self.episode.get("avScript") or {}).get("segments") or [])
                 seg = next((s for s in segments if s.get("id") == self.selected_segment_id), None)
                 if not seg:
                     raise RuntimeError("Selected segment not found.")
+                # Bins are <root>/<seg_label>/<take>; the label depends only on the segment
+                seg_label = _segment_bin_label(seg)
 
                 # Use RAW order for clipId + startTimes to match Concepto AVPreview indexing.
                 shots_raw = seg.get("shots") or []
@@ -4082,56 +4604,57 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                 )
                 audio_local_files: List[str] = []
                 
+                # Download the segment's audio tracks and every take's assets on one pool up front;
+                # the loops below only read the results, so placement order is unchanged
+                sorted_shots = _shots_in_script_order(shots_raw)
+                takes = [(shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "") for idx, (_, shot) in enumerate(sorted_shots)]
+                take_assets = [_collect_take_assets(shot, self.cfg.api_endpoint) for _, shot in sorted_shots]
+                audio_dir = episode_dir / "AVPreview_Audio"
+                download_jobs = [(url, _asset_dest(audio_dir, url, filename)) for url, filename in audio_track_assets]
+                for take, assets in zip(takes, take_assets):
+                    download_jobs.extend((url, _asset_dest(episode_dir / take, url, filename)) for url, filename in assets)
+                self._log(
+                    f"IMPORT: Downloading {len(audio_track_assets)} audio track assets from AV Preview "
+                    f"and {len(download_jobs) - len(audio_track_assets)} take assets..."
+                )
+                fetched = _fetch_assets(download_jobs, dl_index, self.cfg.max_parallel_downloads, log=self._log)
+
                 if audio_track_assets:
-                    audio_dir = episode_dir / "AVPreview_Audio"
                     audio_dir.mkdir(parents=True, exist_ok=True)
-                    self._log(f"IMPORT: Downloading {len(audio_track_assets)} audio track assets from AV Preview...")
                     for url, filename in audio_track_assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = audio_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"IMPORT: Downloaded audio track: {dest.name}")
-                                audio_local_files.append(str(dest))
-                            except Exception as e:
-                                self._log(f"IMPORT: Failed to download audio track {filename}: {e}")
-                                continue
-                        else:
-                            audio_local_files.append(str(dest))
+                        dest = _asset_dest(audio_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"IMPORT: Failed to download audio track {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"IMPORT: Downloaded audio track: {dest.name}")
+                        audio_local_files.append(str(dest))
 
                 # Process takes - sort by order (row) to ensure proper sequencing
-                sorted_shots = sorted(shots_raw, key=lambda s: (float(s.get("order", 0) or 0), float(s.get("shotNumber", 0) or 0)))
                 self._log(f"IMPORT: Processing {len(sorted_shots)} shots in order (sorted by row/order field)")
                 
-                for idx, shot in enumerate(sorted_shots):
-                    take = (shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "")
+                for idx, (raw_idx, shot) in enumerate(sorted_shots):
+                    take = takes[idx]
                     take_dir = episode_dir / take
                     take_dir.mkdir(parents=True, exist_ok=True)
 
-                    # Download assets (same as on_download_build)
-                    assets = _collect_take_assets(shot, self.cfg.api_endpoint)
-                    local_files: List[str] = []
+                    # Assets were fetched up front (same as on_download_build)
+                    assets = take_assets[idx]
+                    local_files: List[LocalFile] = []
                     for url, filename in assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = take_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"IMPORT: [{take}] Downloaded: {dest.name}")
-                            except Exception as e:
-                                self._log(f"IMPORT: [{take}] Failed to download {filename}: {e}")
-                                continue
-                        local_files.append(str(dest))
+                        dest = _asset_dest(take_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"IMPORT: [{take}] Failed to download {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"IMPORT: [{take}] Downloaded: {dest.name}")
+                        local_files.append(_local_file_info(str(dest)))
 
                     # Create bins + import (using CONCEPTO_IMPORTED prefix to distinguish)
-                    seg_label = f"SC{int(seg.get('segmentNumber',0)):02d}_{_safe_slug(seg.get('title',''))}"[:80]
-                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", seg_label, take)
-                    imported = resolve_import_files(media_pool, take_folder, local_files)
+                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", seg_label, take, cache=bins)
+                    imported = resolve_import_files(media_pool, take_folder, [lf.path for lf in local_files])
                     self._log(f"IMPORT: [{take}] Imported {len(imported)} items into bin.")
 
                     # Place main on timeline (same logic as on_download_build)
@@ -4149,94 +4672,49 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                     self._log(f"IMPORT: [{take}] Main asset: video={has_video}, image={has_image}")
 
                     # Find matching local file for main
-                    main_file = None
-                    if has_video:
-                        for f in local_files:
-                            if f.endswith(".mp4") and "MAIN_video" in os.path.basename(f):
-                                main_file = f
-                                self._log(f"IMPORT: [{take}] Found main video file: {os.path.basename(f)}")
-                                break
-                    
-                    if not main_file and has_image:
-                        for f in local_files:
-                            basename = os.path.basename(f).lower()
-                            if "MAIN_image" in basename and any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                main_file = f
-                                self._log(f"IMPORT: [{take}] Found main image file: {os.path.basename(f)}")
-                                break
-                    
-                    # Fallback
-                    if not main_file:
-                        if has_video:
-                            for f in local_files:
-                                if f.endswith(".mp4"):
-                                    main_file = f
-                                    self._log(f"IMPORT: [{take}] Using fallback video file: {os.path.basename(f)}")
-                                    break
-                        elif has_image:
-                            for f in local_files:
-                                basename = os.path.basename(f).lower()
-                                if any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                    main_file = f
-                                    self._log(f"IMPORT: [{take}] Using fallback image file: {os.path.basename(f)}")
-                                    break
-                    
-                    if not main_file and local_files:
-                        main_file = local_files[0]
-                        self._log(f"IMPORT: [{take}] Using first available file as main: {os.path.basename(main_file)}")
+                    main_lf, how = _pick_main_file(local_files, has_video, has_image)
+                    main_file = main_lf.path if main_lf else None
+                    if main_lf:
+                        self._log(f"IMPORT: [{take}] {how}: {main_lf.basename}")
                     
                     if not main_file:
                         self._log(f"IMPORT: [{take}] WARNING: Could not find main file in downloaded assets!")
                         continue
 
                     # Find media pool item that matches the imported main file
-                    main_item = imported[0] if imported else None
-                    get_clips = _method(take_folder, "GetClipList")
-                    if get_clips and main_file:
-                        want = os.path.basename(main_file)
-                        for it in take_folder.GetClipList() or []:
-                            nm = getattr(it, "GetName", lambda: "")()
-                            if nm == want or want in nm:
-                                main_item = it
-                                break
+                    main_item = _match_imported_item(imported, take_folder, main_file)
 
                     if not main_item:
                         self._log(f"IMPORT: [{take}] Could not find MediaPoolItem for main, skipping timeline.")
                         continue
 
-                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{idx}"
+                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{raw_idx}"
                     start_sec = float(start_times.get(clip_id, 0.0))
                     dur_sec = float(shot.get("duration") or 0)
                     if dur_sec <= 0:
                         dur_sec = 3.0
                     off_sec = float(shot.get("videoOffset") or 0) or 0.0
 
-                    item_name = getattr(main_item, "GetName", lambda: "(unknown)")()
+                    item_name = _name(main_item, "(unknown)")
                     self._log(f"IMPORT: [{take}] Placing '{item_name}' on NEW track V{new_v_track}: start={start_sec}s dur={dur_sec}s offset={off_sec}s")
                     
-                    # Ensure timeline is current
-                    try:
-                        project.SetCurrentTimeline(timeline)
-                    except Exception:
-                        pass
-                    
                     # Place on NEW video track (not overwriting existing)
-                    is_image = main_file and any(main_file.lower().endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"])
+                    is_image = bool(main_lf and main_lf.is_image)  # extension already classified in _local_file_info
                     track_type = "video"
                     try:
-                        resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=new_v_track, track_type=track_type)
+                        resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=new_v_track, track_type=track_type, ensure_current=False)
                         self._log(f"IMPORT: [{take}] ✓ Successfully placed on NEW track V{new_v_track}")
                     except Exception as e:
                         self._log(f"IMPORT: [{take}] ✗ Failed to place on timeline: {type(e).__name__}: {e}")
-                        import traceback
-                        self._log(f"IMPORT: [{take}] Traceback: {traceback.format_exc()}")
 
                 # Handle AVPreview audio tracks (same as on_download_build)
                 if audio_local_files:
                     self._log(f"IMPORT: Creating audio bin 'AVPreview_Audio' and importing {len(audio_local_files)} audio file(s)...")
-                    audio_bin = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", "AVPreview_Audio")
+                    audio_bin = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", seg_label, "AVPreview_Audio", cache=bins)
                     audio_imported = resolve_import_files(media_pool, audio_bin, audio_local_files)
                     self._log(f"IMPORT: ✓ Imported {len(audio_imported)} audio file(s) into 'AVPreview_Audio' bin")
+                    # Each imported item's name is read once, not once per AVPreview clip matched against it
+                    audio_names = [(_name(it), it) for it in audio_imported]
                     
                     # Place audio on NEW audio tracks
                     avp = self.episode.get("avPreviewData") or {}
@@ -4244,6 +4722,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                     if audio_tracks:
                         self._log(f"IMPORT: Placing {len(audio_local_files)} AVPreview audio clip(s) onto NEW tracks A{new_a_track_start}+...")
                         target_audio_track = new_a_track_start
+                        audio_placements: List[Dict[str, Any]] = []
                         for track_idx, track_data in enumerate(audio_tracks):
                             clips = track_data.get("clips") or []
                             for clip_idx, clip_data in enumerate(clips):
@@ -4264,8 +4743,7 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                                 
                                 # Find MediaPoolItem
                                 audio_item = None
-                                for it in audio_imported:
-                                    nm = getattr(it, "GetName", lambda: "")()
+                                for nm, it in audio_names:
                                     if want_name in nm or nm in want_name:
                                         audio_item = it
                                         break
@@ -4280,30 +4758,29 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
                                 if du <= 0:
                                     continue
                                 
-                                try:
-                                    self._log(f"IMPORT: AUDIO: Place '{want_name}' A{target_audio_track} (AVPreview track {track_idx+1}) start={st}s dur={du}s")
-                                    resolve_place_on_timeline(
-                                        project, media_pool, timeline, audio_item,
-                                        record_seconds=st,
-                                        duration_seconds=du,
-                                        offset_seconds=0.0,
-                                        log_callback=self._log,
-                                        track_index=target_audio_track,
-                                        track_type="audio",
-                                    )
-                                except Exception as e:
-                                    self._log(f"IMPORT: AUDIO: Failed placing '{want_name}': {type(e).__name__}: {e}")
+                                self._log(f"IMPORT: AUDIO: Place '{want_name}' A{target_audio_track} (AVPreview track {track_idx+1}) start={st}s dur={du}s")
+                                audio_placements.append({
+                                    "item": audio_item,
+                                    "record_seconds": st,
+                                    "duration_seconds": du,
+                                    "offset_seconds": 0.0,
+                                    "track_index": target_audio_track,
+                                    "track_type": "audio",
+                                })
                             
                             target_audio_track += 1  # Next AVPreview track goes on next audio track
+
+                        # One AppendToTimeline round-trip for all AVPreview audio clips
+                        placed_n = resolve_place_batch(project, media_pool, timeline, audio_placements, log_callback=self._log)
+                        self._log(f"IMPORT: AUDIO: Placed {placed_n}/{len(audio_placements)} AVPreview audio clip(s)")
                 
                 self._log("✓ IMPORT: Completed importing to new tracks (existing tracks preserved)")
 
             except Exception as e:
                 self._log(f"IMPORT ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_diagnose(self):
         try:
@@ -4313,7 +4790,8 @@ class MainWindow(QtWidgets.QWidget):  # type: ignore
             if not timeline:
                 self._log("Diagnose: No current timeline.")
                 return
-            self._log(f"Diagnose: Timeline = {getattr(timeline,'GetName',lambda:'(unknown)')()}")
+            tl_display_name = _name(timeline, "(unknown)")
+            self._log(f"Diagnose: Timeline = {tl_display_name}")
 
             def list_methods(obj: Any, label: str, keywords: List[str]):
                 methods = []
@@ -4387,7 +4865,20 @@ class MainWindowTk:
         self.show: Optional[Dict[str, Any]] = None
         self.selected_segment_id: Optional[str] = None
         
+        # Log lines are queued here (from any thread) and flushed to the widget by a Tk timer
+        self._log_lock = threading.Lock()
+        self._log_buffer: List[str] = []
+        
+        # Background actions (sync, export, import) run one after another on this queue
+        self._bg = _WorkerQueue("concepto-bg")
+
         self._build_ui()
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
+    def _run_in_background(self, worker: Callable[[], None]):
+        """Queue a worker behind any background action that is still running."""
+        if self._bg.submit(worker):
+            self._log("Waiting for the previous operation to finish...")
         
     def _build_ui(self):
         tk = self.tk
@@ -4539,12 +5030,22 @@ class MainWindowTk:
         self.log.pack(fill=tk.BOTH, expand=True)
         
     def _log(self, msg: str):
-        tk = self.tk
-        self.log.insert(tk.END, msg + "\n")
-        self.log.see(tk.END)
-        self.root.update_idletasks()
+        # Safe to call from worker threads: only the buffer is touched here
+        with self._log_lock:
+            self._log_buffer.append(msg)
         _log_to_file(f"GUI: {msg}")
         
+    def _flush_log(self):
+        """Append all queued log lines in one go (runs on the Tk main loop)."""
+        tk = self.tk
+        with self._log_lock:
+            batch = self._log_buffer
+            self._log_buffer = []
+        if batch:
+            self.log.insert(tk.END, "\n".join(batch) + "\n")
+            self.log.see(tk.END)
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+        
     def on_save(self):
         self.cfg.api_endpoint = self.endpoint_edit.get().strip()
         self.cfg.api_key = self.key_edit.get().strip()
@@ -4559,7 +5060,7 @@ class MainWindowTk:
         if not text or not text.strip():
             return
         try:
-            data = json.loads(text)
+            data = _json_loads(text)
             if isinstance(data, dict):
                 if data.get("apiEndpoint"):
                     self.endpoint_edit.delete(0, self.tk.END)
@@ -4714,6 +5215,7 @@ class MainWindowTk:
                     
                 self._log("Connecting to Resolve...")
                 _resolve, project, media_pool = resolve_get_context()
+                bins = BinCache(media_pool)
                 
                 show_name = _safe_slug((self.show or {}).get("name") or self.episode.get("showId") or "UnknownShow")
                 episode_name = _safe_slug(self.episode.get("title") or self.cfg.episode_id)
@@ -4721,18 +5223,38 @@ class MainWindowTk:
                 episode_dir = base_dir / show_name / episode_name
                 episode_dir.mkdir(parents=True, exist_ok=True)
                 self._log(f"Local episode folder: {episode_dir}")
+                dl_index = DownloadIndex(episode_dir)
                 
                 segments = ((self.episode.get("avScript") or {}).get("segments") or [])
                 seg = next((s for s in segments if s.get("id") == self.selected_segment_id), None)
                 if not seg:
                     raise RuntimeError("Selected segment not found.")
+                # Bins are <root>/<seg_label>/<take>; the label depends only on the segment
+                seg_label = _segment_bin_label(seg)
                     
                 shots_raw = seg.get("shots") or []
                 start_times = self._compute_visual_start_times(seg, shots_raw)
                 
                 tl_name = f"CONCEPTO_{show_name}_{episode_name}"
                 timeline = resolve_get_or_create_timeline(project, tl_name)
-                self._log(f"Using timeline: {getattr(timeline,'GetName',lambda:tl_name)()}")
+                tl_display_name = _name(timeline, tl_name)
+                self._log(f"Using timeline: {tl_display_name}")
+
+                # Frame rate + start timecode don't change during the build: read them once
+                # (most timelines start at 01:00:00:00, i.e. a 3600s offset)
+                try:
+                    fps, tl_start_sec, start_tc = _get_timeline_settings(timeline)
+                    self._log(f"Timeline starts at {start_tc} ({tl_start_sec}s offset) @ {fps}fps")
+                except Exception as e:
+                    fps, tl_start_sec = 24.0, 0.0
+                    self._log(f"Note: Could not read timeline settings, using 24fps and 0.0 start offset: {e}")
+
+                # Make the timeline current once; every placement below targets it
+                try:
+                    project.SetCurrentTimeline(timeline)
+                    self._log(f"Set timeline as current: {tl_display_name}")
+                except Exception as e:
+                    self._log(f"Warning: Could not set timeline as current: {e}")
                 
                 # Collect audio track assets once for the entire segment (these go in episode folder, not take folders)
                 audio_track_assets = _collect_audio_track_assets(
@@ -4743,63 +5265,68 @@ class MainWindowTk:
                 )
                 audio_local_files: List[str] = []  # Collect downloaded audio files for later bin import
                 
+                # Download the segment's audio tracks and every take's assets on one pool up front;
+                # the loops below only read the results, so placement order is unchanged
+                sorted_shots = _shots_in_script_order(shots_raw)
+                takes = [(shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "") for idx, (_, shot) in enumerate(sorted_shots)]
+                take_assets = [_collect_take_assets(shot, self.cfg.api_endpoint) for _, shot in sorted_shots]
+                audio_dir = episode_dir / "AVPreview_Audio"
+                download_jobs = [(url, _asset_dest(audio_dir, url, filename)) for url, filename in audio_track_assets]
+                for take, assets in zip(takes, take_assets):
+                    download_jobs.extend((url, _asset_dest(episode_dir / take, url, filename)) for url, filename in assets)
+                self._log(
+                    f"Downloading {len(audio_track_assets)} audio track assets from AV Preview "
+                    f"and {len(download_jobs) - len(audio_track_assets)} take assets..."
+                )
+                fetched = _fetch_assets(download_jobs, dl_index, self.cfg.max_parallel_downloads, log=self._log)
+
                 if audio_track_assets:
-                    audio_dir = episode_dir / "AVPreview_Audio"
                     audio_dir.mkdir(parents=True, exist_ok=True)
-                    self._log(f"Downloading {len(audio_track_assets)} audio track assets from AV Preview...")
                     for url, filename in audio_track_assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = audio_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"Downloaded audio track: {dest.name}")
-                                audio_local_files.append(str(dest))
-                            except Exception as e:
-                                self._log(f"Failed to download audio track {filename}: {e}")
-                                continue
-                        else:
-                            # File already exists, add to list for import
-                            audio_local_files.append(str(dest))
+                        dest = _asset_dest(audio_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"Failed to download audio track {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"Downloaded audio track: {dest.name}")
+                        audio_local_files.append(str(dest))
                 else:
                     self._log("INFO: No audio tracks found in AV Preview for this segment.")
                 
                 # Process takes - sort by order (row) to ensure proper sequencing
-                sorted_shots = sorted(shots_raw, key=lambda s: (float(s.get("order", 0) or 0), float(s.get("shotNumber", 0) or 0)))
                 self._log(f"Processing {len(sorted_shots)} shots in order (sorted by row/order field)")
                 
                 # List to collect placeholders for SRT generation
                 placeholders_to_create = []
                 
-                for idx, shot in enumerate(sorted_shots):
-                    take = (shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "")
+                # Timeline methods used per take, looked up once
+                add_marker_fn = _method(timeline, "AddMarker")
+                # Markers are queued per take and added after all placements
+                pending_markers: List[Tuple[int, str, str, str, int]] = []
+                
+                for idx, (raw_idx, shot) in enumerate(sorted_shots):
+                    take = takes[idx]
                     take_dir = episode_dir / take
                     
-                    assets = _collect_take_assets(shot, self.cfg.api_endpoint)
+                    assets = take_assets[idx]
                     audio_count = sum(1 for _, fname in assets if "_audio_" in fname)
                     video_count = sum(1 for _, fname in assets if ".mp4" in fname or "video" in fname.lower())
                     image_count = sum(1 for _, fname in assets if ".jpg" in fname or ".png" in fname or "image" in fname.lower())
-                    self._log(f"[{take}] Downloading {len(assets)} assets (audio: {audio_count}, video: {video_count}, images: {image_count})...")
-                    local_files: List[str] = []
+                    self._log(f"[{take}] {len(assets)} assets (audio: {audio_count}, video: {video_count}, images: {image_count})...")
+                    local_files: List[LocalFile] = []
                     for url, filename in assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = take_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"[{take}] Downloaded: {dest.name}")
-                            except Exception as e:
-                                self._log(f"[{take}] Failed to download {filename}: {e}")
-                                continue
-                        local_files.append(str(dest))
+                        dest = _asset_dest(take_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"[{take}] Failed to download {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"[{take}] Downloaded: {dest.name}")
+                        local_files.append(_local_file_info(str(dest)))
                         
-                    seg_label = f"SC{int(seg.get('segmentNumber',0)):02d}_{_safe_slug(seg.get('title',''))}"[:80]
-                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, take)
-                    imported = resolve_import_files(media_pool, take_folder, local_files)
+                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, take, cache=bins)
+                    imported = resolve_import_files(media_pool, take_folder, [lf.path for lf in local_files])
                     self._log(f"[{take}] Imported {len(imported)} items into bin.")
                     
                     # Place main on timeline (or create placeholder if no video/image)
@@ -4809,7 +5336,7 @@ class MainWindowTk:
                     visual_description = shot.get("visual", "")
                     
                     # Collect details for ALL takes into SRT (for full script overlay)
-                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{idx}"
+                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{raw_idx}"
                     start_sec = float(start_times.get(clip_id, 0.0))
                     dur_sec = float(shot.get("duration") or 0)
                     if dur_sec <= 0: dur_sec = 3.0
@@ -4831,71 +5358,27 @@ class MainWindowTk:
                     self._log(f"[{take}] Main asset: video={has_video}, image={has_image}")
 
                     # Find matching local file for main - prioritize based on what's actually available
-                    main_file = None
-                    if has_video:
-                        # Look for MAIN_video first
-                        for f in local_files:
-                            if f.endswith(".mp4") and "MAIN_video" in os.path.basename(f):
-                                main_file = f
-                                self._log(f"[{take}] Found main video file: {os.path.basename(f)}")
-                                break
-                    
-                    if not main_file and has_image:
-                        # Look for MAIN_image (check multiple extensions)
-                        for f in local_files:
-                            basename = os.path.basename(f).lower()
-                            if "MAIN_image" in basename and any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                main_file = f
-                                self._log(f"[{take}] Found main image file: {os.path.basename(f)}")
-                                break
-                    
-                    # Fallback: if we still don't have a main file, try to find any video or image
-                    if not main_file:
-                        if has_video:
-                            # Look for any .mp4 file
-                            for f in local_files:
-                                if f.endswith(".mp4"):
-                                    main_file = f
-                                    self._log(f"[{take}] Using fallback video file: {os.path.basename(f)}")
-                                    break
-                        elif has_image:
-                            # Look for any image file
-                            for f in local_files:
-                                basename = os.path.basename(f).lower()
-                                if any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                    main_file = f
-                                    self._log(f"[{take}] Using fallback image file: {os.path.basename(f)}")
-                                    break
-                    
-                    # Last resort: use first file
-                    if not main_file and local_files:
-                        main_file = local_files[0]
-                        self._log(f"[{take}] Using first available file as main: {os.path.basename(main_file)}")
+                    main_lf, how = _pick_main_file(local_files, has_video, has_image)
+                    main_file = main_lf.path if main_lf else None
+                    if main_lf:
+                        self._log(f"[{take}] {how}: {main_lf.basename}")
                     
                     if not main_file:
                         self._log(f"[{take}] WARNING: Could not find main file in downloaded assets!")
                         self._log(f"[{take}] Debug: local_files count={len(local_files)}")
                         for f in local_files[:5]:  # Show first 5 files
-                            self._log(f"[{take}]   - {os.path.basename(f)}")
+                            self._log(f"[{take}]   - {f.basename}")
                         
-                    main_item = imported[0] if imported else None
-                    get_clips = _method(take_folder, "GetClipList")
-                    if get_clips and main_file:
-                        want = os.path.basename(main_file)
-                        for it in take_folder.GetClipList() or []:
-                            nm = getattr(it, "GetName", lambda: "")()
-                            if nm == want or want in nm:
-                                main_item = it
-                                break
+                    main_item = _match_imported_item(imported, take_folder, main_file)
                                 
                     if not main_item:
                         self._log(f"[{take}] Could not find MediaPoolItem for main, skipping timeline.")
                         self._log(f"[{take}] Debug: imported={len(imported)} items, main_file={main_file}")
                         if imported:
-                            self._log(f"[{take}] Debug: first imported item name={getattr(imported[0], 'GetName', lambda: '(no GetName)')()}")
+                            self._log(f"[{take}] Debug: first imported item name={_name(imported[0], '(no GetName)')}")
                         continue
                         
-                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{idx}"
+                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{raw_idx}"
                     start_sec = float(start_times.get(clip_id, 0.0))
                     dur_sec = float(shot.get("duration") or 0)
                     if dur_sec <= 0:
@@ -4903,142 +5386,41 @@ class MainWindowTk:
                         self._log(f"[{take}] Warning: Duration was {shot.get('duration')}, using default 3.0s")
                     off_sec = float(shot.get("videoOffset") or 0) or 0.0
                     
-                    item_name = getattr(main_item, "GetName", lambda: "(unknown)")()
+                    item_name = _name(main_item, "(unknown)")
                     self._log(f"[{take}] Placing '{item_name}' on timeline: start={start_sec}s dur={dur_sec}s offset={off_sec}s")
                     
-                    # Ensure timeline is current and unlocked
-                    try:
-                        project.SetCurrentTimeline(timeline)
-                    except Exception:
-                        pass
-                    
                     try:
                         # Video clips on V1; embedded audio will auto-link on A1
-                        resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=1, track_type="video")
+                        resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=1, track_type="video", ensure_current=False)
                         self._log(f"[{take}] ✓ Successfully placed on timeline")
                     except Exception as e:
                         self._log(f"[{take}] ✗ Failed to place on timeline: {type(e).__name__}: {e}")
-                        import traceback
-                        self._log(f"[{take}] Traceback: {traceback.format_exc()}")
                     
-                    try:
-                        fps_raw = timeline.GetSetting("timelineFrameRate")
-                        fps = float(fps_raw) if fps_raw else 24.0
-                    except Exception:
-                        fps = 24.0
-                    add_marker = _method(timeline, "AddMarker")
-                    if add_marker:
-                        try:
-                            frame = _seconds_to_frames(start_sec, fps)
-                            note = json.dumps({
-                                "concepto": True,
-                                "episodeId": self.cfg.episode_id,
-                                "segmentId": seg.get("id"),
-                                "shotId": shot.get("id"),
-                                "take": take,
-                                "clipId": clip_id,
-                            })
-                            timeline.AddMarker(frame, "Blue", f"{take}", note, 1)
-                        except Exception:
-                            pass
+                    if add_marker_fn:
+                        note = _marker_note(self.cfg.episode_id, seg.get("id"), shot.get("id"), take, clip_id)
+                        pending_markers.append((_seconds_to_frames(start_sec, fps), "Blue", f"{take}", note, 1))
 
-                # After all takes are processed, create subtitle track from placeholders if any
-                if placeholders_to_create:
-                    self._log(f"Generating subtitle track for {len(placeholders_to_create)} placeholders...")
+                # Flush the take markers in one go now that V1 is laid out (best-effort)
+                for marker in pending_markers:
                     try:
-                        # Convert to SRT time format: HH:MM:SS,mmm
-                        def to_srt_time(secs):
-                            h = int(secs // 3600)
-                            m = int((secs % 3600) // 60)
-                            s = int(secs % 60)
-                            ms = int((secs % 1) * 1000)
-                            return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-                        
-                        srt_lines = []
-                        for i, p in enumerate(placeholders_to_create):
-                            start_sec = p['start']
-                            end_sec = p['start'] + p['duration']
-                            # SRT likes single lines or explicit \n
-                            text = p['text'].replace('\n', ' ')
-                            
-                            srt_lines.append(str(i + 1))
-                            srt_lines.append(f"{to_srt_time(start_sec)} --> {to_srt_time(end_sec)}")
-                            srt_lines.append(text)
-                            srt_lines.append("")
-                        
-                        srt_content = "\n".join(srt_lines)
-                        srt_path = os.path.join(episode_dir, "placeholders.srt")
-                        with open(srt_path, "w", encoding="utf-8") as f:
-                            f.write(srt_content)
-                        
-                        self._log(f"Importing subtitles from {srt_path}...")
-                        # Resolve API: ImportIntoTimeline(path, importType="srt")
-                        import_into = _method(timeline, "ImportIntoTimeline")
-                        if import_into:
-                            result = timeline.ImportIntoTimeline(srt_path, {"importType": "subtitle"})
-                            if not result:
-                                # Try alternate importType
-                                result = timeline.ImportIntoTimeline(srt_path, "srt")
-                            
-                            if result:
-                                self._log(f"✓ Subtitle track created successfully!")
-                            else:
-                                self._log(f"⚠ Automatic subtitle import returned False. You can manually import {srt_path}")
-                        else:
-                            self._log(f"⚠ Timeline.ImportIntoTimeline method not found. File is at: {srt_path}")
-                    except Exception as e:
-                        self._log(f"✗ Failed to create subtitle track: {e}")
+                        add_marker_fn(*marker)
+                    except Exception:
+                        pass
 
                 # After all takes are processed, create subtitle track from placeholders if any
                 if placeholders_to_create:
                     self._log(f"Generating subtitle track for {len(placeholders_to_create)} placeholders...")
                     try:
-                        # STEP 1: Get timeline start offset in seconds
-                        # Most timelines start at 01:00:00:00 (3600 seconds)
-                        tl_start_sec = 0.0
-                        try:
-                            fps_raw = timeline.GetSetting("timelineFrameRate")
-                            fps = float(fps_raw) if fps_raw else 24.0
-                            start_tc = timeline.GetStartTimecode() # e.g. "01:00:00:00"
-                            parts = start_tc.split(":")
-                            if len(parts) == 4:
-                                tl_start_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
-                                self._log(f"Timeline starts at {start_tc} ({tl_start_sec}s offset)")
-                        except Exception as e:
-                            self._log(f"Note: Using 0.0 as start offset: {e}")
-
-                        # Convert to SRT time format: HH:MM:SS,mmm
-                        def to_srt_time(secs):
-                            # Add timeline start offset to make times absolute to timeline
-                            absolute_secs = secs + tl_start_sec
-                            h = int(absolute_secs // 3600)
-                            m = int((absolute_secs % 3600) // 60)
-                            s = int(absolute_secs % 60)
-                            ms = int((absolute_secs % 1) * 1000)
-                            return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-                        
-                        srt_lines = []
-                        for i, p in enumerate(placeholders_to_create):
-                            start_sec = p['start']
-                            end_sec = p['start'] + p['duration']
-                            text = p['text'].replace('\n', ' ')
-                            
-                            srt_lines.append(str(i + 1))
-                            srt_lines.append(f"{to_srt_time(start_sec)} --> {to_srt_time(end_sec)}")
-                            srt_lines.append(text)
-                            srt_lines.append("")
-                        
-                        srt_content = "\n".join(srt_lines)
+                        # STEP 1: SRT times are absolute, so they include the timeline start offset (tl_start_sec)
                         srt_path = os.path.join(episode_dir, "placeholders.srt")
-                        with open(srt_path, "w", encoding="utf-8") as f:
-                            f.write(srt_content)
+                        _write_srt(srt_path, placeholders_to_create, tl_start_sec)
                         
                         self._log(f"Importing subtitles from {srt_path}...")
                         
                         # STEP 2: Import SRT into Media Pool for visibility
                         srt_item = None
                         try:
-                            srt_bin = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, "Subtitles")
+                            srt_bin = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, "Subtitles", cache=bins)
                             media_pool.SetCurrentFolder(srt_bin)
                             imported_items = media_pool.ImportMedia([srt_path])
                             if imported_items:
@@ -5067,35 +5449,9 @@ class MainWindowTk:
                 # After all takes are processed, create audio bin and import audio files
                 if audio_local_files:
                     try:
-                        seg_label = f"SC{int(seg.get('segmentNumber',0)):02d}_{_safe_slug(seg.get('title',''))}"[:80]
-                        concepto_root = media_pool.GetRootFolder()
-                        concepto_folder = None
-                        # Find or create CONCEPTO folder
-                        for f in concepto_root.GetSubFolderList() or []:
-                            if getattr(f, "GetName", lambda: "")() == "CONCEPTO":
-                                concepto_folder = f
-                                break
-                        if not concepto_folder:
-                            concepto_folder = media_pool.AddSubFolder(concepto_root, "CONCEPTO")
-                        
-                        # Find or create segment folder
-                        seg_folder = None
-                        for f in concepto_folder.GetSubFolderList() or []:
-                            if getattr(f, "GetName", lambda: "")() == seg_label:
-                                seg_folder = f
-                                break
-                        if not seg_folder:
-                            seg_folder = media_pool.AddSubFolder(concepto_folder, seg_label)
-                        
-                        # Create AVPreview_Audio bin (below all takes)
+                        # Same BinCache as the take bins: CONCEPTO/<segment> are already resolved, no folder walks
                         audio_bin_name = "AVPreview_Audio"
-                        audio_bin = None
-                        for f in seg_folder.GetSubFolderList() or []:
-                            if getattr(f, "GetName", lambda: "")() == audio_bin_name:
-                                audio_bin = f
-                                break
-                        if not audio_bin:
-                            audio_bin = media_pool.AddSubFolder(seg_folder, audio_bin_name)
+                        audio_bin = resolve_ensure_bins(media_pool, "CONCEPTO", seg_label, audio_bin_name, cache=bins)
                         
                         self._log(f"Creating audio bin '{audio_bin_name}' and importing {len(audio_local_files)} audio file(s)...")
                         imported_audio = resolve_import_files(media_pool, audio_bin, audio_local_files)
@@ -5108,117 +5464,64 @@ class MainWindowTk:
                             if not audio_tracks:
                                 self._log("AUDIO: No avPreviewData.audioTracks to place on timeline.")
                             else:
-                                # Build name -> MediaPoolItem map from audio bin
-                                name_to_item: Dict[str, Any] = {}
-                                get_clip_list = _method(audio_bin, "GetClipList")
-                                if get_clip_list:
-                                    for it in (audio_bin.GetClipList() or []):
-                                        try:
-                                            nm = getattr(it, "GetName", lambda: "")()
-                                            if nm:
-                                                name_to_item[nm] = it
-                                        except Exception:
-                                            pass
-
-                                # Ensure enough audio tracks exist (best-effort)
-                                get_track_count = _method(timeline, "GetTrackCount")
-                                add_track = _method(timeline, "AddTrack")
-                                desired = len(audio_tracks)
-                                if get_track_count:
-                                    try:
-                                        current_a = int(timeline.GetTrackCount("audio") or 0)
-                                    except Exception:
-                                        current_a = 1
-                                    if add_track and current_a < desired:
-                                        for _ in range(desired - current_a):
-                                            try:
-                                                add_track("audio")
-                                            except Exception:
-                                                break
+                                # Build name -> MediaPoolItem map straight from what ImportMedia returned
+                                # (only list the bin if the import gave nothing back)
+                                name_items = imported_audio
+                                if not name_items and _method(audio_bin, "GetClipList"):
+                                    name_items = audio_bin.GetClipList() or []
+                                name_to_item = _build_name_index(name_items)
 
                                 # Place AVPreview audio on A2+ (A1 is reserved for embedded video audio)
                                 audio_track_offset = 2  # Start AVPreview audio on A2
                                 self._log(f"AUDIO: Placing {sum(len(t.get('clips') or []) for t in audio_tracks)} AVPreview audio clip(s) onto timeline A{audio_track_offset}+...")
-                                
-                                # Ensure at least A2 exists for AVPreview audio
-                                if get_track_count:
+
+                                # Ensure A2..A(1+N) exist: read the track count once, add the missing tracks (best-effort)
+                                needed_a = audio_track_offset + len(audio_tracks) - 1
+                                add_track = _method(timeline, "AddTrack")
+                                if add_track and _method(timeline, "GetTrackCount"):
                                     try:
                                         current_a = int(timeline.GetTrackCount("audio") or 0)
                                     except Exception:
                                         current_a = 1
-                                    if add_track and current_a < audio_track_offset:
-                                        for _ in range(audio_track_offset - current_a):
-                                            try:
-                                                add_track("audio")
-                                            except Exception:
-                                                break
-                                
+                                    for _ in range(needed_a - current_a):
+                                        try:
+                                            add_track("audio")
+                                        except Exception:
+                                            break
+
+                                audio_placements: List[Dict[str, Any]] = []
                                 for t_idx, tr in enumerate(audio_tracks):
-                                    clips = tr.get("clips") or []
                                     # Use separate audio track per AVPreview track (A2, A3, etc.)
                                     target_audio_track = audio_track_offset + t_idx
                                     
-                                    # Ensure track exists
-                                    if get_track_count and add_track:
-                                        try:
-                                            current_a = int(timeline.GetTrackCount("audio") or 0)
-                                            if current_a < target_audio_track:
-                                                for _ in range(target_audio_track - current_a):
-                                                    try:
-                                                        add_track("audio")
-                                                    except Exception:
-                                                        break
-                                        except Exception:
-                                            pass
-                                    
-                                    for c_idx, cl in enumerate(clips):
-                                        if not isinstance(cl, dict):
-                                            continue
-                                        fn = _audio_clip_filename(tr, cl)
-                                        want_name = _safe_slug(fn)
-                                        mp_item = name_to_item.get(want_name)
-                                        if not mp_item and name_to_item:
-                                            # fallback: contains match
-                                            for k, v in name_to_item.items():
-                                                if want_name in k:
-                                                    mp_item = v
-                                                    break
+                                    for c_idx, want_name, st, du, off in _audio_clip_specs(tr):
+                                        mp_item = _lookup_by_name(name_to_item, want_name)
                                         if not mp_item:
                                             self._log(f"AUDIO: Missing MediaPoolItem for {want_name} (AVPreview track {t_idx+1} clip {c_idx+1})")
                                             continue
-                                        st = float(cl.get("startTime") or 0)
-                                        du = float(cl.get("duration") or 0)
-                                        off = float(cl.get("offset") or 0)
-                                        if du <= 0:
-                                            du = 1.0
                                         self._log(f"AUDIO: Place '{want_name}' A{target_audio_track} (AVPreview track {t_idx+1}) start={st}s dur={du}s offset={off}s")
-                                        try:
-                                            resolve_place_on_timeline(
-                                                project,
-                                                media_pool,
-                                                timeline,
-                                                mp_item,
-                                                record_seconds=st,
-                                                duration_seconds=du,
-                                                offset_seconds=off,
-                                                log_callback=self._log,
-                                                track_index=target_audio_track,
-                                                track_type="audio",
-                                            )
-                                        except Exception as e:
-                                            self._log(f"AUDIO: Failed placing '{want_name}': {type(e).__name__}: {e}")
+                                        audio_placements.append({
+                                            "item": mp_item,
+                                            "record_seconds": st,
+                                            "duration_seconds": du,
+                                            "offset_seconds": off,
+                                            "track_index": target_audio_track,
+                                            "track_type": "audio",
+                                        })
+
+                                # One AppendToTimeline round-trip for all AVPreview audio clips
+                                placed_n = resolve_place_batch(project, media_pool, timeline, audio_placements, log_callback=self._log)
+                                self._log(f"AUDIO: Placed {placed_n}/{len(audio_placements)} AVPreview audio clip(s)")
                         except Exception as e:
                             self._log(f"AUDIO: Unexpected error while placing audio: {type(e).__name__}: {e}")
                     except Exception as e:
-                        self._log(f"ERROR: Failed to create audio bin or import audio files: {e}")
-                        import traceback
-                        self._log(f"Traceback: {traceback.format_exc()}")
+                        self._log(f"ERROR: Failed to create audio bin or import audio files: {type(e).__name__}: {e}")
                             
                 self._log("Done: Download + bins + timeline build completed.")
             except Exception as e:
                 self._log(f"ERROR: {e}")
                 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
         
     def on_sync(self):
         # Same implementation as PySide version
@@ -5238,11 +5541,7 @@ class MainWindowTk:
                 if not seg:
                     raise RuntimeError("Selected segment not found.")
                 shots_raw = seg.get("shots") or []
-                take_to_shot: Dict[str, Dict[str, Any]] = {}
-                for idx, sh in enumerate(shots_raw):
-                    take = (sh.get("take") or "").replace("_image", "")
-                    if take:
-                        take_to_shot[take] = {"shot": sh, "idx": idx}
+                take_to_shot = _build_take_map(shots_raw)
                         
                 try:
                     fps_raw = timeline.GetSetting("timelineFrameRate")
@@ -5258,10 +5557,8 @@ class MainWindowTk:
                         start_tc_str = timeline.GetStartTimecode()
                         if start_tc_str and isinstance(start_tc_str, str) and ":" in start_tc_str:
                             try:
-                                parts = start_tc_str.split(":")
-                                if len(parts) == 4:
-                                    h, m, s, f = map(int, parts)
-                                    timeline_start_sec = h * 3600 + m * 60 + s + (f / fps)
+                                timeline_start_sec = _timecode_to_seconds(start_tc_str, fps)
+                                if timeline_start_sec is not None:
                                     timeline_start_frame = int(round(timeline_start_sec * fps))
                                     self._log(f"SYNC: Timeline start timecode: {start_tc_str} ({timeline_start_frame} frames)")
                             except Exception:
@@ -5274,56 +5571,23 @@ class MainWindowTk:
                             
                 get_track_count = _method(timeline, "GetTrackCount")
                 get_items = _method(timeline, "GetItemListInTrack")
-                if get_track_count and get_items:
-                    try:
-                        v_tracks = int(timeline.GetTrackCount("video") or 0)
-                    except Exception:
-                        v_tracks = 1
-                    self._log(f"SYNC: Scanning {v_tracks} video tracks for Concepto takes...")
-                    for t in range(1, v_tracks + 1):
-                        try:
-                            items = timeline.GetItemListInTrack("video", t) or []
-                        except Exception:
+                if not take_to_shot:
+                    # No takes in this segment: nothing on the video or subtitle tracks can match
+                    self._log("SYNC: Segment has no takes; skipping timeline scan.")
+                elif get_track_count and get_items:
+                    # One pass over all video tracks, then look takes up
+                    take_index = _index_timeline_by_take(timeline, "video")
+                    self._log(f"SYNC: Found {len(take_index)} Concepto take(s) on video tracks...")
+                    for take, entries in take_index.items():
+                        if take not in take_to_shot:
                             continue
-                        for it in items:
-                            nm = ""
-                            try:
-                                nm = it.GetName()
-                            except Exception:
-                                try:
-                                    mpit = it.GetMediaPoolItem()
-                                    nm = mpit.GetName() if mpit else ""
-                                except Exception:
-                                    nm = ""
-                            take_match = re.search(r"(SC\d{2}T\d{2})", nm)
-                            if not take_match:
-                                continue
-                            take = take_match.group(1)
-                            if take not in take_to_shot:
-                                continue
-                                
+                        for t, it in entries:
                             sh = take_to_shot[take]["shot"]
                             idx = take_to_shot[take]["idx"]
                             clip_id = f"{seg.get('id')}-{sh.get('id')}-{idx}"
                             
-                            # Read timeline position (record start) - multiple methods to try
-                            timeline_pos_frame = None
-                            methods_tried = []
-                            
-                            # Try various methods to get timeline position
-                            for m in ["GetStart", "GetStartFrame", "GetRecordFrame", "GetLeftOffset", "GetLeftOffsetFrames"]:
-                                fn = _method(it, m)
-                                if fn:
-                                    try:
-                                        val = fn()
-                                        if val is not None:
-                                            timeline_pos_frame = int(val)
-                                            methods_tried.append(f"{m}={timeline_pos_frame}")
-                                            self._log(f"SYNC: [{take}] {m}() returned {timeline_pos_frame} frames")
-                                            break
-                                    except Exception as e:
-                                        methods_tried.append(f"{m}=ERROR({type(e).__name__})")
-                                        pass
+                            # Position, duration & source offset from one property read
+                            timeline_pos_frame, dur_frames, in_frame = _item_sync_timing(it, _RECORD_POS_ACCESSORS)
                             
                             if timeline_pos_frame is not None:
                                 # Convert absolute frame to relative seconds (subtract timeline start)
@@ -5334,30 +5598,10 @@ class MainWindowTk:
                                 updated_start_times[clip_id] = start_sec
                                 self._log(f"SYNC: [{take}] Timeline pos {timeline_pos_frame} frames -> relative {relative_frame} frames -> {start_sec:.3f}s")
                             else:
-                                self._log(f"SYNC: [{take}] WARNING: Could not read timeline position. Tried: {', '.join(methods_tried)}")
+                                self._log(f"SYNC: [{take}] WARNING: Could not read timeline position.")
                                 
-                            dur_frames = None
-                            for m in ["GetDuration", "GetDurationFrames"]:
-                                fn = _method(it, m)
-                                if fn:
-                                    try:
-                                        dur_frames = int(fn())
-                                        break
-                                    except Exception:
-                                        pass
                             duration_sec = (dur_frames / fps) if dur_frames is not None else None
-                            
-                            offset_sec = None
-                            get_props = _method(it, "GetProperty") or _method(it, "GetProperties") or _method(it, "GetClipProperty")
-                            if get_props:
-                                try:
-                                    props = get_props()
-                                    if isinstance(props, dict):
-                                        in_frame = props.get("In") or props.get("Start") or props.get("StartFrame")
-                                        if isinstance(in_frame, (int, float)):
-                                            offset_sec = float(in_frame) / fps
-                                except Exception:
-                                    pass
+                            offset_sec = (in_frame / fps) if in_frame is not None else None
                                     
                             updates: Dict[str, Any] = {}
                             if duration_sec is not None:
@@ -5376,16 +5620,23 @@ class MainWindowTk:
                         self._log(f"SYNC: ✓ Successfully updated videoClipStartTimes in Concepto")
                     except Exception as e:
                         self._log(f"SYNC: ERROR updating Concepto: {type(e).__name__}: {e}")
-                        import traceback
-                        self._log(f"SYNC: Traceback: {traceback.format_exc()}")
                 else:
                     self._log("SYNC: No startTime changes detected (or unable to read them).")
                     self._log("SYNC: Tip: Make sure clips are on the timeline and visible in the Edit page.")
                     
                 if updated_shots:
-                    self._log(f"SYNC: Updating {len(updated_shots)} shots (duration/videoOffset) -> Concepto...")
+                    # One entry per shot: timing and subtitle-visual edits for the same shot go out together
+                    merged_updates: Dict[str, Dict[str, Any]] = {}
                     for shot_id, updates in updated_shots:
-                        self.client.update_shot(shot_id, updates)
+                        merged_updates.setdefault(shot_id, {}).update(updates)
+                    self._log(f"SYNC: Updating {len(merged_updates)} shots (duration/videoOffset) -> Concepto...")
+                    missing = self.client.update_shots_bulk(self.cfg.episode_id, merged_updates)
+                    if missing is None:
+                        self._log("SYNC: Server has no bulk shot update; updating shots one by one...")
+                        for shot_id, updates in merged_updates.items():
+                            self.client.update_shot(shot_id, updates)
+                    elif missing:
+                        self._log(f"SYNC: Warning: {len(missing)} shot(s) not found in Concepto, not updated: {', '.join(missing)}")
                 else:
                     self._log("SYNC: No duration/videoOffset changes detected (or unable to read them).")
                     
@@ -5393,12 +5644,13 @@ class MainWindowTk:
             except Exception as e:
                 self._log(f"SYNC ERROR: {e}")
                 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
     
     def on_sync_from_concepto(self):
         """Sync changes FROM Concepto TO Resolve timeline (Tkinter version)"""
         # Same implementation as PySide version - copy the worker function
         def worker():
+            end_undo: Optional[Callable[[], None]] = None  # closes the undo group around the timeline edits
             try:
                 if not self.client or not self.episode or not self.selected_segment_id:
                     raise RuntimeError("Load an episode and select a segment first.")
@@ -5437,10 +5689,8 @@ class MainWindowTk:
                         start_tc_str = timeline.GetStartTimecode()
                         if start_tc_str and isinstance(start_tc_str, str) and ":" in start_tc_str:
                             try:
-                                parts = start_tc_str.split(":")
-                                if len(parts) == 4:
-                                    h, m, s, f = map(int, parts)
-                                    timeline_start_sec = h * 3600 + m * 60 + s + (f / fps)
+                                timeline_start_sec = _timecode_to_seconds(start_tc_str, fps)
+                                if timeline_start_sec is not None:
                                     timeline_start_frame = int(round(timeline_start_sec * fps))
                                     self._log(f"SYNC FROM CONCEPTO: Timeline start: {start_tc_str} ({timeline_start_frame} frames)")
                             except Exception:
@@ -5448,46 +5698,25 @@ class MainWindowTk:
                 except Exception:
                     pass
                 
-                take_to_shot: Dict[str, Dict[str, Any]] = {}
-                for idx, sh in enumerate(shots_raw):
-                    take = (sh.get("take") or "").replace("_image", "")
-                    if take:
-                        take_to_shot[take] = {"shot": sh, "idx": idx}
+                take_to_shot = _build_take_map(shots_raw)
                 
                 get_items = _method(timeline, "GetItemListInTrack")
                 if not get_items:
                     raise RuntimeError("Cannot read timeline items (missing GetItemListInTrack).")
                 
                 updated_count = 0
-                try:
-                    v_tracks = int(timeline.GetTrackCount("video") or 0)
-                except Exception:
-                    v_tracks = 1
-                
-                self._log(f"SYNC FROM CONCEPTO: Scanning {v_tracks} video track(s)...")
-                for t in range(1, v_tracks + 1):
-                    try:
-                        items = timeline.GetItemListInTrack("video", t) or []
-                    except Exception:
+                # One pass over all video tracks (a snapshot taken before any clip is moved), then look takes up
+                take_index = _index_timeline_by_take(timeline, "video")
+                self._log(f"SYNC FROM CONCEPTO: Found {len(take_index)} take(s) on video tracks...")
+                end_undo = _begin_undo_group(project, "Sync from Concepto")
+                if end_undo:
+                    self._log("SYNC FROM CONCEPTO: Grouping timeline edits into one undo step")
+                else:
+                    self._log("SYNC FROM CONCEPTO: Undo grouping not available in this Resolve build; edits are undone one by one")
+                for take, entries in take_index.items():
+                    if take not in take_to_shot:
                         continue
-                    
-                    for it in items:
-                        nm = ""
-                        try:
-                            nm = it.GetName()
-                        except Exception:
-                            try:
-                                mpit = it.GetMediaPoolItem()
-                                nm = mpit.GetName() if mpit else ""
-                            except Exception:
-                                nm = ""
-                        
-                        take_match = re.search(r"(SC\d{2}T\d{2})", nm)
-                        if not take_match:
-                            continue
-                        take = take_match.group(1)
-                        if take not in take_to_shot:
-                            continue
+                    for t, it in entries:
                         
                         sh = take_to_shot[take]["shot"]
                         idx = take_to_shot[take]["idx"]
@@ -5501,50 +5730,46 @@ class MainWindowTk:
                             self._log(f"SYNC FROM CONCEPTO: [{take}] No startTime in Concepto, skipping")
                             continue
                         
-                        # Get current timeline position for comparison
-                        current_pos_frame = None
-                        for m in ["GetStart", "GetStartFrame", "GetRecordFrame", "GetLeftOffset"]:
-                            fn = _method(it, m)
-                            if fn:
-                                try:
-                                    val = fn()
-                                    if val is not None:
-                                        current_pos_frame = int(val)
-                                        break
-                                except Exception:
-                                    pass
+                        # Current position/duration/in-point for comparison (one property read per clip)
+                        current_pos_frame, current_dur_frames, current_in_frame = _item_sync_timing(it, _RECORD_POS_ACCESSORS)
                         
                         # Calculate target timeline frame (add timeline start offset)
                         target_frame = int(round(concepto_start_sec * fps)) + timeline_start_frame
                         target_tc = _frames_to_timecode(target_frame, fps)
                         
+                        in_place = False  # position already right: skip the move methods, only retime
                         if current_pos_frame is not None:
                             current_pos_sec = (current_pos_frame - timeline_start_frame) / fps
                             self._log(f"SYNC FROM CONCEPTO: [{take}] Current pos={current_pos_sec:.3f}s (frame {current_pos_frame}), Target={concepto_start_sec:.3f}s (frame {target_frame})")
                             
-                            # If already at correct position, skip
+                            # If already at correct position (and duration/offset match), skip
                             if abs(current_pos_frame - target_frame) <= 1:
-                                self._log(f"SYNC FROM CONCEPTO: [{take}] Already at correct position, skipping move")
-                                updated_count += 1
-                                continue
+                                if _clip_timing_matches(current_dur_frames, current_in_frame, concepto_duration, concepto_offset, fps):
+                                    self._log(f"SYNC FROM CONCEPTO: [{take}] Already in sync, skipping")
+                                    updated_count += 1
+                                    continue
+                                self._log(f"SYNC FROM CONCEPTO: [{take}] Already at correct position, updating duration/offset only")
+                                in_place = True
                         else:
                             self._log(f"SYNC FROM CONCEPTO: [{take}] Could not read current position, attempting update anyway")
                         
                         self._log(f"SYNC FROM CONCEPTO: [{take}] Updating to start={concepto_start_sec:.3f}s ({target_tc}), dur={concepto_duration:.3f}s, offset={concepto_offset:.3f}s")
                         
                         # Try to move/update the clip - use multiple methods
-                        moved = False
+                        moved = in_place
+                        placed_item = None  # TimelineItem handed back by InsertClipAtTrack, if any
+                        reinserted = False  # delete+insert replaces the TimelineItem; setter moves keep `it`
                         try:
                             # Method 1: Try DeleteClipAtTrack + InsertClipAtTrack (most reliable)
                             delete_at_track = _method(timeline, "DeleteClipAtTrack")
                             insert_at_track = _method(timeline, "InsertClipAtTrack")
-                            if delete_at_track and insert_at_track and current_pos_frame is not None:
+                            if not moved and delete_at_track and insert_at_track and current_pos_frame is not None:
                                 try:
                                     # Get media pool item
                                     mp_item = None
                                     get_mp_item = _method(it, "GetMediaPoolItem")
                                     if get_mp_item:
-                                        mp_item = it.GetMediaPoolItem()
+                                        mp_item = get_mp_item()
                                     
                                     if mp_item:
                                         # Get current track index and trim info
@@ -5562,41 +5787,50 @@ class MainWindowTk:
                                             except Exception:
                                                 pass
                                         
-                                        # Delete old clip
+                                        # Delete old clip (only an explicit False means it is still there)
+                                        deleted = False
                                         try:
-                                            timeline.DeleteClipAtTrack(current_track, current_pos_frame)
-                                            self._log(f"  Deleted clip at track {current_track}, frame {current_pos_frame}")
+                                            deleted = timeline.DeleteClipAtTrack(current_track, current_pos_frame) is not False
+                                            if deleted:
+                                                self._log(f"  Deleted clip at track {current_track}, frame {current_pos_frame}")
+                                            else:
+                                                self._log("  DeleteClipAtTrack returned False")
                                         except Exception as e:
                                             self._log(f"  DeleteClipAtTrack failed: {e}")
                                         
-                                        # Insert at new position
-                                        try:
-                                            result = timeline.InsertClipAtTrack(current_track, target_frame, mp_item)
-                                            if result:
-                                                self._log(f"  InsertClipAtTrack successful at frame {target_frame}")
-                                                # Apply trim if we have source IN/OUT
-                                                if source_in is not None or source_out is not None:
-                                                    new_it = result
-                                                    set_prop = _method(new_it, "SetProperty")
-                                                    if set_prop:
-                                                        try:
-                                                            if source_in is not None:
-                                                                new_it.SetProperty("Start", source_in)
-                                                            if source_out is not None:
-                                                                new_it.SetProperty("End", source_out)
-                                                            self._log(f"  Applied trim: Start={source_in}, End={source_out}")
-                                                        except Exception:
-                                                            pass
-                                                moved = True
-                                        except Exception as e:
-                                            self._log(f"  InsertClipAtTrack failed: {e}")
-                                            # Try to restore old position if insert failed
-                                            if current_pos_frame is not None and mp_item:
-                                                try:
-                                                    timeline.InsertClipAtTrack(current_track, current_pos_frame, mp_item)
-                                                    self._log(f"  Restored clip to original position")
-                                                except Exception:
-                                                    pass
+                                        # Insert at new position; if the old clip is still there, leave moved False
+                                        # and fall through to the SetProperty/setter methods instead of duplicating it
+                                        result = None
+                                        if deleted:
+                                            try:
+                                                result = timeline.InsertClipAtTrack(current_track, target_frame, mp_item)
+                                            except Exception as e:
+                                                self._log(f"  InsertClipAtTrack failed: {e}")
+                                        if result:
+                                            self._log(f"  InsertClipAtTrack successful at frame {target_frame}")
+                                            reinserted = True
+                                            if not isinstance(result, bool):
+                                                placed_item = result
+                                            # Apply trim if we have source IN/OUT
+                                            if source_in is not None or source_out is not None:
+                                                set_prop = _method(result, "SetProperty")
+                                                if set_prop:
+                                                    try:
+                                                        if source_in is not None:
+                                                            set_prop("Start", source_in)
+                                                        if source_out is not None:
+                                                            set_prop("End", source_out)
+                                                        self._log(f"  Applied trim: Start={source_in}, End={source_out}")
+                                                    except Exception:
+                                                        pass
+                                            moved = True
+                                        elif deleted:
+                                            # Insert failed after the clip was removed: put it back where it was
+                                            try:
+                                                timeline.InsertClipAtTrack(current_track, current_pos_frame, mp_item)
+                                                self._log(f"  Restored clip to original position")
+                                            except Exception:
+                                                pass
                                 except Exception as e:
                                     self._log(f"  Delete+Insert method failed: {e}")
                             
@@ -5606,10 +5840,11 @@ class MainWindowTk:
                                 if set_prop:
                                     try:
                                         # Try common property names for timeline position
-                                        for prop_name in ["RecordFrame", "StartFrame", "Start", "LeftOffset", "Position"]:
+                                        for prop_name in _setter_ladder(_POSITION_PROPS):
                                             try:
-                                                it.SetProperty(prop_name, target_frame)
+                                                set_prop(prop_name, target_frame)
                                                 self._log(f"  Set {prop_name}={target_frame}")
+                                                _preferred_setter[_POSITION_PROPS] = prop_name
                                                 moved = True
                                                 break
                                             except Exception as e:
@@ -5619,12 +5854,13 @@ class MainWindowTk:
                             
                             # Method 3: Try SetStart/SetStartFrame methods
                             if not moved:
-                                for m in ["SetStart", "SetStartFrame", "SetRecordFrame", "SetLeftOffset", "SetPosition"]:
+                                for m in _setter_ladder(_POSITION_SETTERS):
                                     fn = _method(it, m)
                                     if fn:
                                         try:
                                             fn(target_frame)
                                             self._log(f"  Called {m}({target_frame})")
+                                            _preferred_setter[_POSITION_SETTERS] = m
                                             moved = True
                                             break
                                         except Exception as e:
@@ -5632,59 +5868,28 @@ class MainWindowTk:
                             
                             # If we successfully moved the clip, now update duration and offset
                             if moved:
-                                # Get the timeline item again (it might be a new object after insert)
+                                # The clip is a new object after delete+insert: use the one InsertClipAtTrack returned, and only
+                                # re-read that one track when the API gave back a bare True. Setter moves keep `it`.
                                 try:
-                                    items_after = timeline.GetItemListInTrack("video", t) or []
-                                    new_it = None
-                                    for check_it in items_after:
-                                        check_nm = ""
-                                        try:
-                                            check_nm = check_it.GetName()
-                                        except Exception:
-                                            try:
-                                                mpit = check_it.GetMediaPoolItem()
-                                                check_nm = mpit.GetName() if mpit else ""
-                                            except Exception:
-                                                pass
-                                        if take in check_nm:
-                                            # Verify position matches
-                                            check_pos = None
-                                            for pos_m in ["GetStart", "GetStartFrame"]:
-                                                pos_fn = _method(check_it, pos_m)
-                                                if pos_fn:
-                                                    try:
-                                                        check_pos = int(pos_fn())
-                                                        break
-                                                    except Exception:
-                                                        pass
-                                            if check_pos is not None and abs(check_pos - target_frame) <= 2:
-                                                new_it = check_it
-                                                break
-                                    
-                                    # Use new_it if found, otherwise use original it
-                                    update_it = new_it if new_it else it
+                                    update_it = placed_item
+                                    if update_it is None and reinserted:
+                                        update_it = _find_take_item(timeline, "video", t, take, target_frame)
+                                    update_it = update_it or it
                                     
                                     # Update duration if different
-                                    current_dur = None
-                                    for m in ["GetDuration", "GetDurationFrames"]:
-                                        fn = _method(update_it, m)
-                                        if fn:
-                                            try:
-                                                current_dur = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
+                                    current_dur = _item_duration_frames(update_it)
                                     
-                                    if current_dur is not None:
+                                    if current_dur is not None and concepto_duration > 0:
                                         target_dur_frames = int(round(concepto_duration * fps))
                                         if abs(current_dur - target_dur_frames) > 1:
                                             # Try to set duration
-                                            for m in ["SetDuration", "SetDurationFrames"]:
+                                            for m in _setter_ladder(_DURATION_SETTERS):
                                                 fn = _method(update_it, m)
                                                 if fn:
                                                     try:
                                                         fn(target_dur_frames)
                                                         self._log(f"  Set duration to {target_dur_frames} frames")
+                                                        _preferred_setter[_DURATION_SETTERS] = m
                                                         break
                                                     except Exception as e:
                                                         self._log(f"    {m} failed: {e}")
@@ -5695,10 +5900,11 @@ class MainWindowTk:
                                         set_prop = _method(update_it, "SetProperty")
                                         if set_prop:
                                             try:
-                                                for prop_name in ["In", "Start", "StartFrame", "SourceStart"]:
+                                                for prop_name in _setter_ladder(_OFFSET_PROPS):
                                                     try:
-                                                        update_it.SetProperty(prop_name, offset_frames)
+                                                        set_prop(prop_name, offset_frames)
                                                         self._log(f"  Set {prop_name}={offset_frames} (offset)")
+                                                        _preferred_setter[_OFFSET_PROPS] = prop_name
                                                         break
                                                     except Exception as e:
                                                         self._log(f"    {prop_name} failed: {e}")
@@ -5714,17 +5920,22 @@ class MainWindowTk:
                                 self._log(f"  ✗ Could not move [{take}] - all methods failed")
                         except Exception as e:
                             self._log(f"  ✗ Failed to update [{take}]: {type(e).__name__}: {e}")
-                            import traceback
-                            self._log(f"    Traceback: {traceback.format_exc()}")
                 
+                if end_undo:
+                    close_undo, end_undo = end_undo, None
+                    close_undo()
                 self._log(f"SYNC FROM CONCEPTO: ✓ Updated {updated_count} clip(s) on timeline")
                 self._log("SYNC FROM CONCEPTO complete. Check timeline to verify changes.")
             except Exception as e:
                 self._log(f"SYNC FROM CONCEPTO ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
+                if end_undo:
+                    try:
+                        end_undo()
+                    except Exception:
+                        pass
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
     
     def on_export_av_script(self):
         """Export current timeline subtitles as SRT file for AV Script import (Tkinter version)"""
@@ -5743,10 +5954,8 @@ class MainWindowTk:
                 
                 # Get timeline start timecode
                 start_tc = timeline.GetStartTimecode()  # e.g. "01:00:00:00"
-                parts = start_tc.split(":")
-                tl_start_sec = 0.0
-                if len(parts) == 4:
-                    tl_start_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
+                tl_start_sec = _timecode_to_seconds(start_tc, fps) or 0.0
+                tl_start_frame = int(round(tl_start_sec * fps))
                 
                 self._log(f"EXPORT: Timeline starts at {start_tc} ({tl_start_sec:.3f}s offset)")
 
@@ -5767,64 +5976,30 @@ class MainWindowTk:
                 subtitle_entries = []
                 for t in range(1, s_tracks + 1):
                     items = timeline.GetItemListInTrack("subtitle", t) or []
+                    # Items on one track share an API class: pick the text accessors once per track
+                    readers = _subtitle_text_readers(items[0]) if items else []
                     for it in items:
                         try:
-                            # Get text (try multiple methods)
-                            content = ""
-                            try: content = it.GetName()
-                            except: pass
-                            if not content:
-                                try:
-                                    fn = _method(it, "GetText")
-                                    if fn: content = fn()
-                                except: pass
-                            if not content:
-                                try:
-                                    prop_fn = _method(it, "GetProperty")
-                                    if prop_fn:
-                                        content = prop_fn("Text") or prop_fn("Caption")
-                                except: pass
+                            content = _read_subtitle_text(it, readers)
                             
                             if not content:
                                 continue
                             
                             # Get timing (start and duration)
-                            start_frame = None
-                            dur_frame = None
-                            
-                            for m in ["GetStart", "GetStartFrame"]:
-                                fn = _method(it, m)
-                                if fn:
-                                    try:
-                                        start_frame = int(fn())
-                                        break
-                                    except: pass
+                            start_frame = _item_start_frame(it)
                             
-                            for m in ["GetDuration", "GetDurationFrames"]:
-                                fn = _method(it, m)
-                                if fn:
-                                    try:
-                                        dur_frame = int(fn())
-                                        break
-                                    except: pass
+                            dur_frame = _item_duration_frames(it)
                             
                             if start_frame is None or dur_frame is None:
                                 self._log(f"EXPORT: Skipping subtitle - could not read timing")
                                 continue
                             
                             # Convert to relative seconds (subtract timeline start)
-                            rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
+                            rel_start_sec = (start_frame - tl_start_frame) / fps
                             dur_sec = dur_frame / fps
                             
-                            # Look for [SCxxTxx] pattern
-                            take_match = re.search(r"\[?\s*(SC\d{2}T\d{2})\s*\]?", content)
-                            if not take_match:
-                                # Try to extract visual description anyway (might be just text)
-                                visual_desc = content.strip()
-                            else:
-                                take = take_match.group(1)
-                                # Extract visual description after [SCxxTxx]
-                                visual_desc = re.sub(r"\[?\s*SC\d{2}T\d{2}\s*\]?\s*-?\s*", "", content, flags=re.IGNORECASE).strip()
+                            # Visual description: the text with any [SCxxTxx] tag stripped (plain text kept as-is)
+                            visual_desc = (_TAKE_TAG_STRIP_RE.sub("", content) if "SC" in content else content).strip()
                             
                             if visual_desc:
                                 subtitle_entries.append({
@@ -5845,31 +6020,7 @@ class MainWindowTk:
                 subtitle_entries.sort(key=lambda x: x['start'])
                 self._log(f"EXPORT: Found {len(subtitle_entries)} subtitle entries")
                 
-                # Generate SRT
-                def to_srt_time(secs):
-                    h = int(secs // 3600)
-                    m = int((secs % 3600) // 60)
-                    s = int(secs % 60)
-                    ms = int((secs % 1) * 1000)
-                    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-                
-                srt_lines = []
-                for i, entry in enumerate(subtitle_entries):
-                    start_sec = entry['start']
-                    end_sec = start_sec + entry['duration']
-                    text = entry['text'].replace('\n', ' ')  # SRT format
-                    
-                    srt_lines.append(str(i + 1))
-                    srt_lines.append(f"{to_srt_time(start_sec)} --> {to_srt_time(end_sec)}")
-                    srt_lines.append(text)
-                    srt_lines.append("")
-                
-                srt_content = "\n".join(srt_lines)
-                
                 # Save to Downloads folder or user-selected location
-                from tkinter import filedialog
-                from pathlib import Path
-                
                 default_name = f"av_script_export_{timeline.GetName() or 'timeline'}.srt"
                 default_path = Path.home() / "Downloads" / default_name
                 
@@ -5884,18 +6035,16 @@ class MainWindowTk:
                     self._log("EXPORT: Cancelled by user.")
                     return
                 
-                with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(srt_content)
+                _write_srt(save_path, subtitle_entries)
                 
                 self._log(f"✓ EXPORT: Saved {len(subtitle_entries)} entries to {save_path}")
                 self._log(f"You can now import this SRT file in Concepto AV Script page.")
                 
             except Exception as e:
                 self._log(f"EXPORT ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_export_srt_video(self):
         """Export SRT + MAIN track media and sync to Concepto AV Script/Preview (Tkinter version)"""
@@ -5924,7 +6073,7 @@ class MainWindowTk:
                         self._log("EXPORT SRT+VIDEO: Skipping subtitle without take code")
                         continue
                     seg_num = 1
-                    take_match = re.search(r"SC(\d{2})T(\d{2})", take, re.IGNORECASE)
+                    take_match = _TAKE_PARTS_RE.search(take)
                     if take_match:
                         seg_num = int(take_match.group(1))
                     shots_payload.append({
@@ -5947,12 +6096,14 @@ class MainWindowTk:
                 self.episode = ep
 
                 segments = ((ep.get("avScript") or {}).get("segments") or [])
+                # One walk over segments/shots: each take's shot, segment and AV Preview clip id
                 take_to_shot: Dict[str, Dict[str, Any]] = {}
                 for seg in segments:
-                    for shot in seg.get("shots") or []:
+                    seg_id = seg.get("id")
+                    for idx, shot in enumerate(seg.get("shots") or []):
                         take_val = (shot.get("take") or "").upper()
                         if take_val:
-                            take_to_shot[take_val] = {"shot": shot, "segment": seg}
+                            take_to_shot[take_val] = {"shot": shot, "segment": seg, "clip_id": f"{seg_id}-{shot.get('id')}-{idx}"}
 
                 clips = _collect_main_track_clips(timeline, fps, tl_start_sec, self._log)
                 if not clips:
@@ -5964,16 +6115,9 @@ class MainWindowTk:
 
                 self._log(f"EXPORT SRT+VIDEO: Available shots in Concepto after import: {list(take_to_shot.keys())}")
 
-                take_to_clip_id: Dict[str, str] = {}
-                for seg in segments:
-                    for idx, shot in enumerate(seg.get("shots") or []):
-                        take_val = (shot.get("take") or "").upper()
-                        if take_val:
-                            take_to_clip_id[take_val] = f"{seg.get('id')}-{shot.get('id')}-{idx}"
-
                 video_start_times: Dict[str, float] = {}
                 for clip in clips:
-                    clip_id = take_to_clip_id.get(clip["take"])
+                    clip_id = (take_to_shot.get(clip["take"]) or {}).get("clip_id")
                     if clip_id:
                         video_start_times[clip_id] = float(clip["start"])
                     else:
@@ -5985,6 +6129,8 @@ class MainWindowTk:
 
                 # Upload media + update duration/offset
                 processed_takes = set()
+                uploads: List[Tuple[str, str, Dict[str, Any], Dict[str, Any], str]] = []
+                timing_updates: Dict[str, Dict[str, Any]] = {}
                 for clip in clips:
                     take = clip["take"]
                     self._log(f"EXPORT SRT+VIDEO: Processing clip: {clip.get('item_name')} (take: {take})")
@@ -6011,10 +6157,10 @@ class MainWindowTk:
                         
                         if abs(new_duration - old_duration) > 0.01 or abs(new_offset - old_offset) > 0.01:
                             self._log(f"[{take}] Updating duration: {old_duration:.2f}s -> {new_duration:.2f}s, offset: {old_offset:.2f}s -> {new_offset:.2f}s")
-                            self.client.update_shot(shot.get("id"), {
+                            timing_updates[shot.get("id")] = {
                                 "duration": new_duration,
                                 "videoOffset": new_offset,
-                            })
+                            }
                         else:
                             self._log(f"[{take}] Duration/offset unchanged: {new_duration:.2f}s, offset: {new_offset:.2f}s")
                     except Exception as e:
@@ -6026,7 +6172,7 @@ class MainWindowTk:
                         self._log(f"[{take}] Tip: The clip is on the timeline but source file path could not be determined.")
                         continue
                     
-                    if not os.path.exists(file_path):
+                    if not clip.get("file_exists"):
                         self._log(f"[{take}] Warning: File not found at '{file_path}' for '{clip.get('item_name')}'. Cannot upload.")
                         continue
                     
@@ -6045,33 +6191,36 @@ class MainWindowTk:
                             self._log(f"[{take}] Different file name: existing='{existing_filename}', new='{file_name}' - will upload")
                     
                     if should_upload:
-                        if clip["clip_type"] == "video":
-                            self._log(f"[{take}] Uploading video: {file_name}")
-                            try:
-                                url = self.client.upload_shot_video(
-                                    shot.get("id"),
-                                    file_path,
-                                    self.cfg.episode_id,
-                                    seg.get("id"),
-                                    mode="replace",  # Use replace to update existing video
-                                    set_main=True,
-                                )
-                                self._log(f"[{take}] ✓ Uploaded video -> {url}")
-                            except Exception as e:
-                                self._log(f"[{take}] ✗ Video upload failed: {e}")
-                        else:
-                            self._log(f"[{take}] Uploading image: {file_name}")
-                            try:
-                                url = self.client.upload_shot_image(
-                                    shot.get("id"),
-                                    file_path,
-                                    self.cfg.episode_id,
-                                    seg.get("id"),
-                                    mode="replace",  # Use replace to update existing image
-                                )
-                                self._log(f"[{take}] ✓ Uploaded image -> {url}")
-                            except Exception as e:
-                                self._log(f"[{take}] ✗ Image upload failed: {e}")
+                        kind = "video" if clip["clip_type"] == "video" else "image"
+                        self._log(f"[{take}] Uploading {kind}: {file_name}")
+                        uploads.append((take, kind, shot, seg, file_path))
+
+                # Duration/offset changes go out in one request, before any media upload
+                if timing_updates:
+                    self._log(f"EXPORT SRT+VIDEO: Updating duration/offset for {len(timing_updates)} shot(s)...")
+                    try:
+                        missing = self.client.update_shots_bulk(self.cfg.episode_id, timing_updates)
+                        if missing is None:
+                            self._log("EXPORT SRT+VIDEO: Server has no bulk shot update; updating shots one by one...")
+                            for shot_id, updates in timing_updates.items():
+                                try:
+                                    self.client.update_shot(shot_id, updates)
+                                except Exception as e:
+                                    self._log(f"EXPORT SRT+VIDEO: Warning: Could not update duration/offset of shot {shot_id}: {e}")
+                        elif missing:
+                            self._log(f"EXPORT SRT+VIDEO: Warning: {len(missing)} shot(s) not found in Concepto, not updated: {', '.join(missing)}")
+                    except Exception as e:
+                        self._log(f"EXPORT SRT+VIDEO: Warning: Could not update duration/offset: {e}")
+
+                # Uploads run one at a time once every duration/offset update is done: each upload
+                # rewrites the whole segment's shot list on the server, so concurrent uploads for
+                # takes in the same segment would overwrite each other's new URLs
+                for take, kind, shot, seg, file_path in uploads:
+                    try:
+                        url = _upload_shot_media(self.client, self.cfg.episode_id, kind, shot, seg, file_path)
+                        self._log(f"[{take}] ✓ Uploaded {kind} -> {url}")
+                    except Exception as e:
+                        self._log(f"[{take}] ✗ {kind.capitalize()} upload failed: {e}")
 
                 # Export audio tracks to AV Preview
                 self._log("EXPORT SRT+VIDEO: Exporting audio tracks...")
@@ -6080,215 +6229,26 @@ class MainWindowTk:
                     if a_tracks > 0:
                         self._log(f"EXPORT SRT+VIDEO: Found {a_tracks} audio track(s)")
                         
-                        audio_tracks_data: List[Dict[str, Any]] = []
-                        temp_audio_files: List[str] = []
-                        
-                        for track_idx in range(1, a_tracks + 1):
-                            items = timeline.GetItemListInTrack("audio", track_idx) or []
-                            if not items:
-                                continue
-                            
-                            # Get track name (try various methods)
-                            track_name = f"Audio {track_idx}"
-                            try:
-                                get_track_name = _method(timeline, "GetTrackName")
-                                if get_track_name:
-                                    name_result = timeline.GetTrackName("audio", track_idx)
-                                    if name_result:
-                                        track_name = name_result
-                            except Exception:
-                                pass
-                            
-                            self._log(f"EXPORT SRT+VIDEO: Processing audio track {track_idx}: '{track_name}' ({len(items)} clips)")
-                            
-                            clips_data: List[Dict[str, Any]] = []
-                            
-                            for item_idx, item in enumerate(items):
-                                try:
-                                    item_name = getattr(item, "GetName", lambda: "(unknown)")()
-                                    
-                                    # Get timeline position
-                                    start_frame = None
-                                    for m in ["GetStart", "GetStartFrame"]:
-                                        fn = _method(item, m)
-                                        if fn:
-                                            try:
-                                                start_frame = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
-                                    
-                                    # Get duration
-                                    dur_frame = None
-                                    for m in ["GetDuration", "GetDurationFrames"]:
-                                        fn = _method(item, m)
-                                        if fn:
-                                            try:
-                                                dur_frame = int(fn())
-                                                break
-                                            except Exception:
-                                                pass
-                                    
-                                    if start_frame is None or dur_frame is None:
-                                        self._log(f"EXPORT SRT+VIDEO: Skipping audio clip '{item_name}' - could not read timing")
-                                        continue
-                                    
-                                    # Convert to relative seconds
-                                    rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
-                                    dur_sec = dur_frame / fps
-                                    
-                                    # Get source offset
-                                    offset_frame = 0
-                                    for prop_name in ["SourceStart", "In", "StartFrame"]:
-                                        try:
-                                            get_prop = _method(item, "GetProperty")
-                                            if get_prop:
-                                                prop_val = get_prop(prop_name)
-                                                if prop_val is not None:
-                                                    offset_frame = int(prop_val)
-                                                    break
-                                        except Exception:
-                                            pass
-                                    offset_sec = offset_frame / fps
-                                    
-                                    # Get volume
-                                    volume = 1.0
-                                    try:
-                                        get_prop = _method(item, "GetProperty")
-                                        if get_prop:
-                                            vol_val = get_prop("AudioLevels") or get_prop("Volume")
-                                            if vol_val is not None:
-                                                if isinstance(vol_val, (list, tuple)) and len(vol_val) > 0:
-                                                    vol_db = float(vol_val[0])
-                                                    volume = max(0.0, min(1.0, 10 ** (vol_db / 20)))
-                                                elif isinstance(vol_val, (int, float)):
-                                                    volume = max(0.0, min(1.0, float(vol_val)))
-                                    except Exception:
-                                        pass
-                                    
-                                    # Get MediaPoolItem
-                                    media_pool_item = None
-                                    try:
-                                        get_mp_item = _method(item, "GetMediaPoolItem")
-                                        if get_mp_item:
-                                            media_pool_item = item.GetMediaPoolItem()
-                                    except Exception:
-                                        pass
-                                    
-                                    if not media_pool_item:
-                                        self._log(f"EXPORT SRT+VIDEO: Warning: Could not get MediaPoolItem for '{item_name}', skipping")
-                                        continue
-                                    
-                                    # Get file path
-                                    file_path = None
-                                    try:
-                                        get_file_path = _method(media_pool_item, "GetClipProperty")
-                                        if get_file_path:
-                                            props = media_pool_item.GetClipProperty(["File Path"])
-                                            if props and isinstance(props, dict):
-                                                file_path = props.get("File Path") or props.get("FilePath")
-                                    except Exception:
-                                        pass
-                                    
-                                    if not file_path or not os.path.exists(file_path):
-                                        self._log(f"EXPORT SRT+VIDEO: Warning: Source file not found for '{item_name}', skipping")
-                                        continue
-                                    
-                                    # Copy file to temp location
-                                    file_ext = os.path.splitext(file_path)[1][1:] or 'mp3'
-                                    export_filename = f"{_safe_slug(track_name)}_{item_idx+1}_{_safe_slug(item_name)}.{file_ext}"
-                                    export_dir = Path(self.cfg.download_root) / "_temp_audio_export"
-                                    export_dir.mkdir(parents=True, exist_ok=True)
-                                    export_path = export_dir / export_filename
-                                    
-                                    import shutil
-                                    shutil.copy2(file_path, export_path)
-                                    temp_audio_files.append(str(export_path))
-                                    
-                                    # Upload to Concepto
-                                    try:
-                                        audio_url = self.client.upload_audio_clip(self.cfg.episode_id, str(export_path))
-                                        
-                                        # Get source duration
-                                        source_duration_sec = 0.0
-                                        try:
-                                            src_dur_val = media_pool_item.GetClipProperty("Duration")
-                                            if src_dur_val:
-                                                if ":" in str(src_dur_val):
-                                                    parts = str(src_dur_val).split(":")
-                                                    if len(parts) == 4:
-                                                        source_duration_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
-                                                else:
-                                                    source_duration_sec = float(src_dur_val) / fps
-                                        except Exception:
-                                            pass
-                                        
-                                        clips_data.append({
-                                            "id": f"clip_{track_idx}_{item_idx}_{int(time.time())}",
-                                            "name": item_name,
-                                            "url": audio_url,
-                                            "startTime": rel_start_sec,
-                                            "duration": dur_sec,
-                                            "offset": offset_sec,
-                                            "volume": volume,
-                                            "sourceDuration": source_duration_sec or dur_sec
-                                        })
-                                        self._log(f"EXPORT SRT+VIDEO: ✓ Uploaded audio clip '{item_name}' from track '{track_name}'")
-                                    except Exception as e:
-                                        self._log(f"EXPORT SRT+VIDEO: ✗ Failed to upload audio clip '{item_name}': {e}")
-                                
-                                except Exception as e:
-                                    self._log(f"EXPORT SRT+VIDEO: Error processing audio clip: {e}")
-                                    continue
-                            
-                            if clips_data:
-                                audio_tracks_data.append({
-                                    "id": f"track_{track_idx}",
-                                    "name": track_name,
-                                    "type": "audio",
-                                    "clips": clips_data,
-                                    "isMuted": False,
-                                    "volume": 1.0
-                                })
-                        
+                        audio_tracks_data = _export_audio_tracks(
+                            self.client, self.cfg.episode_id, timeline, a_tracks, fps, tl_start_sec, self._log, "EXPORT SRT+VIDEO"
+                        )
                         if audio_tracks_data:
                             self._log(f"EXPORT SRT+VIDEO: Sending {len(audio_tracks_data)} audio track(s) to Concepto...")
                             self.client.update_audio_tracks(self.cfg.episode_id, audio_tracks_data)
                             self._log(f"EXPORT SRT+VIDEO: ✓ Successfully exported {len(audio_tracks_data)} audio track(s) to AV Preview")
                         else:
                             self._log("EXPORT SRT+VIDEO: No audio clips were successfully exported")
-                        
-                        # Cleanup temp files
-                        for temp_file in temp_audio_files:
-                            try:
-                                if os.path.exists(temp_file):
-                                    os.remove(temp_file)
-                            except Exception:
-                                pass
-                        # Remove temp directory if empty
-                        try:
-                            export_dir = Path(self.cfg.download_root) / "_temp_audio_export"
-                            if export_dir.exists():
-                                try:
-                                    export_dir.rmdir()
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
                     else:
                         self._log("EXPORT SRT+VIDEO: No audio tracks found in timeline")
                 except Exception as e:
-                    self._log(f"EXPORT SRT+VIDEO: Error exporting audio tracks: {e}")
-                    import traceback
-                    self._log(f"Traceback: {traceback.format_exc()}")
+                    self._log(f"EXPORT SRT+VIDEO: Error exporting audio tracks: {type(e).__name__}: {e}")
 
                 self._log("EXPORT SRT+VIDEO: Complete.")
             except Exception as e:
                 self._log(f"EXPORT SRT+VIDEO ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_export_audio(self):
         """Export audio tracks from Resolve timeline to Concepto AV Preview (Tkinter version)"""
@@ -6312,10 +6272,7 @@ class MainWindowTk:
                 
                 # Get timeline start timecode
                 start_tc = timeline.GetStartTimecode()
-                parts = start_tc.split(":")
-                tl_start_sec = 0.0
-                if len(parts) == 4:
-                    tl_start_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
+                tl_start_sec = _timecode_to_seconds(start_tc, fps) or 0.0
                 
                 self._log(f"EXPORT AUDIO: Timeline starts at {start_tc}")
 
@@ -6326,123 +6283,10 @@ class MainWindowTk:
                 
                 self._log(f"EXPORT AUDIO: Scanning {a_tracks} audio track(s)...")
 
-                audio_tracks_data = []
-                temp_audio_files = []
-                
-                # Determine download root for temp files
-                try:
-                    download_root = self.download_root_edit.get().strip()
-                except:
-                    download_root = self.cfg.download_root
-                if not download_root: download_root = DOWNLOAD_ROOT_DEFAULT
-                
-                export_dir = Path(download_root) / "_temp_audio_export"
-                export_dir.mkdir(parents=True, exist_ok=True)
-
-                total_clips_count = 0
-
-                for track_idx in range(1, a_tracks + 1):
-                    items = timeline.GetItemListInTrack("audio", track_idx) or []
-                    if not items: continue
-                    
-                    track_name = f"Audio {track_idx}"
-                    try:
-                        name_result = timeline.GetTrackName("audio", track_idx)
-                        if name_result: track_name = name_result
-                    except: pass
-                    
-                    self._log(f"EXPORT AUDIO: Processing Track {track_idx}: '{track_name}'...")
-                    clips_data = []
-                    
-                    for item_idx, item in enumerate(items):
-                        try:
-                            item_name = getattr(item, "GetName", lambda: f"Clip {item_idx+1}")()
-                            
-                            # Timing
-                            start_frame = None
-                            for m in ["GetStart", "GetStartFrame"]:
-                                fn = _method(item, m)
-                                if fn:
-                                    try: start_frame = int(fn()); break
-                                    except: pass
-                            
-                            dur_frame = None
-                            for m in ["GetDuration", "GetDurationFrames"]:
-                                fn = _method(item, m)
-                                if fn:
-                                    try: dur_frame = int(fn()); break
-                                    except: pass
-                            
-                            if start_frame is None or dur_frame is None: continue
-                            
-                            rel_start_sec = (start_frame - int(tl_start_sec * fps)) / fps
-                            dur_sec = dur_frame / fps
-                            
-                            # Offset (trim)
-                            offset_frame = 0
-                            for prop_name in ["SourceStart", "In", "StartFrame"]:
-                                try:
-                                    val = item.GetProperty(prop_name)
-                                    if val is not None: offset_frame = int(val); break
-                                except: pass
-                            offset_sec = offset_frame / fps
-                            
-                            # Media Info
-                            mp_item = item.GetMediaPoolItem()
-                            if not mp_item: continue
-                            
-                            file_path = mp_item.GetClipProperty("File Path")
-                            if not file_path or not os.path.exists(file_path): continue
-                            
-                            # Export & Upload
-                            file_ext = os.path.splitext(file_path)[1][1:] or "mp3"
-                            export_filename = f"{_safe_slug(track_name)}_{item_idx+1}.{file_ext}"
-                            export_path = export_dir / export_filename
-                            
-                            import shutil
-                            shutil.copy2(file_path, export_path)
-                            temp_audio_files.append(str(export_path))
-                            
-                            self._log(f"  -> Uploading: {item_name} ({dur_sec:.1f}s)")
-                            audio_url = self.client.upload_audio_clip(self.cfg.episode_id, str(export_path))
-                            
-                            # Get source duration for AV Preview to avoid metadata loading timeout
-                            source_duration_sec = 0.0
-                            try:
-                                # Get full source duration from MediaPoolItem properties
-                                src_dur_val = media_pool_item.GetClipProperty("Duration")
-                                if src_dur_val:
-                                    # Parse duration string "HH:MM:SS:FF" or frame count
-                                    if ":" in str(src_dur_val):
-                                        parts = str(src_dur_val).split(":")
-                                        if len(parts) == 4:
-                                            source_duration_sec = int(parts[0])*3600 + int(parts[1])*60 + int(parts[2]) + (int(parts[3])/fps)
-                                    else:
-                                        source_duration_sec = float(src_dur_val) / fps
-                            except:
-                                pass
-
-                            clips_data.append({
-                                "id": f"clip_{track_idx}_{item_idx}_{int(time.time())}",
-                                "name": item_name,
-                                "url": audio_url,
-                                "startTime": rel_start_sec,
-                                "duration": dur_sec,
-                                "offset": offset_sec,
-                                "volume": 1.0,
-                                "sourceDuration": source_duration_sec or dur_sec # Fallback to clip duration if source fails
-                            })
-                            total_clips_count += 1
-                        except Exception as e:
-                            self._log(f"  ✗ Error on clip {item_idx}: {e}")
-                    
-                    if clips_data:
-                        audio_tracks_data.append({
-                            "id": f"track_{track_idx}_{int(time.time())}",
-                            "name": track_name,
-                            "type": "audio",
-                            "clips": clips_data
-                        })
+                audio_tracks_data = _export_audio_tracks(
+                    self.client, self.cfg.episode_id, timeline, a_tracks, fps, tl_start_sec, self._log, "EXPORT AUDIO"
+                )
+                total_clips_count = sum(len(t["clips"]) for t in audio_tracks_data)
 
                 if audio_tracks_data:
                     self._log(f"EXPORT AUDIO: Fetching current tracks from Concepto...")
@@ -6479,16 +6323,12 @@ class MainWindowTk:
 
             except Exception as e:
                 self._log(f"EXPORT AUDIO ERROR: {e}")
-                import traceback
                 print(traceback.format_exc())
             finally:
-                # Cleanup and Restore Button
-                for f in temp_audio_files:
-                    try: os.remove(f)
-                    except: pass
+                # Restore Button
                 self.export_audio_btn.config(text="Export Audio to AV Preview", state=self.tk.NORMAL)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
 
     def on_import_to_timeline(self):
         """Import Concepto-generated videos into current timeline on NEW tracks (Tkinter version - same as PySide)"""
@@ -6502,11 +6342,13 @@ class MainWindowTk:
                 # Resolve context
                 self._log("IMPORT: Connecting to Resolve...")
                 _resolve, project, media_pool = resolve_get_context()
+                bins = BinCache(media_pool)
                 timeline = project.GetCurrentTimeline()
                 if not timeline:
                     raise RuntimeError("No current timeline open. Please open a timeline first.")
                 
-                self._log(f"IMPORT: Using current timeline: {getattr(timeline,'GetName',lambda:'(unknown)')()}")
+                tl_display_name = _name(timeline, "(unknown)")
+                self._log(f"IMPORT: Using current timeline: {tl_display_name}")
 
                 # Determine show/episode folder (use download_root_edit value if available, otherwise cfg)
                 try:
@@ -6520,12 +6362,15 @@ class MainWindowTk:
                 episode_dir = base_dir / show_name / episode_name
                 episode_dir.mkdir(parents=True, exist_ok=True)
                 self._log(f"IMPORT: Local episode folder: {episode_dir}")
+                dl_index = DownloadIndex(episode_dir)
 
                 # Find selected segment
                 segments = ((self.episode.get("avScript") or {}).get("segments") or [])
                 seg = next((s for s in segments if s.get("id") == self.selected_segment_id), None)
                 if not seg:
                     raise RuntimeError("Selected segment not found.")
+                # Bins are <root>/<seg_label>/<take>; the label depends only on the segment
+                seg_label = _segment_bin_label(seg)
 
                 # Use RAW order for clipId + startTimes to match Concepto AVPreview indexing.
                 shots_raw = seg.get("shots") or []
@@ -6562,56 +6407,57 @@ class MainWindowTk:
                 )
                 audio_local_files: List[str] = []
                 
+                # Download the segment's audio tracks and every take's assets on one pool up front;
+                # the loops below only read the results, so placement order is unchanged
+                sorted_shots = _shots_in_script_order(shots_raw)
+                takes = [(shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "") for idx, (_, shot) in enumerate(sorted_shots)]
+                take_assets = [_collect_take_assets(shot, self.cfg.api_endpoint) for _, shot in sorted_shots]
+                audio_dir = episode_dir / "AVPreview_Audio"
+                download_jobs = [(url, _asset_dest(audio_dir, url, filename)) for url, filename in audio_track_assets]
+                for take, assets in zip(takes, take_assets):
+                    download_jobs.extend((url, _asset_dest(episode_dir / take, url, filename)) for url, filename in assets)
+                self._log(
+                    f"IMPORT: Downloading {len(audio_track_assets)} audio track assets from AV Preview "
+                    f"and {len(download_jobs) - len(audio_track_assets)} take assets..."
+                )
+                fetched = _fetch_assets(download_jobs, dl_index, self.cfg.max_parallel_downloads, log=self._log)
+
                 if audio_track_assets:
-                    audio_dir = episode_dir / "AVPreview_Audio"
                     audio_dir.mkdir(parents=True, exist_ok=True)
-                    self._log(f"IMPORT: Downloading {len(audio_track_assets)} audio track assets from AV Preview...")
                     for url, filename in audio_track_assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = audio_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"IMPORT: Downloaded audio track: {dest.name}")
-                                audio_local_files.append(str(dest))
-                            except Exception as e:
-                                self._log(f"IMPORT: Failed to download audio track {filename}: {e}")
-                                continue
-                        else:
-                            audio_local_files.append(str(dest))
+                        dest = _asset_dest(audio_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"IMPORT: Failed to download audio track {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"IMPORT: Downloaded audio track: {dest.name}")
+                        audio_local_files.append(str(dest))
 
                 # Process takes - sort by order (row) to ensure proper sequencing
-                sorted_shots = sorted(shots_raw, key=lambda s: (float(s.get("order", 0) or 0), float(s.get("shotNumber", 0) or 0)))
                 self._log(f"IMPORT: Processing {len(sorted_shots)} shots in order (sorted by row/order field)")
                 
-                for idx, shot in enumerate(sorted_shots):
-                    take = (shot.get("take") or f"TAKE_{idx+1:03d}").replace("_image", "")
+                for idx, (raw_idx, shot) in enumerate(sorted_shots):
+                    take = takes[idx]
                     take_dir = episode_dir / take
                     take_dir.mkdir(parents=True, exist_ok=True)
 
-                    # Download assets (same as on_download_build)
-                    assets = _collect_take_assets(shot, self.cfg.api_endpoint)
-                    local_files: List[str] = []
+                    # Assets were fetched up front (same as on_download_build)
+                    assets = take_assets[idx]
+                    local_files: List[LocalFile] = []
                     for url, filename in assets:
-                        ext = os.path.splitext(url.split("?")[0])[1]
-                        if not os.path.splitext(filename)[1] and ext:
-                            filename = filename + ext
-                        dest = take_dir / _safe_slug(filename)
-                        if not dest.exists():
-                            try:
-                                _download_file(url, dest)
-                                self._log(f"IMPORT: [{take}] Downloaded: {dest.name}")
-                            except Exception as e:
-                                self._log(f"IMPORT: [{take}] Failed to download {filename}: {e}")
-                                continue
-                        local_files.append(str(dest))
+                        dest = _asset_dest(take_dir, url, filename)
+                        result = fetched[dest]
+                        if isinstance(result, Exception):
+                            self._log(f"IMPORT: [{take}] Failed to download {filename}: {result}")
+                            continue
+                        if result:
+                            self._log(f"IMPORT: [{take}] Downloaded: {dest.name}")
+                        local_files.append(_local_file_info(str(dest)))
 
                     # Create bins + import (using CONCEPTO_IMPORTED prefix to distinguish)
-                    seg_label = f"SC{int(seg.get('segmentNumber',0)):02d}_{_safe_slug(seg.get('title',''))}"[:80]
-                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", seg_label, take)
-                    imported = resolve_import_files(media_pool, take_folder, local_files)
+                    take_folder = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", seg_label, take, cache=bins)
+                    imported = resolve_import_files(media_pool, take_folder, [lf.path for lf in local_files])
                     self._log(f"IMPORT: [{take}] Imported {len(imported)} items into bin.")
 
                     # Place main on timeline (same logic as on_download_build)
@@ -6629,94 +6475,49 @@ class MainWindowTk:
                     self._log(f"IMPORT: [{take}] Main asset: video={has_video}, image={has_image}")
 
                     # Find matching local file for main (same as PySide version)
-                    main_file = None
-                    if has_video:
-                        for f in local_files:
-                            if f.endswith(".mp4") and "MAIN_video" in os.path.basename(f):
-                                main_file = f
-                                self._log(f"IMPORT: [{take}] Found main video file: {os.path.basename(f)}")
-                                break
-                    
-                    if not main_file and has_image:
-                        for f in local_files:
-                            basename = os.path.basename(f).lower()
-                            if "MAIN_image" in basename and any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                main_file = f
-                                self._log(f"IMPORT: [{take}] Found main image file: {os.path.basename(f)}")
-                                break
-                    
-                    # Fallback
-                    if not main_file:
-                        if has_video:
-                            for f in local_files:
-                                if f.endswith(".mp4"):
-                                    main_file = f
-                                    self._log(f"IMPORT: [{take}] Using fallback video file: {os.path.basename(f)}")
-                                    break
-                        elif has_image:
-                            for f in local_files:
-                                basename = os.path.basename(f).lower()
-                                if any(basename.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"]):
-                                    main_file = f
-                                    self._log(f"IMPORT: [{take}] Using fallback image file: {os.path.basename(f)}")
-                                    break
-                    
-                    if not main_file and local_files:
-                        main_file = local_files[0]
-                        self._log(f"IMPORT: [{take}] Using first available file as main: {os.path.basename(main_file)}")
+                    main_lf, how = _pick_main_file(local_files, has_video, has_image)
+                    main_file = main_lf.path if main_lf else None
+                    if main_lf:
+                        self._log(f"IMPORT: [{take}] {how}: {main_lf.basename}")
                     
                     if not main_file:
                         self._log(f"IMPORT: [{take}] WARNING: Could not find main file in downloaded assets!")
                         continue
 
                     # Find media pool item that matches the imported main file
-                    main_item = imported[0] if imported else None
-                    get_clips = _method(take_folder, "GetClipList")
-                    if get_clips and main_file:
-                        want = os.path.basename(main_file)
-                        for it in take_folder.GetClipList() or []:
-                            nm = getattr(it, "GetName", lambda: "")()
-                            if nm == want or want in nm:
-                                main_item = it
-                                break
+                    main_item = _match_imported_item(imported, take_folder, main_file)
 
                     if not main_item:
                         self._log(f"IMPORT: [{take}] Could not find MediaPoolItem for main, skipping timeline.")
                         continue
 
-                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{idx}"
+                    clip_id = f"{seg.get('id')}-{shot.get('id')}-{raw_idx}"
                     start_sec = float(start_times.get(clip_id, 0.0))
                     dur_sec = float(shot.get("duration") or 0)
                     if dur_sec <= 0:
                         dur_sec = 3.0
                     off_sec = float(shot.get("videoOffset") or 0) or 0.0
 
-                    item_name = getattr(main_item, "GetName", lambda: "(unknown)")()
+                    item_name = _name(main_item, "(unknown)")
                     self._log(f"IMPORT: [{take}] Placing '{item_name}' on NEW track V{new_v_track}: start={start_sec}s dur={dur_sec}s offset={off_sec}s")
                     
-                    # Ensure timeline is current
-                    try:
-                        project.SetCurrentTimeline(timeline)
-                    except Exception:
-                        pass
-                    
                     # Place on NEW video track (not overwriting existing)
-                    is_image = main_file and any(main_file.lower().endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".webp", ".gif"])
+                    is_image = bool(main_lf and main_lf.is_image)  # extension already classified in _local_file_info
                     track_type = "video"
                     try:
-                        resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=new_v_track, track_type=track_type)
+                        resolve_place_on_timeline(project, media_pool, timeline, main_item, record_seconds=start_sec, duration_seconds=dur_sec, offset_seconds=off_sec, log_callback=self._log, track_index=new_v_track, track_type=track_type, ensure_current=False)
                         self._log(f"IMPORT: [{take}] ✓ Successfully placed on NEW track V{new_v_track}")
                     except Exception as e:
                         self._log(f"IMPORT: [{take}] ✗ Failed to place on timeline: {type(e).__name__}: {e}")
-                        import traceback
-                        self._log(f"IMPORT: [{take}] Traceback: {traceback.format_exc()}")
 
                 # Handle AVPreview audio tracks (same as on_download_build)
                 if audio_local_files:
                     self._log(f"IMPORT: Creating audio bin 'AVPreview_Audio' and importing {len(audio_local_files)} audio file(s)...")
-                    audio_bin = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", "AVPreview_Audio")
+                    audio_bin = resolve_ensure_bins(media_pool, "CONCEPTO_IMPORTED", seg_label, "AVPreview_Audio", cache=bins)
                     audio_imported = resolve_import_files(media_pool, audio_bin, audio_local_files)
                     self._log(f"IMPORT: ✓ Imported {len(audio_imported)} audio file(s) into 'AVPreview_Audio' bin")
+                    # Each imported item's name is read once, not once per AVPreview clip matched against it
+                    audio_names = [(_name(it), it) for it in audio_imported]
                     
                     # Place audio on NEW audio tracks
                     avp = self.episode.get("avPreviewData") or {}
@@ -6724,6 +6525,7 @@ class MainWindowTk:
                     if audio_tracks:
                         self._log(f"IMPORT: Placing {len(audio_local_files)} AVPreview audio clip(s) onto NEW tracks A{new_a_track_start}+...")
                         target_audio_track = new_a_track_start
+                        audio_placements: List[Dict[str, Any]] = []
                         for track_idx, track_data in enumerate(audio_tracks):
                             clips = track_data.get("clips") or []
                             for clip_idx, clip_data in enumerate(clips):
@@ -6744,8 +6546,7 @@ class MainWindowTk:
                                 
                                 # Find MediaPoolItem
                                 audio_item = None
-                                for it in audio_imported:
-                                    nm = getattr(it, "GetName", lambda: "")()
+                                for nm, it in audio_names:
                                     if want_name in nm or nm in want_name:
                                         audio_item = it
                                         break
@@ -6760,30 +6561,29 @@ class MainWindowTk:
                                 if du <= 0:
                                     continue
                                 
-                                try:
-                                    self._log(f"IMPORT: AUDIO: Place '{want_name}' A{target_audio_track} (AVPreview track {track_idx+1}) start={st}s dur={du}s")
-                                    resolve_place_on_timeline(
-                                        project, media_pool, timeline, audio_item,
-                                        record_seconds=st,
-                                        duration_seconds=du,
-                                        offset_seconds=0.0,
-                                        log_callback=self._log,
-                                        track_index=target_audio_track,
-                                        track_type="audio",
-                                    )
-                                except Exception as e:
-                                    self._log(f"IMPORT: AUDIO: Failed placing '{want_name}': {type(e).__name__}: {e}")
+                                self._log(f"IMPORT: AUDIO: Place '{want_name}' A{target_audio_track} (AVPreview track {track_idx+1}) start={st}s dur={du}s")
+                                audio_placements.append({
+                                    "item": audio_item,
+                                    "record_seconds": st,
+                                    "duration_seconds": du,
+                                    "offset_seconds": 0.0,
+                                    "track_index": target_audio_track,
+                                    "track_type": "audio",
+                                })
                             
                             target_audio_track += 1  # Next AVPreview track goes on next audio track
+
+                        # One AppendToTimeline round-trip for all AVPreview audio clips
+                        placed_n = resolve_place_batch(project, media_pool, timeline, audio_placements, log_callback=self._log)
+                        self._log(f"IMPORT: AUDIO: Placed {placed_n}/{len(audio_placements)} AVPreview audio clip(s)")
                 
                 self._log("✓ IMPORT: Completed importing to new tracks (existing tracks preserved)")
 
             except Exception as e:
                 self._log(f"IMPORT ERROR: {e}")
-                import traceback
                 self._log(f"Traceback: {traceback.format_exc()}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._run_in_background(worker)
         
     def on_diagnose(self):
         try:
@@ -6793,7 +6593,8 @@ class MainWindowTk:
             if not timeline:
                 self._log("Diagnose: No current timeline.")
                 return
-            self._log(f"Diagnose: Timeline = {getattr(timeline,'GetName',lambda:'(unknown)')()}")
+            tl_display_name = _name(timeline, "(unknown)")
+            self._log(f"Diagnose: Timeline = {tl_display_name}")
             
             def list_methods(obj: Any, label: str, keywords: List[str]):
                 methods = []
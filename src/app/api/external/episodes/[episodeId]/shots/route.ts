@@ -0,0 +1,113 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { db } from '@/lib/firebase';
+import { doc, getDoc, updateDoc, Timestamp } from 'firebase/firestore';
+import { requireApiKey } from '@/lib/api-auth';
+import { AVShot, AVSegment } from '@/types';
+
+// Fields accepted per shot (same as PUT /api/external/shots/:shotId)
+const UPDATABLE_FIELDS = ['audio', 'visual', 'wordCount', 'runtime', 'duration', 'videoOffset'] as const;
+
+/**
+ * POST /api/external/episodes/:episodeId/shots
+ *
+ * Update several shots of one episode in a single write
+ *
+ * Headers:
+ * - X-API-Key: Your API key
+ * - Content-Type: application/json
+ *
+ * Body:
+ * {
+ *   "updates": {
+ *     "<shotId>": { "audio"?, "visual"?, "wordCount"?, "runtime"?, "duration"?, "videoOffset"? }
+ *   }
+ * }
+ *
+ * Returns:
+ * - updated: number of shots changed
+ * - missing: shot IDs not found in this episode
+ */
+export async function POST(
+  request: NextRequest,
+  { params }: { params: Promise<{ episodeId: string }> }
+) {
+  try {
+    await requireApiKey(request);
+
+    const { episodeId } = await params;
+    const body = await request.json();
+    const updates = (body?.updates || {}) as Record<string, Record<string, unknown>>;
+
+    if (!episodeId) {
+      return NextResponse.json(
+        { error: 'Episode ID is required', code: 'VALIDATION_ERROR' },
+        { status: 400 }
+      );
+    }
+    if (typeof updates !== 'object' || Array.isArray(updates)) {
+      return NextResponse.json(
+        { error: 'updates must be an object keyed by shot ID', code: 'VALIDATION_ERROR' },
+        { status: 400 }
+      );
+    }
+
+    const episodeRef = doc(db, 'episodes', episodeId);
+    const episodeSnap = await getDoc(episodeRef);
+    const episodeData = episodeSnap.data();
+    if (!episodeSnap.exists() || !episodeData) {
+      return NextResponse.json(
+        { error: 'Episode not found', code: 'NOT_FOUND' },
+        { status: 404 }
+      );
+    }
+
+    const remaining = new Set(Object.keys(updates));
+    const segments = ((episodeData.avScript?.segments || []) as unknown) as AVSegment[];
+    const mappedSegments = segments.map((seg: AVSegment) => {
+      let segmentChanged = false;
+      const shots = (seg.shots || []).map((shot: AVShot) => {
+        const shotUpdates = updates[shot.id];
+        if (!shotUpdates) return shot;
+        remaining.delete(shot.id);
+        segmentChanged = true;
+        const next: Record<string, unknown> = { ...shot, updatedAt: new Date() };
+        for (const field of UPDATABLE_FIELDS) {
+          if (shotUpdates[field] !== undefined) next[field] = shotUpdates[field];
+        }
+        return next as unknown as AVShot;
+      });
+      return segmentChanged ? { ...seg, shots, updatedAt: Timestamp.now() } : seg;
+    });
+
+    const updated = Object.keys(updates).length - remaining.size;
+    if (updated > 0) {
+      await updateDoc(episodeRef, {
+        'avScript.segments': mappedSegments,
+        updatedAt: Timestamp.now(),
+      });
+    }
+
+    return NextResponse.json({
+      success: true,
+      data: {
+        updated,
+        missing: Array.from(remaining),
+      },
+    });
+  } catch (error: unknown) {
+    console.error('Error bulk-updating shots:', error);
+
+    const errorMessage = error instanceof Error ? error.message : 'Unknown error';
+    if (errorMessage === 'API key required' || errorMessage === 'Invalid API key') {
+      return NextResponse.json(
+        { error: errorMessage, code: 'UNAUTHORIZED' },
+        { status: 401 }
+      );
+    }
+
+    return NextResponse.json(
+      { error: 'Internal server error', code: 'INTERNAL_ERROR', details: errorMessage },
+      { status: 500 }
+    );
+  }
+}